@@ -16,7 +16,50 @@ class Config:
 
     # 数据获取配置
     FETCH_TIMEOUT: int = int(os.getenv("FETCH_TIMEOUT", "10"))
+    # 单个请求等待刷新的总时限（秒，0 表示不限时），用完后返回已获取的数据
+    REQUEST_DEADLINE: float = float(os.getenv("REQUEST_DEADLINE", "25"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    # 重试退避：基准时间和单次退避上限（秒），实际等待时间在 [0, 上限] 内随机
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "8"))
+    # 单次刷新的重试预算：总重试次数和累计退避时间（秒）
+    RETRY_BUDGET: int = int(os.getenv("RETRY_BUDGET", "10"))
+    RETRY_BUDGET_SECONDS: float = float(os.getenv("RETRY_BUDGET_SECONDS", "15"))
+    # 并发补充公司概况的线程数
+    ENRICH_WORKERS: int = int(os.getenv("ENRICH_WORKERS", "16"))
+
+    # 数据处理线程池大小（获取、补充和格式化均在该线程池中执行）
+    PIPELINE_WORKERS: int = int(os.getenv("PIPELINE_WORKERS", "4"))
+
+    # 缓存配置
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))
+
+    # 后台刷新配置（秒，0 表示禁用后台刷新）
+    REFRESH_INTERVAL: int = int(os.getenv("REFRESH_INTERVAL", "1800"))
+
+    # 快照过期配置（秒）：超过 SNAPSHOT_TTL 视为过期，超过 MAX_STALENESS 不再返回
+    SNAPSHOT_TTL: int = int(os.getenv("SNAPSHOT_TTL", "3600"))
+    MAX_STALENESS: int = int(os.getenv("MAX_STALENESS", "86400"))
+    # 快照过期但未超过 MAX_STALENESS 时，是否立即返回旧数据并在后台刷新
+    SERVE_STALE: bool = os.getenv("SERVE_STALE", "true").lower() in ("1", "true", "yes")
+    # 快速模式：需要等待刷新时只获取新股列表并立即返回，详细信息在后台补充（请求参数 fast 可覆盖）
+    FAST_MODE: bool = os.getenv("FAST_MODE", "false").lower() in ("1", "true", "yes")
+    # 后台补充完成后 POST 默认查询结果的地址，为空时不通知
+    ENRICH_CALLBACK_URL: str = os.getenv("ENRICH_CALLBACK_URL", "")
+    # /api/stocks 允许客户端缓存的时间（秒，Cache-Control max-age），0 表示每次都需验证
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+    # 公司概况持久化缓存配置
+    PROFILE_CACHE_PATH: str = os.getenv("PROFILE_CACHE_PATH", "data/profile_cache.db")
+    PROFILE_CACHE_TTL: int = int(os.getenv("PROFILE_CACHE_TTL", str(30 * 86400)))
+    PROFILE_CACHE_MAX_ENTRIES: int = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "5000"))
+
+    # 快照存储配置：每次成功刷新的快照保存到 SQLite，重启后从最近一份快照恢复
+    SNAPSHOT_STORE_PATH: str = os.getenv("SNAPSHOT_STORE_PATH", "data/snapshots.db")
+    # 最多保留的快照数（按每 30 分钟刷新一次约为一周）
+    SNAPSHOT_STORE_MAX_SNAPSHOTS: int = int(os.getenv("SNAPSHOT_STORE_MAX_SNAPSHOTS", "336"))
+    # 快照保留申购结束日期在最近多少天内的新股，即 as_of 最早可查询到的日期
+    SNAPSHOT_HISTORY_DAYS: int = int(os.getenv("SNAPSHOT_HISTORY_DAYS", "90"))
 
     # 服务配置
     APP_NAME: str = "A股新股信息服务"
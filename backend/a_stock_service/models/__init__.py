@@ -1,5 +1,7 @@
 """数据模型模块"""
 
 from .stock import NewStockInfo
+from .snapshot import StockSnapshot
+from .columnar import ColumnarStocks
 
-__all__ = ["NewStockInfo"]
+__all__ = ["NewStockInfo", "StockSnapshot", "ColumnarStocks"]
@@ -5,15 +5,16 @@
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewStockInfo:
     """新股信息模型
 
     包含新股发行的所有关键信息
+    记录为只读对象（frozen，使用 __slots__ 节省内存），修改字段需通过 dataclasses.replace 生成新记录
 
     Attributes:
         stock_code: 股票代码（如 "301001"）
@@ -30,6 +31,8 @@ class NewStockInfo:
         company_intro: 公司简介
         industry: 所属行业
         underwriter: 主承销商
+        start_date: 申购开始日期（由日期范围解析，用于筛选）
+        end_date: 申购结束日期（由日期范围解析，用于筛选）
     """
     stock_code: str
     stock_name: str
@@ -45,6 +48,8 @@ class NewStockInfo:
     company_intro: str = ""
     industry: str = ""
     underwriter: str = ""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
 
     def get_market_code(self) -> str:
         """获取市场代码
@@ -3,5 +3,27 @@
 from .fetcher import DataFetcher
 from .processor import DataProcessor
 from .formatter import MarkdownFormatter
+from .cache import ResponseCache
+from .scheduler import RefreshScheduler
+from .single_flight import SingleFlight
+from .disk_cache import DiskCache
+from .window_index import SubscriptionWindowIndex
+from .deadline import Deadline, DeadlineExceeded
+from .retry import RetryBudget, RetryPolicy
+from .snapshot_store import SnapshotStore
 
-__all__ = ["DataFetcher", "DataProcessor", "MarkdownFormatter"]
+__all__ = [
+    "DataFetcher",
+    "DataProcessor",
+    "MarkdownFormatter",
+    "ResponseCache",
+    "RefreshScheduler",
+    "SingleFlight",
+    "DiskCache",
+    "SubscriptionWindowIndex",
+    "Deadline",
+    "DeadlineExceeded",
+    "RetryBudget",
+    "RetryPolicy",
+    "SnapshotStore",
+]
@@ -0,0 +1,72 @@
+"""
+请求时限服务
+
+一次刷新的总时限，贯穿获取、补充和格式化各个步骤
+"""
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """请求时限已到，不再发起新的上游调用"""
+
+
+class Deadline:
+    """请求时限
+
+    各步骤在发起上游调用前检查剩余时间，并用剩余时间收紧单次调用的超时；
+    时限用完后不再发起新的调用，已获取的数据照常返回
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """初始化时限
+
+        Args:
+            seconds: 从现在起的总时长（秒），为 None 或不大于 0 时不限时
+        """
+        self.seconds = seconds if seconds and seconds > 0 else None
+        self.started = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        """获取剩余时间
+
+        Returns:
+            Optional[float]: 剩余秒数（不小于 0），不限时返回 None
+        """
+        if self.seconds is None:
+            return None
+        return max(self.seconds - (time.monotonic() - self.started), 0.0)
+
+    def expired(self) -> bool:
+        """判断时限是否已到"""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: Optional[float]) -> Optional[float]:
+        """计算单次调用的超时时间
+
+        Args:
+            default: 单次调用原本的超时时间，为 None 时不限
+
+        Returns:
+            Optional[float]: default 和剩余时间中较小的一个，两者都不限时返回 None
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if default is None:
+            return remaining
+        return min(default, remaining)
+
+    def check(self, action: str = "") -> None:
+        """时限已到时抛出异常
+
+        Args:
+            action: 日志和异常中的操作说明
+
+        Raises:
+            DeadlineExceeded: 当时限已到时
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"请求时限（{self.seconds} 秒）已到，跳过{action}")
@@ -0,0 +1,162 @@
+"""
+持久化缓存服务
+
+基于 SQLite 的本地键值缓存，服务重启后数据仍然保留
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Optional
+
+
+class DiskCache:
+    """基于 SQLite 的持久化键值缓存
+
+    每个条目独立过期（TTL），条目数超过上限时按最近访问时间（LRU）淘汰
+    """
+
+    def __init__(self, path: str, ttl: int = 30 * 86400, max_entries: int = 5000):
+        """初始化持久化缓存
+
+        Args:
+            path: SQLite 数据库文件路径
+            ttl: 条目有效期（秒）
+            max_entries: 最大条目数，超出时淘汰最久未访问的条目
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache_entries (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """读取缓存条目
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[dict]: 未过期的缓存值，未命中或已过期返回 None
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            print(f"WARNING: 缓存条目 {key} 损坏，已忽略: {e}", file=sys.stderr)
+            return None
+
+    def set(self, key: str, value: dict, ttl: Optional[int] = None) -> None:
+        """写入缓存条目
+
+        Args:
+            key: 缓存键
+            value: 可 JSON 序列化的缓存值
+            ttl: 条目有效期（秒），为 None 时使用默认有效期
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        payload = json.dumps(value, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO cache_entries (key, value, expires_at, last_access)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    expires_at = excluded.expires_at,
+                    last_access = excluded.last_access
+                """,
+                (key, payload, expires_at, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def invalidate(self, key: str) -> bool:
+        """删除单个缓存条目
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            bool: 条目是否存在并被删除
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def _evict(self) -> None:
+        """清理过期条目，并按 LRU 淘汰超出上限的条目（需持有锁）"""
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+
+        count = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM cache_entries WHERE key IN (
+                    SELECT key FROM cache_entries ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+
+    def stats(self) -> dict:
+        """获取缓存统计信息
+
+        Returns:
+            dict: 包含条目数、命中和未命中次数
+        """
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            return {
+                "path": self.path,
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+                "entries": count,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -7,27 +7,70 @@
 import sys
 import akshare as ak
 import pandas as pd
-from datetime import datetime
-from typing import List
+import requests
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError, wait
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 from models import NewStockInfo
+from .deadline import Deadline, DeadlineExceeded
+from .disk_cache import DiskCache
+from .retry import RetryBudget, RetryPolicy
 
 
 class DataFetcher:
     """数据获取服务类"""
 
-    def __init__(self, timeout: int = 10, max_retries: int = 3):
+    # 日期字段支持的格式（与 _parse_date 保持一致）
+    DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d")
+
+    # 网上申购起止日期的列位置（使用列索引直接访问，避免中文列名问题）
+    ONLINE_START_COLUMN = 9
+    ONLINE_END_COLUMN = 10
+
+    def __init__(self, timeout: int = 10, max_retries: int = 3, profile_cache: Optional[DiskCache] = None,
+                 enrich_executor: Optional[Executor] = None, call_executor: Optional[Executor] = None,
+                 retry_policy: Optional[RetryPolicy] = None, retry_budget: Optional[RetryBudget] = None,
+                 deadline: Optional[Deadline] = None):
         """初始化数据获取服务
 
         Args:
             timeout: 请求超时时间（秒）
-            max_retries: 最大重试次数
+            max_retries: 最大重试次数，仅在未传入 retry_policy 时使用
+            profile_cache: 公司概况持久化缓存，为 None 时每次都请求巨潮资讯
+            enrich_executor: 补充公司概况的线程池，为 None 时逐个请求
+            call_executor: 执行 akshare 调用的线程池，用于按 timeout 限制单次调用的等待时间，为 None 时直接调用
+            retry_policy: 进程内共享的重试策略
+            retry_budget: 本次刷新的重试预算，为 None 时只受单个调用的重试次数限制
+            deadline: 本次刷新的时限，为 None 时不限时
         """
         self.timeout = timeout
         self.max_retries = max_retries
-
-    def fetch_new_stocks(self) -> List[NewStockInfo]:
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.retry_budget = retry_budget
+        self.deadline = deadline or Deadline()
+        # 最近一次补充时因时限用完而未补充详细信息的股票代码
+        self.unenriched: List[str] = []
+        self.profile_cache = profile_cache
+        self.enrich_executor = enrich_executor
+        self.call_executor = call_executor
+
+    def fetch_new_stocks(
+        self,
+        today: Optional[date] = None,
+        future_days: Optional[int] = None,
+        history_days: int = 0
+    ) -> List[NewStockInfo]:
         """获取新股发行信息
 
+        指定 future_days 时先在 DataFrame 上按申购窗口筛选（谓词下推），
+        只有申购日期范围与 [today - history_days, today + future_days] 有交集的行才会转换为对象
+
+        Args:
+            today: 筛选基准日期，默认为今天
+            future_days: 未来天数，为 None 时返回全部数据
+            history_days: 向前保留的天数，为 0 时只保留当前可申购或未来开始申购的新股
+
         Returns:
             List[NewStockInfo]: 新股信息列表
 
@@ -38,7 +81,13 @@ class DataFetcher:
 
         try:
             # 调用 akshare API 获取新股数据
-            df = ak.stock_new_ipo_cninfo()
+            df = self.retry_policy.call(
+                lambda: self._call_with_timeout(ak.stock_new_ipo_cninfo, "获取新股列表"),
+                budget=self.retry_budget,
+                retryable=self._is_retryable,
+                description="获取新股列表",
+                deadline=self.deadline
+            )
 
             if df is None or df.empty:
                 print("WARNING: 未获取到新股数据", file=sys.stderr)
@@ -47,8 +96,15 @@ class DataFetcher:
             print(f"INFO: 成功获取到 {len(df)} 条新股原始数据", file=sys.stderr)
             print(f"DEBUG: 数据列: {df.columns.tolist()}", file=sys.stderr)
 
+            # 申购日期范围的起止日期只计算一次，筛选和解析共用
+            bounds = self._window_bounds(df) if df.shape[1] > self.ONLINE_END_COLUMN else None
+
+            if future_days is not None:
+                df = self._filter_window(df, today or datetime.now().date(), future_days, history_days, bounds=bounds)
+                print(f"INFO: 申购窗口内的新股 {len(df)} 条", file=sys.stderr)
+
             # 转换为 NewStockInfo 对象列表
-            new_stocks = self._parse_dataframe(df)
+            new_stocks = self._parse_dataframe(df, bounds=bounds)
 
             print(f"INFO: 成功解析 {len(new_stocks)} 条新股信息", file=sys.stderr)
             return new_stocks
@@ -57,106 +113,499 @@ class DataFetcher:
             print(f"ERROR: 获取新股数据时出错: {e}", file=sys.stderr)
             raise
 
-    def _parse_dataframe(self, df: pd.DataFrame) -> List[NewStockInfo]:
+    def _call_with_timeout(self, func, action: str):
+        """限时调用不支持超时参数的 akshare 接口
+
+        配置了调用线程池时在线程池中调用，最多等待 timeout 秒且不超过请求的剩余时间；
+        超时后调用仍在后台完成，结果被丢弃
+
+        Args:
+            func: 无参调用
+            action: 日志和异常中的操作说明
+
+        Returns:
+            func 的返回值
+
+        Raises:
+            DeadlineExceeded: 当时限已到或在剩余时间内未完成时
+            TimeoutError: 当单次调用在 timeout 秒内未完成时
+        """
+        self.deadline.check(action)
+
+        if self.call_executor is None:
+            return func()
+
+        future = self.call_executor.submit(func)
+        try:
+            return future.result(timeout=self.deadline.timeout(self.timeout))
+        except FutureTimeoutError:
+            # 调用本身抛出的超时异常原样抛出
+            if future.done():
+                raise
+            future.cancel()
+            if self.deadline.expired():
+                raise DeadlineExceeded(f"请求时限（{self.deadline.seconds} 秒）内未完成{action}")
+            raise TimeoutError(f"{action}超时（{self.timeout} 秒）")
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """判断调用失败是否值得重试：网络错误和单次调用超时重试；
+        返回内容无法解析（多为拦截页面）或数据错误时重试无益，不重试"""
+        if isinstance(error, requests.exceptions.JSONDecodeError):
+            return False
+        return isinstance(error, (requests.exceptions.RequestException, TimeoutError))
+
+    def _parse_dataframe(self, df: pd.DataFrame, bounds: Optional[tuple] = None) -> List[NewStockInfo]:
         """解析 DataFrame 为 NewStockInfo 对象列表
 
+        先按列批量解析日期、数值和市场，再一次性生成对象，避免逐行 iterrows
+
         Args:
             df: akshare 返回的 DataFrame
+            bounds: 已计算的申购起止日期列（见 _ingest_frame），为 None 时重新计算
 
         Returns:
             List[NewStockInfo]: 新股信息列表
         """
-        new_stocks = []
-
-        for _, row in df.iterrows():
-            try:
-                # 获取原始申购日期和网上申购日期
-                issue_date_raw = row.get("申购日期")
-                # 使用列索引直接访问，避免中文列名问题
-                online_start = row.iloc[9]  # 网上申购日期
-                online_end = row.iloc[10]   # 网上申购日期结束
-
-                # 组合日期范围字符串
-                issue_date_range = None
-                if pd.notna(online_start) and pd.notna(online_end):
-                    # 如果有开始和结束日期，组合成范围
-                    start_str = str(online_start)[:10]
-                    end_str = str(online_end)[:10]
-                    issue_date_range = f"{start_str}至{end_str}"
-                elif pd.notna(online_end):
-                    # 如果只有结束日期，使用结束日期作为范围
-                    end_str = str(online_end)[:10]
-                    issue_date_range = f"{end_str}至{end_str}"
-                elif pd.notna(issue_date_raw):
-                    # 如果只有单个日期，使用该日期作为范围
-                    date_str = str(issue_date_raw)[:10] if len(str(issue_date_raw)) >= 10 else str(issue_date_raw)
-                    issue_date_range = f"{date_str}至{date_str}"
-
-                # 根据实际返回字段进行解析
-                # 字段映射基于 ak.stock_new_ipo_cninfo() 的返回结果
-                stock_info = NewStockInfo(
-                    stock_code=str(row.get("证劵代码", "")),
-                    stock_name=str(row.get("证券简称", "")),
-                    issue_date=self._parse_date(issue_date_raw),
-                    issue_date_range=issue_date_range,  # 新增：保存组合后的日期范围
-                    subscription_code=str(row.get("证劵代码", "")),  # 申购代码通常与股票代码相同
-                    issue_price=self._parse_float(row.get("发行价")),
-                    issue_quantity=self._parse_float(row.get("总发行数量")),
-                    subscription_limit=self._parse_float(row.get("网上申购上限")),
-                    lottery_rate=self._format_lottery_rate(row.get("上网发行中签率")),
-                    listing_date=self._parse_date(row.get("上市日期")),
-                    market=self._determine_market(str(row.get("证劵代码", ""))),
-                    company_intro="",  # 该API不提供公司简介
-                    industry="",       # 该API不提供行业信息
-                    underwriter=""     # 该API不提供主承销商信息
-                )
-                new_stocks.append(stock_info)
+        return self._materialize(self._ingest_frame(df, bounds=bounds))
+
+    def _ingest_frame(self, df: pd.DataFrame, bounds: Optional[tuple] = None) -> pd.DataFrame:
+        """按列解析 akshare 返回的原始数据
+
+        字段映射基于 ak.stock_new_ipo_cninfo() 的返回结果，
+        解析规则与 _parse_date、_parse_float、_format_lottery_rate、_determine_market 一致
+
+        Args:
+            df: akshare 返回的 DataFrame
+            bounds: _window_bounds 的结果，可以由筛选前的完整数据计算，按索引取与 df 对应的行；
+                为 None 时重新计算
+
+        Returns:
+            pd.DataFrame: 与 NewStockInfo 字段同名的规范化数据
+        """
+        if df.shape[1] <= self.ONLINE_END_COLUMN:
+            print(f"WARNING: 数据列数不足（{df.shape[1]}列），无法解析网上申购日期", file=sys.stderr)
+            return pd.DataFrame()
+
+        codes = self._column(df, "证劵代码", default="").astype(str)
+        issue_date_raw = self._column(df, "申购日期")
+        if bounds is None:
+            start_date, end_date = self._window_bounds(df)
+        else:
+            start_date, end_date = (column.loc[df.index] for column in bounds)
+
+        return pd.DataFrame({
+            "stock_code": codes,
+            "stock_name": self._column(df, "证券简称", default="").astype(str),
+            "issue_date": self._parse_date_column(issue_date_raw),
+            "issue_date_range": self._build_date_range_column(
+                df.iloc[:, self.ONLINE_START_COLUMN],
+                df.iloc[:, self.ONLINE_END_COLUMN],
+                issue_date_raw
+            ),
+            "issue_price": self._parse_float_column(self._column(df, "发行价")),
+            "issue_quantity": self._parse_float_column(self._column(df, "总发行数量")),
+            "subscription_limit": self._parse_float_column(self._column(df, "网上申购上限")),
+            "lottery_rate": self._format_lottery_rate_column(self._column(df, "上网发行中签率")),
+            "listing_date": self._parse_date_column(self._column(df, "上市日期")),
+            "market": self._determine_market_column(codes),
+            "start_date": start_date,
+            "end_date": end_date,
+        }, index=df.index)
+
+    def _filter_window(self, df: pd.DataFrame, today: date, future_days: int, history_days: int = 0,
+                       bounds: Optional[tuple] = None) -> pd.DataFrame:
+        """在原始数据上按申购窗口筛选行
+
+        保留申购日期范围与 [today - history_days, today + future_days] 有交集的行。
+        history_days 为 0 时即今天在申购日期范围内，或申购开始日期在未来 future_days 天内的行，
+        条件与 DataProcessor 的两个筛选方法一致。起止日期直接按列计算，
+        不生成日期范围字符串，其余字段的解析留给筛选后剩下的少量行
+
+        Args:
+            df: akshare 返回的 DataFrame
+            today: 筛选基准日期
+            future_days: 未来天数
+            history_days: 向前保留的天数
+            bounds: 已计算的 _window_bounds 结果，为 None 时重新计算
+
+        Returns:
+            pd.DataFrame: 筛选后的原始数据
+        """
+        if df.shape[1] <= self.ONLINE_END_COLUMN:
+            return df
+
+        start, end = bounds if bounds is not None else self._window_bounds(df)
+
+        first_ts = pd.Timestamp(today - timedelta(days=history_days))
+        future_ts = pd.Timestamp(today + timedelta(days=future_days))
+
+        # 没有结束日期的行在任何基准日期都不会被查询到（NaT 的比较结果为 False）
+        return df[(start <= future_ts) & (first_ts <= end)]
+
+    def _window_bounds(self, df: pd.DataFrame) -> tuple:
+        """按列计算申购日期范围的起止日期
+
+        与 _build_date_range_column 的组合规则一致，结果等同于解析日期范围字符串
+
+        Args:
+            df: akshare 返回的 DataFrame
+
+        Returns:
+            tuple: (开始日期列, 结束日期列)，datetime64 类型，无日期时为 NaT
+        """
+        online_start = df.iloc[:, self.ONLINE_START_COLUMN]
+        online_end = df.iloc[:, self.ONLINE_END_COLUMN]
+        issue_date_raw = self._column(df, "申购日期")
+
+        has_start = online_start.notna()
+        has_end = online_end.notna()
+        end = self._leading_date_column(online_end).where(has_end, self._leading_date_column(issue_date_raw))
+        start = self._leading_date_column(online_start).where(has_start & has_end, end)
+
+        return start, end
+
+    def _leading_date_column(self, column: pd.Series) -> pd.Series:
+        """按列解析 str(value)[:10] 表示的日期
+
+        与日期范围字符串的解析结果一致；akshare 返回的 date 对象列直接转换，
+        无需逐个转成字符串
+
+        Args:
+            column: 原始日期列
+
+        Returns:
+            pd.Series: datetime64 列，缺失或无法解析的值为 NaT
+        """
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return column.dt.normalize()
+
+        values = column.dropna()
+        if values.map(type).eq(date).all():
+            return pd.to_datetime(column, errors="coerce")
+
+        strings = column.astype(object).astype(str).str[:10].str.strip().where(column.notna())
+        return pd.to_datetime(strings, format="%Y-%m-%d", errors="coerce")
+
+    def _materialize(self, frame: pd.DataFrame) -> List[NewStockInfo]:
+        """将规范化数据转换为 NewStockInfo 对象列表
+
+        Args:
+            frame: _ingest_frame 返回的规范化数据
+
+        Returns:
+            List[NewStockInfo]: 新股信息列表
+        """
+        if frame.empty:
+            return []
+
+        codes = frame["stock_code"].tolist()
+        issue_dates = self._to_datetime_list(frame["issue_date"])
+        listing_dates = self._to_datetime_list(frame["listing_date"])
+
+        return [
+            NewStockInfo(
+                stock_code=code,
+                stock_name=name,
+                issue_date=issue_date,
+                issue_date_range=date_range,
+                subscription_code=code,  # 申购代码通常与股票代码相同
+                issue_price=price,
+                issue_quantity=quantity,
+                subscription_limit=limit,
+                lottery_rate=rate,
+                listing_date=listing_date,
+                market=market,
+                company_intro="",  # 该API不提供公司简介
+                industry="",       # 该API不提供行业信息
+                underwriter="",    # 该API不提供主承销商信息
+                start_date=start_date,
+                end_date=end_date
+            )
+            for (code, name, issue_date, date_range, price, quantity, limit, rate, listing_date, market,
+                 start_date, end_date) in zip(
+                codes,
+                frame["stock_name"].tolist(),
+                issue_dates,
+                self._to_optional_list(frame["issue_date_range"]),
+                self._to_optional_list(frame["issue_price"]),
+                self._to_optional_list(frame["issue_quantity"]),
+                self._to_optional_list(frame["subscription_limit"]),
+                self._to_optional_list(frame["lottery_rate"]),
+                listing_dates,
+                frame["market"].tolist(),
+                self._to_date_list(frame["start_date"]),
+                self._to_date_list(frame["end_date"])
+            )
+        ]
+
+    def _column(self, df: pd.DataFrame, name: str, default=None) -> pd.Series:
+        """按列名取列，列不存在时返回填充默认值的列
+
+        Args:
+            df: 原始数据
+            name: 列名
+            default: 列不存在时的填充值
+
+        Returns:
+            pd.Series: 列数据
+        """
+        if name in df.columns:
+            return df[name]
+        return pd.Series([default] * len(df), index=df.index, dtype=object)
 
-            except Exception as e:
-                print(f"WARNING: 解析单条数据时出错: {e}, 行数据: {row.to_dict()}", file=sys.stderr)
-                continue
+    def _parse_date_column(self, column: pd.Series) -> pd.Series:
+        """按列解析日期，规则与 _parse_date 一致
 
-        return new_stocks
+        Args:
+            column: 原始日期列
+
+        Returns:
+            pd.Series: datetime64 列，无法解析的值为 NaT
+        """
+        values = column.astype(object)
+        valid = values.notna()
+        # 与 _parse_date 一样，按 str(value) 的完整字符串匹配日期格式
+        strings = values.astype(str)
+
+        parsed = pd.Series(pd.NaT, index=column.index, dtype="datetime64[ns]")
+        for fmt in self.DATE_FORMATS:
+            remaining = valid & parsed.isna()
+            if not remaining.any():
+                break
+            parsed[remaining] = pd.to_datetime(strings[remaining], format=fmt, errors="coerce")
+
+        return parsed
+
+    def _build_date_range_column(self, online_start: pd.Series, online_end: pd.Series,
+                                 issue_date_raw: pd.Series) -> pd.Series:
+        """按列组合申购日期范围字符串
+
+        优先使用网上申购起止日期；只有结束日期时使用结束日期；
+        都没有时使用申购日期
+
+        Args:
+            online_start: 网上申购开始日期列
+            online_end: 网上申购结束日期列
+            issue_date_raw: 申购日期列
+
+        Returns:
+            pd.Series: 日期范围字符串列（如 "2025-12-30至2026-01-05"），无日期时为 None
+        """
+        start_str = online_start.astype(object).astype(str).str[:10]
+        end_str = online_end.astype(object).astype(str).str[:10]
+        raw_str = issue_date_raw.astype(object).astype(str).str[:10]
+
+        has_start = online_start.notna()
+        has_end = online_end.notna()
+
+        date_range = pd.Series(None, index=online_start.index, dtype=object)
+        date_range = date_range.mask(~has_end & issue_date_raw.notna(), raw_str + "至" + raw_str)
+        date_range = date_range.mask(has_end, end_str + "至" + end_str)
+        date_range = date_range.mask(has_start & has_end, start_str + "至" + end_str)
+
+        return date_range
+
+    def _parse_float_column(self, column: pd.Series) -> pd.Series:
+        """按列解析浮点数，规则与 _parse_float 一致
+
+        Args:
+            column: 原始数值列
+
+        Returns:
+            pd.Series: 浮点数列，无法解析的值为 NaN
+        """
+        if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            return column.astype(float)
+
+        # 非数值类型的列（如带单位的字符串）逐个解析
+        return column.map(self._parse_float).astype(object)
+
+    def _format_lottery_rate_column(self, column: pd.Series) -> pd.Series:
+        """按列格式化中签率，规则与 _format_lottery_rate 一致
+
+        Args:
+            column: 原始中签率列
+
+        Returns:
+            pd.Series: 中签率字符串列，无数据时为 None
+        """
+        if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+            return column.map(self._format_lottery_rate).astype(object)
+
+        rates = column.astype(float)
+        # 小于1的小数转换为百分比
+        percent = rates.where(rates >= 1, rates * 100)
+
+        formatted = pd.Series(None, index=column.index, dtype=object)
+        valid = rates.notna()
+        formatted[valid] = [f"{rate:.4f}" for rate in percent[valid].tolist()]
+        return formatted
+
+    def _determine_market_column(self, codes: pd.Series) -> pd.Series:
+        """按列判断市场，规则与 _determine_market 一致
+
+        Args:
+            codes: 股票代码列
+
+        Returns:
+            pd.Series: 详细市场信息列
+        """
+        by_two_chars = codes.str[:2].map({
+            "60": "上海-主板",
+            "68": "上海-科创板",
+            "00": "深圳-主板",
+            "30": "深圳-创业板",
+            "92": "北交所",
+            "93": "北交所",
+        })
+        by_first_char = codes.str[:1].map({"8": "北交所", "4": "北交所"})
+
+        return by_two_chars.fillna(by_first_char).fillna("")
+
+    def _to_datetime_list(self, column: pd.Series) -> list:
+        """将 datetime64 列转换为 datetime 对象列表，NaT 转换为 None"""
+        values = column.dt.to_pydatetime()
+        return [None if value is pd.NaT else value for value in values]
+
+    def _to_date_list(self, column: pd.Series) -> list:
+        """将 datetime64 列转换为 date 对象列表，NaT 转换为 None"""
+        return [None if value is None else value.date() for value in self._to_datetime_list(column)]
+
+    def _to_optional_list(self, column: pd.Series) -> list:
+        """将列转换为 Python 对象列表，缺失值（NaN/None）转换为 None"""
+        return column.astype(object).where(column.notna(), None).tolist()
 
     def _enrich_stock_info(self, stocks: List[NewStockInfo]) -> List[NewStockInfo]:
         """补充股票的行业和简介信息
 
+        优先读取公司概况缓存，仅对从未获取过或缓存已过期的股票请求巨潮资讯。
+        配置了线程池时并发请求，每次调用最多等待 timeout 秒（见 _call_with_timeout），整批等待不超过请求时限。
+        因时限用完而未补充的股票保留原记录，股票代码记录在 unenriched 中
+
         Args:
             stocks: 新股信息列表
 
         Returns:
-            List[NewStockInfo]: 补充信息后的新股列表
+            List[NewStockInfo]: 补充信息后的新股列表，与输入一一对应且顺序相同
         """
         print("INFO: 开始补充股票详细信息...", file=sys.stderr)
 
-        for stock in stocks:
-            try:
-                # 调用API获取公司简介
-                df_profile = ak.stock_profile_cninfo(symbol=stock.stock_code)
+        self.unenriched = []
+
+        if self.enrich_executor is None or len(stocks) <= 1:
+            enriched_stocks = []
+            for stock in stocks:
+                try:
+                    enriched_stocks.append(self._enrich_one(stock))
+                except DeadlineExceeded:
+                    self.unenriched.append(stock.stock_code)
+                    enriched_stocks.append(stock)
+            return enriched_stocks
+
+        futures = [self.enrich_executor.submit(self._enrich_one, stock) for stock in stocks]
+
+        # 单次调用已限时，这里只需按请求时限等待
+        _, not_done = wait(futures, timeout=self.deadline.remaining())
+
+        enriched_stocks = []
+        for stock, future in zip(stocks, futures):
+            if future in not_done:
+                future.cancel()
+                print(f"WARNING: 补充 {stock.stock_code} 的详细信息超时", file=sys.stderr)
+                self.unenriched.append(stock.stock_code)
+                enriched_stocks.append(stock)
+            elif isinstance(future.exception(), DeadlineExceeded):
+                self.unenriched.append(stock.stock_code)
+                enriched_stocks.append(stock)
+            else:
+                enriched_stocks.append(future.result())
+
+        if self.unenriched:
+            print(f"WARNING: 请求时限已到，{len(self.unenriched)} 只股票未补充详细信息", file=sys.stderr)
+
+        return enriched_stocks
+
+    def _enrich_one(self, stock: NewStockInfo) -> NewStockInfo:
+        """补充单只股票的行业和简介信息
+
+        Args:
+            stock: 新股信息
+
+        Returns:
+            NewStockInfo: 补充信息后的新记录，无数据或出错时返回原记录
+
+        Raises:
+            DeadlineExceeded: 未命中缓存且请求时限已到时
+        """
+        action = f"获取 {stock.stock_code} 的公司概况"
+
+        def fetch() -> Optional[dict]:
+            # 每次重试都重新检查时限并限制单次调用的等待时间
+            return self._call_with_timeout(lambda: self._fetch_profile(stock.stock_code), action)
 
-                if df_profile is not None and not df_profile.empty:
-                    # 获取行业
-                    industry = df_profile.iloc[0].get("所属行业", "")
-                    if industry:
-                        stock.industry = str(industry)
+        try:
+            profile = self.profile_cache.get(stock.stock_code) if self.profile_cache else None
+
+            if profile is None:
+                # 调用API获取公司简介，失败时重试
+                profile = self.retry_policy.call(
+                    fetch,
+                    budget=self.retry_budget,
+                    retryable=self._is_retryable,
+                    description=action,
+                    deadline=self.deadline
+                )
+                if profile is None:
+                    return stock
+
+                if self.profile_cache:
+                    self.profile_cache.set(stock.stock_code, profile)
+            else:
+                print(f"DEBUG: 命中 {stock.stock_code} 的公司概况缓存", file=sys.stderr)
+
+            stock = replace(
+                stock,
+                industry=profile["industry"] or stock.industry,
+                company_intro=profile["company_intro"] or stock.company_intro
+            )
+
+            print(f"DEBUG: 成功补充 {stock.stock_code} 的详细信息", file=sys.stderr)
+
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"WARNING: 补充 {stock.stock_code} 的详细信息时出错: {e}", file=sys.stderr)
 
-                    # 获取公司简介（直接使用主营业务）
-                    intro = df_profile.iloc[0].get("主营业务", "")
+        return stock
 
-                    if intro and not pd.isna(intro):
-                        # 限制简介长度，避免过长
-                        intro_str = str(intro).strip()
-                        if len(intro_str) > 500:
-                            intro_str = intro_str[:500] + "..."
-                        stock.company_intro = intro_str
+    def _fetch_profile(self, stock_code: str) -> Optional[dict]:
+        """从巨潮资讯获取单只股票的公司概况
+
+        Args:
+            stock_code: 股票代码
+
+        Returns:
+            Optional[dict]: 包含 industry 和 company_intro 的字典，无数据时返回 None
+        """
+        df_profile = ak.stock_profile_cninfo(symbol=stock_code)
+
+        if df_profile is None or df_profile.empty:
+            return None
 
-                    print(f"DEBUG: 成功补充 {stock.stock_code} 的详细信息", file=sys.stderr)
+        # 获取行业
+        industry = df_profile.iloc[0].get("所属行业", "")
+        industry = str(industry) if industry else ""
 
-            except Exception as e:
-                print(f"WARNING: 补充 {stock.stock_code} 的详细信息时出错: {e}", file=sys.stderr)
-                continue
+        # 获取公司简介（直接使用主营业务）
+        intro = df_profile.iloc[0].get("主营业务", "")
+        intro_str = ""
+        if intro and not pd.isna(intro):
+            # 限制简介长度，避免过长
+            intro_str = str(intro).strip()
+            if len(intro_str) > 500:
+                intro_str = intro_str[:500] + "..."
 
-        return stocks
+        return {"industry": industry, "company_intro": intro_str}
 
     def _parse_date(self, date_str):
         """解析日期字符串
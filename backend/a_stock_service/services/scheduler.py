@@ -0,0 +1,97 @@
+"""
+后台刷新调度服务
+
+在 FastAPI 生命周期内按固定间隔执行数据刷新任务
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+
+class RefreshScheduler:
+    """后台定时刷新调度器
+
+    以 asyncio 后台任务的形式周期性调用异步刷新函数，
+    阻塞操作应由刷新函数自行放到线程池中执行
+    """
+
+    def __init__(self, refresh_func: Callable[[], Awaitable[object]], interval: int = 1800):
+        """初始化调度器
+
+        Args:
+            refresh_func: 异步刷新函数，抛出异常视为刷新失败
+            interval: 刷新间隔（秒）
+        """
+        self.refresh_func = refresh_func
+        self.interval = interval
+        self.runs = 0
+        self.failures = 0
+        self.last_success: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """调度器是否正在运行"""
+        return self._task is not None and not self._task.done()
+
+    def start(self, delay: float = 0) -> None:
+        """启动后台刷新任务（需在事件循环中调用）
+
+        Args:
+            delay: 首次刷新前等待的时间（秒），如从快照存储恢复的快照尚未过期时
+        """
+        if self.running:
+            return
+
+        print(f"INFO: 启动后台刷新任务，间隔 {self.interval} 秒，{delay:.0f} 秒后首次刷新", file=sys.stderr)
+        self._task = asyncio.create_task(self._run(delay))
+
+    async def stop(self) -> None:
+        """停止后台刷新任务"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        print("INFO: 后台刷新任务已停止", file=sys.stderr)
+
+    async def _run(self, delay: float = 0) -> None:
+        """刷新循环：等待 delay 秒后刷新一次（默认立即刷新），之后按间隔刷新"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        while True:
+            self.runs += 1
+            try:
+                await self.refresh_func()
+                self.last_success = datetime.now()
+                self.last_error = None
+            except Exception as e:
+                # 刷新失败时保留上一份快照，等待下一轮
+                self.failures += 1
+                self.last_error = str(e)
+                print(f"ERROR: 后台刷新失败: {e}", file=sys.stderr)
+
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """获取调度器状态
+
+        Returns:
+            dict: 运行状态、次数和最近一次成功时间
+        """
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error
+        }
@@ -0,0 +1,75 @@
+"""
+请求合并服务
+
+同一时刻针对同一数据的并发请求只执行一次，所有调用方共享结果
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class SingleFlight:
+    """并发请求合并（single-flight）
+
+    同一个键同时只有一个执行中的任务，期间到达的调用方直接等待该任务的结果。
+    任务独立于调用方运行，个别调用方断开或等待超时不会取消共享的执行
+    """
+
+    def __init__(self):
+        """初始化请求合并器"""
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """执行或加入同一键的任务
+
+        Args:
+            key: 合并键（如市场名称）
+            func: 返回可等待对象的函数，仅在没有执行中的任务时调用
+            timeout: 加入已有任务时最多等待的秒数，为 None 时等到任务完成。
+                已有任务按发起方的参数执行，加入的调用方只能限制自己的等待时间
+
+        Returns:
+            Any: 任务结果，任务失败时所有调用方都会收到同一个异常
+
+        Raises:
+            TimeoutError: 加入的调用方在 timeout 秒内没有等到结果时（任务继续执行）
+        """
+        self.calls += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        self.coalesced += 1
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+    def in_flight(self, key: str) -> bool:
+        """判断指定键是否有执行中的任务
+
+        Args:
+            key: 合并键
+
+        Returns:
+            bool: 是否正在执行
+        """
+        return key in self._inflight
+
+    def stats(self) -> dict:
+        """获取合并统计信息
+
+        Returns:
+            dict: 调用次数、实际执行次数和被合并的调用次数
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
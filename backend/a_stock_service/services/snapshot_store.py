@@ -0,0 +1,444 @@
+"""
+快照存储服务
+
+基于 SQLite 保存每次成功刷新得到的数据快照，服务重启后从最近一份快照恢复，并支持查询历史；
+写入快照时与已知的最新状态比较，按字段记录新增、删除和变化的股票
+"""
+
+import dataclasses
+import json
+import os
+import sqlite3
+import sys
+import threading
+import typing
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from models import StockSnapshot
+
+
+class SnapshotStore:
+    """基于 SQLite 的快照存储
+
+    每份快照一行元数据，快照内的股票按股票代码批量写入（同一快照内按代码覆盖），
+    补充详细信息后的快照写回原快照。快照数超过上限时删除最早的快照及其变化记录。
+
+    stock_state 按股票代码保存每只股票的最新已知记录。写入快照时逐只与之比较，
+    把新增、删除和字段变化写入 stock_changes，查询变化时无需再比较快照
+    """
+
+    def __init__(self, path: str, record_type: type, max_snapshots: int = 336):
+        """初始化快照存储
+
+        Args:
+            path: SQLite 数据库文件路径
+            record_type: 股票记录的数据类，用于从 JSON 还原记录
+            max_snapshots: 最多保留的快照数
+        """
+        self.path = path
+        self.record_type = record_type
+        self.max_snapshots = max_snapshots
+        self.saves = 0
+        self.changes = 0
+        self._lock = threading.Lock()
+
+        # 记录中日期字段的类型，JSON 中以 ISO 字符串保存
+        hints = typing.get_type_hints(record_type)
+        self._date_fields = {}
+        for name, hint in hints.items():
+            for candidate in (hint, *typing.get_args(hint)):
+                if candidate in (datetime, date):
+                    self._date_fields[name] = candidate
+                    break
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fetched_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                stock_count INTEGER NOT NULL,
+                unenriched TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshot_stocks (
+                snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+                stock_code TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (snapshot_id, stock_code)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshot_stocks_code ON snapshot_stocks (stock_code, snapshot_id)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS stock_state (
+                stock_code TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS stock_changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+                changed_at TEXT NOT NULL,
+                stock_code TEXT NOT NULL,
+                change_type TEXT NOT NULL,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_stock_changes_time ON stock_changes (changed_at)"
+        )
+        self._conn.commit()
+
+    def _encode(self, stock) -> str:
+        """将股票记录序列化为 JSON"""
+        data = {}
+        for field in dataclasses.fields(stock):
+            value = getattr(stock, field.name)
+            data[field.name] = value.isoformat() if isinstance(value, (datetime, date)) else value
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def _timestamp(moment: datetime) -> str:
+        """统一的时间字符串格式，保证按字符串比较与按时间比较一致"""
+        return moment.isoformat(timespec="microseconds")
+
+    def _diff(self, rows: Dict[str, str], full: bool) -> tuple:
+        """与最新已知状态比较，计算本次写入的变化（调用方持有锁）
+
+        新记录中为空的字段沿用已知值，不视为变化。尚未补充或补充失败的股票详细信息为空，
+        不能据此把已知值记为被清空；代价是上游真正清空的字段也不会记为变化
+
+        Args:
+            rows: 股票代码到序列化记录的映射
+            full: 是否为完整的新快照；只有完整快照才会把不在快照中的股票记为删除
+
+        Returns:
+            tuple: (变化列表 [(股票代码, 变化类型, 内容)], 需要更新的状态 [(股票代码, 记录)], 被删除的股票代码)
+        """
+        state = dict(self._conn.execute("SELECT stock_code, data FROM stock_state").fetchall())
+        changes = []
+        updates = []
+
+        for code, payload in rows.items():
+            known = state.get(code)
+            if known == payload:
+                continue
+
+            record = json.loads(payload)
+            if known is None:
+                changes.append((code, "added", record))
+                updates.append((code, payload))
+                continue
+
+            previous = json.loads(known)
+            record = {
+                name: previous.get(name) if value in (None, "") else value
+                for name, value in record.items()
+            }
+            fields = {
+                name: [previous.get(name), value]
+                for name, value in record.items()
+                if previous.get(name) != value
+            }
+            if fields:
+                changes.append((code, "modified", fields))
+                updates.append((code, json.dumps(record, ensure_ascii=False)))
+
+        removed = [code for code in state if code not in rows] if full else []
+        for code in removed:
+            changes.append((code, "removed", json.loads(state[code])))
+
+        return changes, updates, removed
+
+    def _decode(self, payload: str):
+        """从 JSON 还原股票记录"""
+        data = json.loads(payload)
+        for name, kind in self._date_fields.items():
+            if data.get(name):
+                data[name] = kind.fromisoformat(data[name])
+        return self.record_type(**data)
+
+    def save(self, snapshot: StockSnapshot, base_id: Optional[int] = None) -> int:
+        """保存快照
+
+        每次写入都是一份新快照，快照 ID 因此总是对应一次写入，可以作为变化查询的游标
+
+        Args:
+            snapshot: 数据快照
+            base_id: 补充详细信息前的快照 ID，不为 None 时表示补充后的写回，
+                不在快照中的股票不记为删除
+
+        Returns:
+            int: 快照 ID
+        """
+        fetched_at = snapshot.fetched_at.isoformat()
+        updated_at = snapshot.updated_at.isoformat()
+        unenriched = json.dumps(snapshot.unenriched)
+        rows = {stock.stock_code: self._encode(stock) for stock in snapshot.stocks}
+
+        with self._lock:
+            changes, updates, removed = self._diff(rows, full=base_id is None)
+
+            cursor = self._conn.execute(
+                """
+                INSERT INTO snapshots (fetched_at, updated_at, stock_count, unenriched)
+                VALUES (?, ?, ?, ?)
+                """,
+                (fetched_at, updated_at, len(rows), unenriched)
+            )
+            snapshot_id = cursor.lastrowid
+
+            self._conn.executemany(
+                "INSERT INTO snapshot_stocks (snapshot_id, stock_code, data) VALUES (?, ?, ?)",
+                [(snapshot_id, code, data) for code, data in rows.items()]
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO stock_state (stock_code, data) VALUES (?, ?)
+                ON CONFLICT(stock_code) DO UPDATE SET data = excluded.data
+                """,
+                updates
+            )
+            self._conn.executemany("DELETE FROM stock_state WHERE stock_code = ?", [(code,) for code in removed])
+            changed_at = self._timestamp(snapshot.updated_at)
+            self._conn.executemany(
+                """
+                INSERT INTO stock_changes (snapshot_id, changed_at, stock_code, change_type, data)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (snapshot_id, changed_at, code, change_type, json.dumps(data, ensure_ascii=False))
+                    for code, change_type, data in changes
+                ]
+            )
+            self._conn.execute(
+                "DELETE FROM snapshots WHERE id <= ?", (snapshot_id - self.max_snapshots,)
+            )
+            self._conn.commit()
+            self.saves += 1
+            self.changes += len(changes)
+
+        return snapshot_id
+
+    def load(self, snapshot_id: Optional[int] = None) -> Optional[StockSnapshot]:
+        """读取快照
+
+        Args:
+            snapshot_id: 快照 ID，为 None 时读取最近一份快照
+
+        Returns:
+            Optional[StockSnapshot]: 快照，不存在时返回 None
+        """
+        with self._lock:
+            if snapshot_id is None:
+                row = self._conn.execute(
+                    "SELECT id, fetched_at, updated_at, unenriched FROM snapshots ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT id, fetched_at, updated_at, unenriched FROM snapshots WHERE id = ?", (snapshot_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            payloads = self._conn.execute(
+                "SELECT data FROM snapshot_stocks WHERE snapshot_id = ? ORDER BY rowid", (row[0],)
+            ).fetchall()
+
+        try:
+            stocks = [self._decode(payload) for payload, in payloads]
+        except (ValueError, TypeError) as e:
+            print(f"WARNING: 快照 {row[0]} 损坏，已忽略: {e}", file=sys.stderr)
+            return None
+
+        return StockSnapshot(
+            stocks=stocks,
+            fetched_at=datetime.fromisoformat(row[1]),
+            unenriched=json.loads(row[3]),
+            snapshot_id=row[0],
+            enriched_at=datetime.fromisoformat(row[2]) if row[2] != row[1] else None
+        )
+
+    def list_snapshots(self, limit: int = 50) -> List[dict]:
+        """列出最近的快照
+
+        Args:
+            limit: 最多返回的快照数
+
+        Returns:
+            List[dict]: 快照 ID、获取时间、最后写入时间、股票数和未补充的股票数，按时间倒序
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, fetched_at, updated_at, stock_count, unenriched
+                FROM snapshots ORDER BY id DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+
+        return [
+            {
+                "snapshot_id": snapshot_id,
+                "fetched_at": fetched_at,
+                "updated_at": updated_at,
+                "stock_count": stock_count,
+                "unenriched_count": len(json.loads(unenriched))
+            }
+            for snapshot_id, fetched_at, updated_at, stock_count, unenriched in rows
+        ]
+
+    def stock_history(self, stock_code: str, limit: int = 50) -> List[dict]:
+        """查询单只股票在各快照中的记录
+
+        Args:
+            stock_code: 股票代码
+            limit: 最多返回的快照数
+
+        Returns:
+            List[dict]: 快照 ID、获取时间和该快照中的记录，按时间倒序
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT s.id, s.fetched_at, ss.data
+                FROM snapshot_stocks ss JOIN snapshots s ON s.id = ss.snapshot_id
+                WHERE ss.stock_code = ?
+                ORDER BY s.id DESC LIMIT ?
+                """,
+                (stock_code, limit)
+            ).fetchall()
+
+        return [
+            {"snapshot_id": snapshot_id, "fetched_at": fetched_at, "stock": json.loads(data)}
+            for snapshot_id, fetched_at, data in rows
+        ]
+
+    def snapshot_time(self, snapshot_id: int) -> Optional[datetime]:
+        """获取快照写入的时间
+
+        Args:
+            snapshot_id: 快照 ID
+
+        Returns:
+            Optional[datetime]: 写入时间，快照不存在或已被清理时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT updated_at FROM snapshots WHERE id = ?", (snapshot_id,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def changes_since(self, since: datetime) -> dict:
+        """查询某一时间之后的净变化
+
+        同一只股票的多次变化合并为一条：先新增后修改仍记为新增，先新增后删除不返回，
+        多次修改合并为最早的旧值到最新的新值，最终没有差异的字段不返回
+
+        Args:
+            since: 起始时间（不含）
+
+        Returns:
+            dict: added（新增的记录）、removed（删除的记录）、modified（股票代码、名称和
+            字段变化 {字段: {"old": 旧值, "new": 新值}}），以及 complete（起始时间之后的变化
+            是否全部保留，起始时间之后的快照已被清理时为 False）
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT stock_code, change_type, data FROM stock_changes
+                WHERE changed_at > ? ORDER BY id
+                """,
+                (self._timestamp(since),)
+            ).fetchall()
+            first_id, earliest = self._conn.execute("SELECT MIN(id), MIN(fetched_at) FROM snapshots").fetchone()
+            state = dict(self._conn.execute("SELECT stock_code, data FROM stock_state").fetchall())
+
+        # 每只股票的 [变化前, 变化后]：新增前和删除后为 None，修改只包含变化的字段
+        net: Dict[str, list] = {}
+        for code, change_type, payload in rows:
+            data = json.loads(payload)
+            if change_type == "added":
+                before, after = None, data
+            elif change_type == "removed":
+                before, after = data, None
+            else:
+                before = {name: values[0] for name, values in data.items()}
+                after = {name: values[1] for name, values in data.items()}
+
+            if code not in net:
+                net[code] = [before, after]
+                continue
+
+            entry = net[code]
+            if change_type == "modified" and entry[1] is not None:
+                entry[1].update(after)
+                if entry[0] is not None:
+                    for name, value in before.items():
+                        entry[0].setdefault(name, value)
+            elif change_type == "removed":
+                if entry[0] is not None:
+                    for name, value in data.items():
+                        entry[0].setdefault(name, value)
+                entry[1] = None
+            else:
+                entry[1] = data
+
+        added, removed, modified = [], [], []
+        for code, (before, after) in net.items():
+            if before is None and after is None:
+                continue
+            if before is None:
+                added.append(after)
+            elif after is None:
+                removed.append(before)
+            else:
+                fields = {
+                    name: {"old": before[name], "new": value}
+                    for name, value in after.items()
+                    if name in before and before[name] != value
+                }
+                if fields:
+                    name = after.get("stock_name") or json.loads(state.get(code, "{}")).get("stock_name")
+                    modified.append({"stock_code": code, "stock_name": name, "changes": fields})
+
+        return {
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            # 自增 ID 从 1 开始，最早的快照仍在说明尚未清理过任何变化记录
+            "complete": first_id == 1 or (earliest is not None and datetime.fromisoformat(earliest) <= since)
+        }
+
+    def stats(self) -> dict:
+        """获取存储统计信息
+
+        Returns:
+            dict: 快照数、最近快照 ID、写入次数和记录的变化数
+        """
+        with self._lock:
+            count, latest = self._conn.execute("SELECT COUNT(*), MAX(id) FROM snapshots").fetchone()
+            return {
+                "path": self.path,
+                "max_snapshots": self.max_snapshots,
+                "snapshots": count,
+                "latest_id": latest,
+                "saves": self.saves,
+                "changes": self.changes
+            }
@@ -0,0 +1,130 @@
+"""
+申购窗口索引服务
+
+基于申购起止日期的有序数组构建区间索引，按任意日期查询可申购和即将开放申购的新股
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from models import NewStockInfo
+
+
+class SubscriptionWindowIndex:
+    """申购窗口区间索引
+
+    按申购开始日期排序保存所有带申购窗口的股票，并记录不超过 SPAN_CAP 天的窗口中最长的跨度：
+
+    - 某日可申购：开始日期落在 [日期 - 最长跨度, 日期] 内、且结束日期不早于该日的股票，
+      加上跨度超过 SPAN_CAP 天的少数长窗口中包含该日的股票（逐个检查）
+    - 未来 N 天开放申购：开始日期落在 (日期, 日期 + N] 内的股票
+
+    两类查询都通过二分查找定位候选区间，无需遍历全部股票；个别异常长的窗口不会扩大扫描范围。
+    索引只读，快照变化时整体重建
+    """
+
+    # 申购窗口通常只有几天，超过该跨度的窗口单独保存
+    SPAN_CAP = 31
+
+    def __init__(self, stocks: List[NewStockInfo], fetched_at: Optional[datetime] = None,
+                 version: Optional[int] = None):
+        """构建索引
+
+        Args:
+            stocks: 新股信息列表，缺少申购起止日期的股票不会进入索引
+            fetched_at: 对应快照的获取时间
+            version: 对应快照的版本号，用于判断索引是否与快照一致
+        """
+        self.fetched_at = fetched_at
+        self.version = version
+
+        # 保留原始顺序，查询结果排序与 DataProcessor.classify 保持一致
+        entries = sorted(
+            (
+                (stock.start_date.toordinal(), position, stock)
+                for position, stock in enumerate(stocks)
+                if stock.start_date is not None and stock.end_date is not None
+            ),
+            key=lambda entry: entry[:2]
+        )
+
+        self._starts = [start for start, _, _ in entries]
+        self._positions = [position for _, position, _ in entries]
+        self._stocks = [stock for _, _, stock in entries]
+        self._ends = [stock.end_date.toordinal() for stock in self._stocks]
+
+        spans = [end - start for start, end in zip(self._starts, self._ends)]
+        self._max_span = max((span for span in spans if span <= self.SPAN_CAP), default=0)
+        self._long = [i for i, span in enumerate(spans) if span > self.SPAN_CAP]
+
+    def __len__(self) -> int:
+        """索引中的股票数量"""
+        return len(self._stocks)
+
+    def open_on(self, day: date) -> List[NewStockInfo]:
+        """查询指定日期可申购的新股
+
+        Args:
+            day: 查询日期
+
+        Returns:
+            List[NewStockInfo]: 申购日期范围包含该日期的新股，按申购日期排序
+        """
+        target = day.toordinal()
+        lo = bisect_left(self._starts, target - max(self._max_span, 0))
+        hi = bisect_right(self._starts, target)
+
+        hits = [i for i in range(lo, hi) if self._ends[i] >= target]
+        # 扫描范围之前开始的长窗口
+        hits.extend(i for i in self._long if i < lo and self._ends[i] >= target)
+        return self._collect(hits)
+
+    def opening_within(self, day: date, days: int) -> List[NewStockInfo]:
+        """查询指定日期之后若干天内开放申购的新股
+
+        Args:
+            day: 基准日期
+            days: 天数
+
+        Returns:
+            List[NewStockInfo]: 申购开始日期在 (day, day + days] 内的新股，按申购日期排序
+        """
+        target = day.toordinal()
+        lo = bisect_right(self._starts, target)
+        hi = bisect_right(self._starts, target + days)
+
+        return self._collect(range(lo, hi))
+
+    def query(self, day: date, future_days: int) -> Tuple[List[NewStockInfo], List[NewStockInfo]]:
+        """同时查询可申购和即将开放申购的新股
+
+        Args:
+            day: 基准日期
+            future_days: 查询未来天数
+
+        Returns:
+            Tuple[List[NewStockInfo], List[NewStockInfo]]: (当日可申购, 未来 future_days 天内开放申购)
+        """
+        return self.open_on(day), self.opening_within(day, future_days)
+
+    def _collect(self, indices) -> List[NewStockInfo]:
+        """按申购日期（相同时按原始顺序）取出命中的股票"""
+        ordered = sorted(
+            indices,
+            key=lambda i: (self._stocks[i].issue_date or datetime.min, self._positions[i])
+        )
+        return [self._stocks[i] for i in ordered]
+
+    def stats(self) -> dict:
+        """获取索引信息
+
+        Returns:
+            dict: 股票数量、扫描用的最长窗口跨度、超过 SPAN_CAP 的长窗口数量和对应的快照时间
+        """
+        return {
+            "entries": len(self._stocks),
+            "max_span_days": self._max_span,
+            "long_windows": len(self._long),
+            "snapshot_time": self.fetched_at.isoformat() if self.fetched_at else None
+        }
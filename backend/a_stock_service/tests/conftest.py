@@ -0,0 +1,6 @@
+"""测试配置：服务以目录为根导入 models、services"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,55 @@
+"""akshare 单次调用限时与重试判断的测试"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from services import Deadline, DataFetcher, DeadlineExceeded
+
+
+@pytest.fixture
+def call_executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_slow_call_times_out_and_is_retryable(call_executor):
+    release = threading.Event()
+    fetcher = DataFetcher(timeout=0.05, call_executor=call_executor)
+
+    with pytest.raises(TimeoutError) as excinfo:
+        fetcher._call_with_timeout(release.wait, "获取公司概况")
+    release.set()
+
+    assert not isinstance(excinfo.value, DeadlineExceeded)
+    assert fetcher._is_retryable(excinfo.value)
+
+
+def test_expired_deadline_is_not_a_call_timeout(call_executor):
+    release = threading.Event()
+    fetcher = DataFetcher(timeout=10, call_executor=call_executor, deadline=Deadline(0.05))
+
+    with pytest.raises(DeadlineExceeded):
+        fetcher._call_with_timeout(release.wait, "获取公司概况")
+    release.set()
+
+
+def test_call_errors_pass_through(call_executor):
+    fetcher = DataFetcher(timeout=10, call_executor=call_executor)
+
+    def fail():
+        raise requests.exceptions.ConnectionError("连接被重置")
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fetcher._call_with_timeout(fail, "获取公司概况")
+
+
+def test_unparseable_responses_are_not_retried():
+    fetcher = DataFetcher()
+
+    assert fetcher._is_retryable(requests.exceptions.ConnectionError())
+    assert not fetcher._is_retryable(requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0))
+    assert not fetcher._is_retryable(KeyError("count"))
@@ -0,0 +1,71 @@
+"""新股列表申购窗口筛选（谓词下推）的测试"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from services import DataFetcher
+
+TODAY = date(2026, 3, 10)
+
+
+def make_frame(windows) -> pd.DataFrame:
+    """按 (代码, 开始日期, 结束日期) 构造与 cninfo 列顺序一致的原始数据"""
+    rows = []
+    for code, start, end in windows:
+        row = [code, f"新股{code}"] + [None] * 7 + [start, end]
+        rows.append(row)
+    columns = ["证劵代码", "证券简称"] + [f"列{i}" for i in range(2, 9)] + ["网上申购开始", "网上申购结束"]
+    df = pd.DataFrame(rows, columns=columns)
+    df["申购日期"] = None
+    return df
+
+
+def offset(days: int) -> date:
+    return TODAY + timedelta(days=days)
+
+
+def filtered_codes(future_days: int, history_days: int = 0) -> list:
+    df = make_frame([
+        ("ended_long_ago", offset(-40), offset(-35)),
+        ("ended_recently", offset(-6), offset(-5)),
+        ("subscribable", offset(-1), offset(1)),
+        ("upcoming", offset(3), offset(4)),
+        ("far_future", offset(30), offset(31)),
+        ("no_end", offset(2), None),
+    ])
+    return DataFetcher()._filter_window(df, TODAY, future_days, history_days)["证劵代码"].tolist()
+
+
+def test_window_without_history_matches_subscribable_and_upcoming():
+    assert filtered_codes(future_days=14) == ["subscribable", "upcoming"]
+
+
+def test_history_days_keeps_recently_ended_windows():
+    assert filtered_codes(future_days=14, history_days=7) == ["ended_recently", "subscribable", "upcoming"]
+
+
+def test_future_days_bounds_upcoming_windows():
+    assert filtered_codes(future_days=366, history_days=90) == [
+        "ended_long_ago", "ended_recently", "subscribable", "upcoming", "far_future"
+    ]
+
+
+def test_bounds_from_the_full_frame_align_with_the_filtered_rows():
+    df = make_frame([
+        ("ended_long_ago", offset(-40), offset(-35)),
+        ("subscribable", offset(-1), offset(1)),
+        ("far_future", offset(30), offset(31)),
+        ("upcoming", offset(3), offset(4)),
+    ])
+    fetcher = DataFetcher()
+    bounds = fetcher._window_bounds(df)
+    filtered = fetcher._filter_window(df, TODAY, 14, bounds=bounds)
+
+    stocks = fetcher._parse_dataframe(filtered, bounds=bounds)
+
+    assert [(stock.stock_code, stock.start_date, stock.end_date) for stock in stocks] == [
+        ("subscribable", offset(-1), offset(1)),
+        ("upcoming", offset(3), offset(4)),
+    ]
+    assert stocks == fetcher._parse_dataframe(filtered)
@@ -0,0 +1,25 @@
+"""Markdown 格式化的测试"""
+
+from datetime import date, datetime
+
+from models import NewStockInfo
+from services import MarkdownFormatter
+
+
+def make_stock(code: str) -> NewStockInfo:
+    return NewStockInfo(
+        stock_code=code, stock_name=f"新股{code}", subscription_code=code,
+        issue_date=datetime(2026, 1, 1), start_date=date(2026, 1, 1), end_date=date(2026, 1, 3)
+    )
+
+
+def test_out_of_scope_stocks_are_noted_apart_from_background_enrichment():
+    markdown = MarkdownFormatter().format_new_stocks(
+        [make_stock("000001"), make_stock("000002")], [make_stock("000003")],
+        unenriched=["000001"], out_of_scope=["000003", "999999"]
+    )
+
+    notes = [line for line in markdown.splitlines() if line.startswith("> 注：")]
+    assert len(notes) == 2
+    assert "000001" in notes[0] and "正在后台补充" in notes[0]
+    assert "1 只新股不在数据获取当天的申购窗口内（000003）" in notes[1]
@@ -0,0 +1,46 @@
+"""刷新请求合并的测试"""
+
+import asyncio
+import time
+
+import pytest
+
+from services import SingleFlight
+
+
+async def slow_refresh(seconds: float, result: str) -> str:
+    await asyncio.sleep(seconds)
+    return result
+
+
+def test_joining_caller_returns_within_its_own_budget():
+    async def scenario():
+        flight = SingleFlight()
+        # 不限时的后台刷新先发起
+        leader = asyncio.ensure_future(flight.do("A股", lambda: slow_refresh(0.5, "full")))
+        await asyncio.sleep(0)
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            await flight.do("A股", lambda: slow_refresh(0, "list"), timeout=0.05)
+        waited = time.monotonic() - started
+
+        # 加入方超时不影响共享的刷新
+        return waited, await leader, flight.stats()
+
+    waited, result, stats = asyncio.run(scenario())
+
+    assert waited < 0.3
+    assert result == "full"
+    assert stats["executions"] == 1 and stats["coalesced"] == 1
+
+
+def test_joining_caller_shares_the_result_when_it_arrives_in_time():
+    async def scenario():
+        flight = SingleFlight()
+        leader = asyncio.ensure_future(flight.do("A股", lambda: slow_refresh(0.05, "full")))
+        await asyncio.sleep(0)
+        joined = await flight.do("A股", lambda: slow_refresh(0, "list"), timeout=1)
+        return joined, await leader
+
+    assert asyncio.run(scenario()) == ("full", "full")
@@ -0,0 +1,71 @@
+"""快照存储变化记录的测试"""
+
+import dataclasses
+from datetime import datetime, timedelta
+
+from models import NewStockInfo, StockSnapshot
+from services import SnapshotStore
+
+START = datetime(2026, 3, 10, 8, 0)
+
+
+def make_stock(**fields) -> NewStockInfo:
+    values = dict(
+        stock_code="301001", stock_name="测试科技", issue_date=START, subscription_code="301001",
+        industry="软件和信息技术服务业", company_intro="测试公司简介"
+    )
+    values.update(fields)
+    return NewStockInfo(**values)
+
+
+def make_store(tmp_path) -> SnapshotStore:
+    return SnapshotStore(str(tmp_path / "snapshots.db"), NewStockInfo)
+
+
+def test_failed_enrichment_is_not_recorded_as_a_change(tmp_path):
+    store = make_store(tmp_path)
+    store.save(StockSnapshot(stocks=[make_stock()], fetched_at=START))
+
+    # 补充失败的记录详细信息为空，但没有列入 unenriched
+    failed = make_stock(industry="", company_intro="")
+    store.save(StockSnapshot(stocks=[failed], fetched_at=START + timedelta(minutes=30)))
+
+    assert store.changes_since(START)["modified"] == []
+
+    # 下一次补充成功后也不会记为从空值恢复
+    store.save(StockSnapshot(stocks=[make_stock()], fetched_at=START + timedelta(minutes=60)))
+    assert store.changes_since(START)["modified"] == []
+
+
+def test_non_empty_field_changes_are_recorded(tmp_path):
+    store = make_store(tmp_path)
+    store.save(StockSnapshot(stocks=[make_stock()], fetched_at=START))
+
+    updated = dataclasses.replace(make_stock(), industry="", lottery_rate="0.03")
+    store.save(StockSnapshot(stocks=[updated], fetched_at=START + timedelta(minutes=30)))
+
+    modified = store.changes_since(START)["modified"]
+    assert modified == [{
+        "stock_code": "301001",
+        "stock_name": "测试科技",
+        "changes": {"lottery_rate": {"old": None, "new": "0.03"}}
+    }]
+
+
+def test_snapshot_id_from_a_partial_snapshot_sees_the_enrichment(tmp_path):
+    store = make_store(tmp_path)
+    partial = StockSnapshot(
+        stocks=[make_stock(industry="", company_intro="")], fetched_at=START, unenriched=["301001"]
+    )
+    partial_id = store.save(partial)
+
+    # 后台补充详细信息后写回，列表获取时间不变
+    enriched = dataclasses.replace(
+        partial, stocks=[make_stock()], unenriched=[], enriched_at=START + timedelta(minutes=1)
+    )
+    enriched_id = store.save(enriched, base_id=partial_id)
+
+    assert enriched_id != partial_id
+    modified = store.changes_since(store.snapshot_time(partial_id))["modified"]
+    assert [entry["changes"]["industry"] for entry in modified] == [{"old": "", "new": "软件和信息技术服务业"}]
+    assert store.changes_since(store.snapshot_time(enriched_id))["modified"] == []
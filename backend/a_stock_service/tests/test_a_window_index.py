@@ -0,0 +1,34 @@
+"""申购窗口索引的测试"""
+
+from datetime import date, datetime, timedelta
+
+from models import NewStockInfo
+from services import SubscriptionWindowIndex
+
+BASE = date(2026, 1, 1)
+
+
+def make_stock(code: str, start_offset: int, span: int) -> NewStockInfo:
+    start = BASE + timedelta(days=start_offset)
+    return NewStockInfo(
+        stock_code=code, stock_name=f"新股{code}", subscription_code=code,
+        issue_date=datetime.combine(start, datetime.min.time()),
+        start_date=start, end_date=start + timedelta(days=span)
+    )
+
+
+def brute_force_open_on(stocks, day):
+    hits = [stock for stock in stocks if stock.start_date <= day <= stock.end_date]
+    return [stock.stock_code for stock in sorted(hits, key=lambda stock: stock.issue_date)]
+
+
+def test_long_window_does_not_widen_the_scan():
+    stocks = [make_stock(f"{i:06d}", i * 2, 3) for i in range(100)]
+    stocks.append(make_stock("999999", 0, 400))
+    index = SubscriptionWindowIndex(stocks)
+
+    assert index.stats()["max_span_days"] == 3
+    assert index.stats()["long_windows"] == 1
+    for offset in range(-5, 420, 7):
+        day = BASE + timedelta(days=offset)
+        assert [stock.stock_code for stock in index.open_on(day)] == brute_force_open_on(stocks, day)
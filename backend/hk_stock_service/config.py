@@ -16,7 +16,72 @@ class Config:
 
     # 数据获取配置
     FETCH_TIMEOUT: int = int(os.getenv("FETCH_TIMEOUT", "10"))
+    # 单个请求等待刷新的总时限（秒，0 表示不限时），用完后返回已获取的数据
+    REQUEST_DEADLINE: float = float(os.getenv("REQUEST_DEADLINE", "25"))
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    # 重试退避：基准时间和单次退避上限（秒），实际等待时间在 [0, 上限] 内随机
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "8"))
+    # 单次刷新的重试预算：总重试次数和累计退避时间（秒）
+    RETRY_BUDGET: int = int(os.getenv("RETRY_BUDGET", "10"))
+    RETRY_BUDGET_SECONDS: float = float(os.getenv("RETRY_BUDGET_SECONDS", "15"))
+    # 请求最小间隔（秒）：默认的初始速率和最高速率均为 1 / MIN_INTERVAL 次/秒
     MIN_INTERVAL: int = int(os.getenv("MIN_INTERVAL", "5"))
+    # 退避后的最大请求间隔（秒），即限流速率的下限为 1 / MAX_INTERVAL 次/秒
+    MAX_INTERVAL: int = int(os.getenv("MAX_INTERVAL", "60"))
+
+    # 自适应限流配置（按上游主机）：初始速率和最高速率（次/秒）、最多积累的令牌数，
+    # 以及视为上游过载的响应时间（秒）。默认只会从 1 / MIN_INTERVAL 向下减速，
+    # 更快的速率需显式配置 RATE_LIMIT / RATE_LIMIT_MAX
+    RATE_LIMIT: float = float(os.getenv("RATE_LIMIT") or 1 / max(MIN_INTERVAL, 1))
+    RATE_LIMIT_MAX: float = float(os.getenv("RATE_LIMIT_MAX") or RATE_LIMIT)
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "1"))
+    SLOW_RESPONSE_SECONDS: float = float(os.getenv("SLOW_RESPONSE_SECONDS", "2"))
+
+    # HTTP 连接池配置：保留连接池的主机数量、每个主机保留的最大连接数
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+
+    # 异步获取配置：启用后基于 httpx 并发获取详情页。请求仍受上面的限流控制，
+    # 默认限流（每 MIN_INTERVAL 秒一次、令牌数 1）下并发不会更快，
+    # 需要提速时应同时调大 RATE_LIMIT / RATE_LIMIT_MAX 和 RATE_LIMIT_BURST（不小于 FETCH_CONCURRENCY）
+    ASYNC_FETCH: bool = os.getenv("ASYNC_FETCH", "false").lower() in ("1", "true", "yes")
+    # 同时进行的详情页请求数上限
+    FETCH_CONCURRENCY: int = int(os.getenv("FETCH_CONCURRENCY", "4"))
+
+    # 数据处理线程池大小（获取、补充和格式化均在该线程池中执行）
+    PIPELINE_WORKERS: int = int(os.getenv("PIPELINE_WORKERS", "4"))
+
+    # 缓存配置
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))
+
+    # 后台刷新配置（秒，0 表示禁用后台刷新）
+    REFRESH_INTERVAL: int = int(os.getenv("REFRESH_INTERVAL", "1800"))
+
+    # 快照过期配置（秒）：超过 SNAPSHOT_TTL 视为过期，超过 MAX_STALENESS 不再返回
+    SNAPSHOT_TTL: int = int(os.getenv("SNAPSHOT_TTL", "3600"))
+    MAX_STALENESS: int = int(os.getenv("MAX_STALENESS", "86400"))
+    # 快照过期但未超过 MAX_STALENESS 时，是否立即返回旧数据并在后台刷新
+    SERVE_STALE: bool = os.getenv("SERVE_STALE", "true").lower() in ("1", "true", "yes")
+    # 快速模式：需要等待刷新时只获取新股列表并立即返回，详细信息在后台补充（请求参数 fast 可覆盖）
+    FAST_MODE: bool = os.getenv("FAST_MODE", "false").lower() in ("1", "true", "yes")
+    # 后台补充完成后 POST 默认查询结果的地址，为空时不通知
+    ENRICH_CALLBACK_URL: str = os.getenv("ENRICH_CALLBACK_URL", "")
+    # /api/stocks 允许客户端缓存的时间（秒，Cache-Control max-age），0 表示每次都需验证
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+    # 详情页持久化缓存配置
+    DETAIL_CACHE_PATH: str = os.getenv("DETAIL_CACHE_PATH", "data/detail_cache.db")
+    DETAIL_CACHE_TTL: int = int(os.getenv("DETAIL_CACHE_TTL", str(30 * 86400)))
+    DETAIL_CACHE_NEGATIVE_TTL: int = int(os.getenv("DETAIL_CACHE_NEGATIVE_TTL", "3600"))
+    DETAIL_CACHE_MAX_ENTRIES: int = int(os.getenv("DETAIL_CACHE_MAX_ENTRIES", "2000"))
+    # 是否流式读取详情页（找到板块和公司简介后立即断开连接）
+    DETAIL_STREAMING: bool = os.getenv("DETAIL_STREAMING", "true").lower() in ("1", "true", "yes")
+
+    # 快照存储配置：每次成功刷新的快照保存到 SQLite，重启后从最近一份快照恢复
+    SNAPSHOT_STORE_PATH: str = os.getenv("SNAPSHOT_STORE_PATH", "data/snapshots.db")
+    # 最多保留的快照数（按每 30 分钟刷新一次约为一周）
+    SNAPSHOT_STORE_MAX_SNAPSHOTS: int = int(os.getenv("SNAPSHOT_STORE_MAX_SNAPSHOTS", "336"))
 
     # 服务配置
     APP_NAME: str = "港股新股信息服务"
@@ -4,28 +4,147 @@
 提供港股新股信息的 RESTful API
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import os
+import sqlite3
 import sys
-from datetime import datetime
-from typing import Final
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Final, List, Optional, Set, Tuple
 
-from fastapi import FastAPI, HTTPException
+import httpx
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 
 from config import config
-from services import HKDataFetcher, HKDataProcessor, HKMarkdownFormatter
+from models import HKNewStockInfo, StockSnapshot
+from services import (
+    Deadline,
+    AsyncHKDataFetcher,
+    DiskCache,
+    HKDataFetcher,
+    HKDataProcessor,
+    HKMarkdownFormatter,
+    HostRateLimiter,
+    PooledSession,
+    RefreshScheduler,
+    ResponseCache,
+    RetryBudget,
+    RetryPolicy,
+    SingleFlight,
+    SnapshotStore,
+    SubscriptionWindowIndex,
+)
 
 # 常量定义
 DEFAULT_PORT: Final = 8002
 FUTURE_DAYS: Final = 14
+STOCKS_CACHE_KEY: Final = "stocks"
 SERVICE_NAME: Final = "港股"
 
 
+# 专用线程池：阻塞的上游请求和数据处理都在此执行，避免阻塞事件循环
+pipeline_executor = ThreadPoolExecutor(
+    max_workers=config.PIPELINE_WORKERS,
+    thread_name_prefix="hk-stock-pipeline"
+)
+
+# 已渲染响应的进程内缓存
+response_cache = ResponseCache(ttl=config.CACHE_TTL)
+
+# 详情页解析结果持久化缓存（板块、公司简介），重启后仍然有效
+detail_cache = DiskCache(
+    config.DETAIL_CACHE_PATH,
+    ttl=config.DETAIL_CACHE_TTL,
+    max_entries=config.DETAIL_CACHE_MAX_ENTRIES
+)
+
+# 进程内共享的 HTTP 连接池，列表页和详情页请求复用 keep-alive 连接
+http_pool = PooledSession(
+    pool_connections=config.HTTP_POOL_CONNECTIONS,
+    pool_maxsize=config.HTTP_POOL_MAXSIZE
+)
+
+# 进程内共享的自适应限流器，按上游主机限流，同步和异步获取器以及并发刷新之间共用
+rate_limiter = HostRateLimiter(
+    rate=config.RATE_LIMIT,
+    min_rate=min(1 / max(config.MAX_INTERVAL, 1), config.RATE_LIMIT),
+    max_rate=config.RATE_LIMIT_MAX,
+    burst=config.RATE_LIMIT_BURST,
+    slow_threshold=config.SLOW_RESPONSE_SECONDS
+)
+
+# 进程内共享的重试策略（带上限的指数退避，全抖动）；每次刷新另建重试预算
+retry_policy = RetryPolicy(
+    max_retries=config.MAX_RETRIES,
+    base_delay=config.RETRY_BASE_DELAY,
+    max_delay=config.RETRY_MAX_DELAY
+)
+
+# 异步获取使用的 httpx 客户端，启用 ASYNC_FETCH 时在应用启动时创建
+async_client: Optional[httpx.AsyncClient] = None
+
+# 数据快照持久化存储，重启后从最近一份快照恢复，并保留历史快照供查询
+snapshot_store = SnapshotStore(
+    config.SNAPSHOT_STORE_PATH,
+    HKNewStockInfo,
+    max_snapshots=config.SNAPSHOT_STORE_MAX_SNAPSHOTS
+)
+
+# 合并同一市场的并发刷新，所有调用方共享同一次执行结果
+refresh_flight = SingleFlight()
+
+# 最近一次成功刷新的数据快照
+latest_snapshot: Optional[StockSnapshot] = None
+
+# 当前快照的申购窗口索引，随快照一起重建
+latest_index: Optional[SubscriptionWindowIndex] = None
+
+# 正在执行的后台刷新任务（保留引用，避免任务被回收）
+background_tasks: Set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动和停止后台刷新任务"""
+    global async_client
+
+    if config.ASYNC_FETCH:
+        if config.RATE_LIMIT_BURST < config.FETCH_CONCURRENCY:
+            log_info(
+                f"ASYNC_FETCH 已启用，但限流令牌数 {config.RATE_LIMIT_BURST} 小于并发上限 {config.FETCH_CONCURRENCY}，"
+                f"详情页请求仍按 {config.RATE_LIMIT:g} 次/秒依次发出；需要提速时请调大 RATE_LIMIT 和 RATE_LIMIT_BURST"
+            )
+        async_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.HTTP_POOL_MAXSIZE,
+                max_keepalive_connections=config.HTTP_POOL_MAXSIZE
+            )
+        )
+    restored = await asyncio.get_running_loop().run_in_executor(pipeline_executor, _restore_snapshot)
+    if config.REFRESH_INTERVAL > 0:
+        # 恢复的快照在刷新间隔内时，推迟首次刷新，启动时不请求上游
+        scheduler.start(0 if restored is None else max(config.REFRESH_INTERVAL - restored.age_seconds(), 0))
+    yield
+    await scheduler.stop()
+    pipeline_executor.shutdown(wait=False, cancel_futures=True)
+    http_pool.close()
+    if async_client is not None:
+        await async_client.aclose()
+
+
 app = FastAPI(
     title=config.APP_NAME,
     version=config.VERSION,
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    lifespan=lifespan
 )
 
 
@@ -45,14 +164,664 @@ async def health_check() -> dict:
     return {
         "status": "ok",
         "service": "hk-stock",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "cache": response_cache.stats(),
+        "scheduler": scheduler.stats(),
+        "single_flight": refresh_flight.stats(),
+        "detail_cache": detail_cache.stats(),
+        "snapshot_store": snapshot_store.stats(),
+        "http_pool": http_pool.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "retry": retry_policy.stats(),
+        "snapshot_time": latest_snapshot.fetched_at.isoformat() if latest_snapshot else None,
+        "window_index": latest_index.stats() if latest_index else None
+    }
+
+
+def _create_fetcher(deadline: Optional[Deadline] = None) -> HKDataFetcher:
+    """创建同步数据获取器，每次刷新使用新的重试预算
+
+    Args:
+        deadline: 本次刷新的时限，为 None 时不限时
+
+    Returns:
+        HKDataFetcher: 数据获取器
+    """
+    return HKDataFetcher(
+        timeout=config.FETCH_TIMEOUT,
+        detail_cache=detail_cache,
+        negative_ttl=config.DETAIL_CACHE_NEGATIVE_TTL,
+        stream_detail=config.DETAIL_STREAMING,
+        session=http_pool,
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        retry_budget=RetryBudget(config.RETRY_BUDGET, config.RETRY_BUDGET_SECONDS),
+        deadline=deadline
+    )
+
+
+def _create_async_fetcher(deadline: Optional[Deadline] = None) -> AsyncHKDataFetcher:
+    """创建异步数据获取器，每次刷新使用新的重试预算
+
+    Args:
+        deadline: 本次刷新的时限，为 None 时不限时
+
+    Returns:
+        AsyncHKDataFetcher: 数据获取器
+    """
+    return AsyncHKDataFetcher(
+        async_client,
+        rate_limiter,
+        concurrency=config.FETCH_CONCURRENCY,
+        timeout=config.FETCH_TIMEOUT,
+        detail_cache=detail_cache,
+        negative_ttl=config.DETAIL_CACHE_NEGATIVE_TTL,
+        stream_detail=config.DETAIL_STREAMING,
+        retry_policy=retry_policy,
+        retry_budget=RetryBudget(config.RETRY_BUDGET, config.RETRY_BUDGET_SECONDS),
+        deadline=deadline
+    )
+
+
+def _load_snapshot(deadline: Optional[Deadline] = None, enrich: bool = True) -> StockSnapshot:
+    """从新浪财经获取港股新股数据并补充申购窗口内股票的详细信息
+
+    Args:
+        deadline: 本次刷新的时限，用完后不再请求详细信息，为 None 时不限时
+        enrich: 是否补充详细信息；为 False 时跳过补充，申购窗口内的股票全部记为未补充
+
+    Returns:
+        StockSnapshot: 新的数据快照
+    """
+    fetcher = _create_fetcher(deadline)
+    stocks = fetcher.fetch_hk_new_stocks()
+
+    if not stocks:
+        log_info("未获取到新股数据")
+        return StockSnapshot()
+
+    processor = HKDataProcessor()
+    valid_stocks = processor.validate_data(stocks)
+    subscribable_stocks, future_stocks, _ = processor.classify(valid_stocks, future_days=FUTURE_DAYS)
+
+    # 补充详细信息（仅对筛选后的股票）
+    all_stocks = subscribable_stocks + future_stocks
+    if not enrich:
+        return StockSnapshot(stocks=valid_stocks, unenriched=[stock.stock_code for stock in all_stocks])
+    if all_stocks:
+        # 记录为只读对象，用补充后的新记录替换快照中的原记录
+        enriched = dict(zip(map(id, all_stocks), fetcher.enrich_stocks_detail(all_stocks)))
+        valid_stocks = [enriched.get(id(stock), stock) for stock in valid_stocks]
+
+    return StockSnapshot(stocks=valid_stocks, unenriched=fetcher.unenriched)
+
+
+async def _load_snapshot_async(deadline: Optional[Deadline] = None, enrich: bool = True) -> StockSnapshot:
+    """异步获取港股新股数据，并发补充申购窗口内股票的详细信息
+
+    Args:
+        deadline: 本次刷新的时限，用完后不再请求详细信息，为 None 时不限时
+        enrich: 是否补充详细信息；为 False 时跳过补充，申购窗口内的股票全部记为未补充
+
+    Returns:
+        StockSnapshot: 新的数据快照
+    """
+    fetcher = _create_async_fetcher(deadline)
+    stocks = await fetcher.fetch_hk_new_stocks()
+
+    if not stocks:
+        log_info("未获取到新股数据")
+        return StockSnapshot()
+
+    processor = HKDataProcessor()
+    valid_stocks = processor.validate_data(stocks)
+    subscribable_stocks, future_stocks, _ = processor.classify(valid_stocks, future_days=FUTURE_DAYS)
+
+    all_stocks = subscribable_stocks + future_stocks
+    if not enrich:
+        return StockSnapshot(stocks=valid_stocks, unenriched=[stock.stock_code for stock in all_stocks])
+    if all_stocks:
+        enriched = dict(zip(map(id, all_stocks), await fetcher.enrich_stocks_detail(all_stocks)))
+        valid_stocks = [enriched.get(id(stock), stock) for stock in valid_stocks]
+
+    return StockSnapshot(stocks=valid_stocks, unenriched=fetcher.unenriched)
+
+
+def _enrich_snapshot(snapshot: StockSnapshot) -> StockSnapshot:
+    """补充快照中尚未补充详细信息的股票，不重新获取新股列表
+
+    Args:
+        snapshot: 不完整的数据快照
+
+    Returns:
+        StockSnapshot: 补充后的新快照（列表获取时间不变，记录补充完成时间）
+    """
+    pending = set(snapshot.unenriched)
+    targets = [stock for stock in snapshot.stocks if stock.stock_code in pending]
+
+    fetcher = _create_fetcher()
+    enriched = dict(zip(map(id, targets), fetcher.enrich_stocks_detail(targets)))
+    stocks = [enriched.get(id(stock), stock) for stock in snapshot.stocks]
+
+    return dataclasses.replace(snapshot, stocks=stocks, unenriched=fetcher.unenriched, enriched_at=datetime.now())
+
+
+async def _enrich_snapshot_async(snapshot: StockSnapshot) -> StockSnapshot:
+    """异步补充快照中尚未补充详细信息的股票，行为与 _enrich_snapshot 相同
+
+    Args:
+        snapshot: 不完整的数据快照
+
+    Returns:
+        StockSnapshot: 补充后的新快照（列表获取时间不变，记录补充完成时间）
+    """
+    pending = set(snapshot.unenriched)
+    targets = [stock for stock in snapshot.stocks if stock.stock_code in pending]
+
+    fetcher = _create_async_fetcher()
+    enriched = dict(zip(map(id, targets), await fetcher.enrich_stocks_detail(targets)))
+    stocks = [enriched.get(id(stock), stock) for stock in snapshot.stocks]
+
+    return dataclasses.replace(snapshot, stocks=stocks, unenriched=fetcher.unenriched, enriched_at=datetime.now())
+
+
+def _install_snapshot(snapshot: StockSnapshot, persist: bool = True) -> StockSnapshot:
+    """保存快照，替换当前快照、重建申购窗口索引并清空响应缓存
+
+    上游返回空数据时视为刷新失败：已有快照时保留上一份快照，尚无快照时抛出异常，不缓存空数据。
+    已有快照 ID 的快照（补充详细信息后的快照）以原快照为基础另存为新快照；保存失败不影响替换
+
+    Args:
+        snapshot: 新获取的数据快照
+        persist: 是否保存到快照存储
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+
+    Raises:
+        RuntimeError: 上游返回空数据且尚无快照时
+    """
+    global latest_snapshot, latest_index
+
+    if not snapshot.stocks:
+        if latest_snapshot is None:
+            raise RuntimeError(f"{SERVICE_NAME} 刷新得到空数据")
+        log_error(f"{SERVICE_NAME} 刷新得到空数据，保留上一份快照")
+        return latest_snapshot
+
+    if persist and snapshot.stocks:
+        try:
+            snapshot.snapshot_id = snapshot_store.save(snapshot, base_id=snapshot.snapshot_id)
+        except sqlite3.Error as e:
+            log_error(f"{SERVICE_NAME} 保存快照失败: {e}")
+
+    latest_index = SubscriptionWindowIndex(snapshot.stocks, fetched_at=snapshot.fetched_at, version=snapshot.version)
+    latest_snapshot = snapshot
+    response_cache.invalidate()
+    log_info(f"{SERVICE_NAME} 数据快照已刷新，共 {len(snapshot.stocks)} 条")
+    return snapshot
+
+
+def _restore_snapshot() -> Optional[StockSnapshot]:
+    """从快照存储恢复最近一份快照，超过最大陈旧时间的快照不恢复
+
+    Returns:
+        Optional[StockSnapshot]: 恢复的快照，没有可用快照时返回 None
+    """
+    try:
+        snapshot = snapshot_store.load()
+    except sqlite3.Error as e:
+        log_error(f"{SERVICE_NAME} 读取快照存储失败: {e}")
+        return None
+
+    if snapshot is None or not snapshot.stocks:
+        return None
+    if snapshot.age_seconds() > config.MAX_STALENESS:
+        log_info(f"{SERVICE_NAME} 快照存储中的最近快照已过旧，不恢复")
+        return None
+
+    _install_snapshot(snapshot, persist=False)
+    log_info(f"{SERVICE_NAME} 已从快照存储恢复快照 {snapshot.snapshot_id}（生成于 {snapshot.fetched_at.isoformat()}）")
+    return snapshot
+
+
+def refresh_snapshot(deadline: Optional[Deadline] = None, enrich: bool = True) -> StockSnapshot:
+    """刷新数据快照
+
+    刷新成功后替换当前快照、重建申购窗口索引并清空响应缓存；上游返回空数据而已有快照时，
+    视为刷新失败，保留上一份快照
+
+    Args:
+        deadline: 本次刷新的时限，为 None 时不限时
+        enrich: 是否补充详细信息，为 False 时只获取新股列表
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+
+    Raises:
+        Exception: 当数据获取失败时
+    """
+    return _install_snapshot(_load_snapshot(deadline, enrich))
+
+
+async def refresh_snapshot_async(deadline: Optional[Deadline] = None, enrich: bool = True) -> StockSnapshot:
+    """异步刷新数据快照，行为与 refresh_snapshot 相同
+
+    Args:
+        deadline: 本次刷新的时限，为 None 时不限时
+        enrich: 是否补充详细信息，为 False 时只获取新股列表
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+
+    Raises:
+        Exception: 当数据获取失败时
+    """
+    snapshot = await _load_snapshot_async(deadline, enrich)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pipeline_executor, _install_snapshot, snapshot)
+
+
+def _install_enriched(snapshot: StockSnapshot, enriched: StockSnapshot) -> Optional[StockSnapshot]:
+    """用补充后的快照替换当前快照
+
+    补充期间当前快照已被其他刷新替换时，丢弃补充结果
+
+    Args:
+        snapshot: 补充前的不完整快照
+        enriched: 补充后的快照
+
+    Returns:
+        Optional[StockSnapshot]: 替换后的快照，补充结果被丢弃时返回 None
+    """
+    if latest_snapshot is not snapshot:
+        log_info(f"{SERVICE_NAME} 快照在补充期间已被替换，丢弃补充结果")
+        return None
+
+    installed = _install_snapshot(enriched)
+    log_info(f"{SERVICE_NAME} 已在后台补充 {len(snapshot.unenriched) - len(enriched.unenriched)} 只股票的详细信息")
+    return installed
+
+
+def enrich_snapshot(snapshot: StockSnapshot) -> StockSnapshot:
+    """补全不完整的快照并替换当前快照，完成后通知 ENRICH_CALLBACK_URL
+
+    Args:
+        snapshot: 不完整的数据快照
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+    """
+    installed = _install_enriched(snapshot, _enrich_snapshot(snapshot))
+    if installed is None:
+        return latest_snapshot
+    _notify_enriched(installed)
+    return installed
+
+
+async def enrich_snapshot_async(snapshot: StockSnapshot) -> StockSnapshot:
+    """异步补全不完整的快照，行为与 enrich_snapshot 相同；保存和通知在专用线程池中执行
+
+    Args:
+        snapshot: 不完整的数据快照
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+    """
+    enriched = await _enrich_snapshot_async(snapshot)
+    loop = asyncio.get_running_loop()
+    installed = await loop.run_in_executor(pipeline_executor, _install_enriched, snapshot, enriched)
+    if installed is None:
+        return latest_snapshot
+    await loop.run_in_executor(pipeline_executor, _notify_enriched, installed)
+    return installed
+
+
+def _notify_enriched(snapshot: StockSnapshot) -> None:
+    """将补全后的默认查询结果 POST 到 ENRICH_CALLBACK_URL，未配置时不通知
+
+    Args:
+        snapshot: 补全后的数据快照
+    """
+    if not config.ENRICH_CALLBACK_URL:
+        return
+
+    as_of = datetime.now().date()
+    body = {
+        **_render_snapshot(snapshot, as_of),
+        "as_of": as_of.isoformat(),
+        "future_days": FUTURE_DAYS,
+        "stale": False,
+        "age_seconds": int(snapshot.age_seconds())
     }
+    request = urllib.request.Request(
+        config.ENRICH_CALLBACK_URL,
+        data=json.dumps(body, ensure_ascii=False).encode("utf-8"),
+        headers={"Content-Type": "application/json; charset=utf-8"},
+        method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=config.FETCH_TIMEOUT) as response:
+            log_info(f"已通知 {SERVICE_NAME} 补充完成: HTTP {response.status}")
+    except Exception as e:
+        log_error(f"{SERVICE_NAME} 补充完成通知失败: {e}")
+
+
+def _get_index(snapshot: StockSnapshot) -> SubscriptionWindowIndex:
+    """获取与快照对应的申购窗口索引
+
+    Args:
+        snapshot: 数据快照
+
+    Returns:
+        SubscriptionWindowIndex: 快照的索引，快照已被替换时临时重建
+    """
+    index = latest_index
+    if index is not None and index.version == snapshot.version:
+        return index
+    return SubscriptionWindowIndex(snapshot.stocks, fetched_at=snapshot.fetched_at, version=snapshot.version)
+
+
+def _missing_details(snapshot: StockSnapshot, stocks: List[HKNewStockInfo]) -> Tuple[List[str], List[str]]:
+    """找出本次输出中没有详细信息的股票
+
+    快照只补充列表获取当天申购窗口内股票的详细信息，按其他基准日期查询时，
+    窗口外的股票不会补充
+
+    Args:
+        snapshot: 数据快照
+        stocks: 本次输出的股票
+
+    Returns:
+        Tuple[List[str], List[str]]: (后台正在补充的股票代码, 不在补充范围内的股票代码)
+    """
+    unenriched = set(snapshot.unenriched)
+    in_scope = {stock.stock_code for group in _get_index(snapshot).query(snapshot.fetched_at.date(), FUTURE_DAYS)
+                for stock in group}
+    pending = [stock.stock_code for stock in stocks if stock.stock_code in unenriched]
+    out_of_scope = [stock.stock_code for stock in stocks if stock.stock_code not in in_scope]
+    return pending, out_of_scope
+
+
+def _render_snapshot(snapshot: StockSnapshot, as_of: date, future_days: int = FUTURE_DAYS) -> dict:
+    """按基准日期查询并格式化快照数据
+
+    Args:
+        snapshot: 数据快照
+        as_of: 基准日期
+        future_days: 查询未来天数
+
+    Returns:
+        dict: 渲染完成的响应体
+    """
+    if not snapshot.stocks:
+        return {
+            "success": True,
+            "market": SERVICE_NAME,
+            "data": "",
+            "subscribable_count": 0,
+            "future_count": 0,
+            "partial": False,
+            "unenriched": []
+        }
+
+    subscribable_stocks, future_stocks = _get_index(snapshot).query(as_of, future_days)
+
+    pending, out_of_scope = _missing_details(snapshot, subscribable_stocks + future_stocks)
+
+    formatter = HKMarkdownFormatter()
+    markdown = formatter.format_new_stocks(
+        subscribable_stocks, future_stocks, future_days=future_days, unenriched=pending, out_of_scope=out_of_scope
+    )
+
+    log_info(f"成功返回 {SERVICE_NAME} 数据 - 可申购: {len(subscribable_stocks)}, 未来: {len(future_stocks)}")
+
+    return {
+        "success": True,
+        "market": SERVICE_NAME,
+        "data": markdown,
+        "subscribable_count": len(subscribable_stocks),
+        "future_count": len(future_stocks),
+        "partial": bool(pending),
+        "unenriched": pending + out_of_scope
+    }
+
+
+def _content_etag(snapshot: StockSnapshot, as_of: date, future_days: int) -> str:
+    """计算查询结果的内容哈希，作为弱 ETag
+
+    只取决于本次输出的股票记录和其中尚未补充详细信息的股票，与生成时间、快照时间无关，
+    两次刷新之间数据不变时 ETag 不变。只查询索引、不格式化，开销很小
+
+    Args:
+        snapshot: 数据快照
+        as_of: 基准日期
+        future_days: 查询未来天数
+
+    Returns:
+        str: 弱 ETag（W/"..."）
+    """
+    subscribable_stocks, future_stocks = _get_index(snapshot).query(as_of, future_days) if snapshot.stocks else ([], [])
+    missing = _missing_details(snapshot, subscribable_stocks + future_stocks) if snapshot.stocks else ([], [])
+
+    # 记录为只读数据类，repr 包含全部字段且结果稳定
+    content = repr((as_of, future_days, subscribable_stocks, future_stocks, missing))
+    return f'W/"{hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """按条件请求头判断客户端缓存是否仍然有效
+
+    If-None-Match 优先（弱比较）；没有 If-None-Match 时才检查 If-Modified-Since
+
+    Args:
+        request: 请求
+        etag: 当前内容的 ETag
+        last_modified: 当前内容的最后修改时间（UTC）
+
+    Returns:
+        bool: 客户端缓存有效时返回 True
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 日期只精确到秒
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _cache_headers(snapshot: StockSnapshot, etag: str, stale: bool, last_modified: datetime) -> dict:
+    """生成 /api/stocks 的缓存相关响应头
+
+    过期数据和不完整数据（后台正在刷新或补充）要求客户端每次验证；其他情况下允许缓存
+    HTTP_CACHE_MAX_AGE 秒，且不超过快照剩余的有效期
+
+    Args:
+        snapshot: 数据快照
+        etag: 内容的 ETag
+        stale: 是否为过期数据
+        last_modified: 最后修改时间（UTC）
+
+    Returns:
+        dict: ETag、Last-Modified 和 Cache-Control
+    """
+    max_age = min(config.HTTP_CACHE_MAX_AGE, int(config.SNAPSHOT_TTL - snapshot.age_seconds()))
+    if stale or snapshot.partial or max_age <= 0:
+        cache_control = "no-cache"
+    else:
+        cache_control = f"public, max-age={max_age}"
+
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": cache_control
+    }
+
+
+async def refresh_snapshot_shared(deadline: Optional[Deadline] = None, enrich: bool = True) -> StockSnapshot:
+    """刷新数据快照，并发调用合并为一次执行
+
+    启用 ASYNC_FETCH 时在事件循环中异步获取，否则在专用线程池中执行同步获取
+
+    时限和是否补充详细信息由发起刷新的调用方决定，合并进来的调用方共享同一次刷新，
+    但只按自己的时限等待，超时后刷新继续执行；后台刷新不限时
+
+    Args:
+        deadline: 本次刷新的时限，为 None 时不限时
+        enrich: 是否补充详细信息
+
+    Returns:
+        StockSnapshot: 当前生效的数据快照
+
+    Raises:
+        TimeoutError: 合并进来的调用方在时限内没有等到刷新完成时
+    """
+    timeout = deadline.remaining() if deadline is not None else None
+    if async_client is not None:
+        return await refresh_flight.do(SERVICE_NAME, lambda: refresh_snapshot_async(deadline, enrich), timeout)
+
+    loop = asyncio.get_running_loop()
+    return await refresh_flight.do(
+        SERVICE_NAME,
+        lambda: loop.run_in_executor(pipeline_executor, refresh_snapshot, deadline, enrich),
+        timeout
+    )
+
+
+def _schedule_background_refresh() -> None:
+    """在后台刷新快照，已有刷新在执行时不重复发起"""
+    if refresh_flight.in_flight(SERVICE_NAME):
+        return
+
+    def _on_done(task: asyncio.Task) -> None:
+        background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log_error(f"{SERVICE_NAME} 后台刷新失败: {task.exception()}")
+
+    task = asyncio.ensure_future(refresh_snapshot_shared())
+    background_tasks.add(task)
+    task.add_done_callback(_on_done)
+
+
+def _schedule_background_enrichment(snapshot: StockSnapshot) -> None:
+    """在后台补全不完整的快照
+
+    与刷新共用同一个合并键，补充和刷新不会同时执行；快照完整或已有刷新在执行时不发起
+
+    Args:
+        snapshot: 当前数据快照
+    """
+    if not snapshot.partial or refresh_flight.in_flight(SERVICE_NAME):
+        return
+
+    def _on_done(task: asyncio.Task) -> None:
+        background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log_error(f"{SERVICE_NAME} 后台补充详细信息失败: {task.exception()}")
+
+    if async_client is not None:
+        task = asyncio.ensure_future(refresh_flight.do(SERVICE_NAME, lambda: enrich_snapshot_async(snapshot)))
+    else:
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(refresh_flight.do(
+            SERVICE_NAME,
+            lambda: loop.run_in_executor(pipeline_executor, enrich_snapshot, snapshot)
+        ))
+    background_tasks.add(task)
+    task.add_done_callback(_on_done)
+
+
+async def _get_serving_snapshot(deadline: Optional[Deadline] = None,
+                                fast: bool = False) -> Tuple[StockSnapshot, bool]:
+    """获取用于响应的数据快照
+
+    - 快照未过期：直接返回
+    - 快照已过期但未超过最大陈旧时间，且启用了 SERVE_STALE：立即返回旧快照，后台刷新
+    - 其他情况：在请求时限内等待刷新完成；刷新失败或超时，未超过最大陈旧时间的旧快照仍可返回
+
+    快速模式下等待的刷新只获取新股列表。返回的快照不完整（有股票未补充详细信息）时在后台补全
+
+    Args:
+        deadline: 本次请求的时限，仅用于需要等待的刷新
+        fast: 是否启用快速模式
+
+    Returns:
+        Tuple[StockSnapshot, bool]: (数据快照, 是否为过期数据)
+
+    Raises:
+        HTTPException: 刷新失败或超时且没有可用快照时返回 503
+    """
+    snapshot = latest_snapshot
+
+    # 尚无快照时刷新一次（与并发请求共享）
+    if snapshot is None:
+        try:
+            snapshot = await refresh_snapshot_shared(deadline, enrich=not fast)
+        except TimeoutError:
+            raise HTTPException(status_code=503, detail="数据刷新未在请求时限内完成，请稍后重试")
+        except Exception as e:
+            log_error(f"{SERVICE_NAME} 刷新失败且没有可用快照: {e}")
+            raise HTTPException(status_code=503, detail=f"数据刷新失败: {e}")
+        _schedule_background_enrichment(snapshot)
+        return snapshot, False
+
+    age = snapshot.age_seconds()
+    if age <= config.SNAPSHOT_TTL:
+        _schedule_background_enrichment(snapshot)
+        return snapshot, False
+
+    if config.SERVE_STALE and age <= config.MAX_STALENESS:
+        log_info(f"{SERVICE_NAME} 快照已过期 {age:.0f} 秒，返回旧数据并在后台刷新")
+        _schedule_background_refresh()
+        return snapshot, True
+
+    try:
+        refreshed = await refresh_snapshot_shared(deadline, enrich=not fast)
+    except Exception as e:
+        if age > config.MAX_STALENESS:
+            raise HTTPException(status_code=503, detail=f"数据刷新失败且缓存数据已过旧: {e}")
+        log_error(f"{SERVICE_NAME} 刷新失败，返回过期数据: {e}")
+        return snapshot, True
+
+    # 刷新得到空数据时会保留旧快照，此时仍需检查陈旧程度
+    refreshed_age = refreshed.age_seconds()
+    if refreshed_age > config.MAX_STALENESS:
+        raise HTTPException(status_code=503, detail="数据刷新失败且缓存数据已过旧")
+    _schedule_background_enrichment(refreshed)
+    return refreshed, refreshed_age > config.SNAPSHOT_TTL
+
+
+# 后台定时刷新数据快照
+scheduler = RefreshScheduler(refresh_snapshot_shared, interval=config.REFRESH_INTERVAL)
 
 
 @app.get("/api/stocks")
-async def get_new_stocks() -> dict:
+async def get_new_stocks(
+    request: Request,
+    response: Response,
+    as_of: Optional[date] = Query(None, description="基准日期（YYYY-MM-DD），默认为今天"),
+    future_days: int = Query(FUTURE_DAYS, ge=0, le=366, description="查询未来天数"),
+    deadline: Optional[float] = Query(None, gt=0, le=300, description="请求时限（秒），默认为 REQUEST_DEADLINE"),
+    fast: Optional[bool] = Query(None, description="快速模式：需要等待刷新时只获取新股列表，默认为 FAST_MODE")
+) -> dict:
     """获取港股新股信息
 
+    Args:
+        as_of: 基准日期，查询该日可申购及之后 future_days 天内开放申购的新股
+        future_days: 查询未来天数
+        deadline: 请求时限，需要等待刷新时，用完后不再请求详细信息并返回已有数据
+        fast: 快速模式，需要等待刷新时不补充详细信息，立即返回新股列表并在后台补充
+
     Returns:
         包含新股信息的响应，字段包括:
         - success: 是否成功
@@ -60,54 +829,187 @@ async def get_new_stocks() -> dict:
         - data: Markdown 格式的新股信息
         - subscribable_count: 当前可申购新股数量
         - future_count: 未来新股数量
+        - as_of: 基准日期
+        - future_days: 查询未来天数
+        - stale: 是否为过期数据（后台正在刷新）
+        - age_seconds: 数据快照的年龄（秒）
+        - partial: 是否有股票尚未补充详细信息（后台正在补充）
+        - unenriched: 没有详细信息的股票代码，包括后台正在补充的股票，以及按其他基准日期查询时
+          不在列表获取当天申购窗口内、不会补充的股票（后者不计入 partial）
+        - snapshot_id: 数据快照的 ID，可作为 /api/stocks/changes 的 since 参数
+
+        响应头包含内容哈希 ETag、Last-Modified（快照内容最后变化的时间）和 Cache-Control；
+        请求头 If-None-Match 或 If-Modified-Since 与之匹配时返回 304，不渲染响应体
     """
+    # 时限从收到请求时开始计算
+    request_deadline = Deadline(deadline or config.REQUEST_DEADLINE)
+
     try:
         log_info(f"收到 {SERVICE_NAME} 新股信息请求")
 
-        fetcher = HKDataFetcher(
-            timeout=config.FETCH_TIMEOUT,
-            min_interval=config.MIN_INTERVAL
+        snapshot, stale = await _get_serving_snapshot(
+            request_deadline, fast=config.FAST_MODE if fast is None else fast
         )
-        stocks = fetcher.fetch_hk_new_stocks()
-
-        if not stocks:
-            log_info("未获取到新股数据")
-            return {
-                "success": True,
-                "market": SERVICE_NAME,
-                "data": "",
-                "subscribable_count": 0,
-                "future_count": 0
-            }
-
-        processor = HKDataProcessor()
-        valid_stocks = processor.validate_data(stocks)
-        subscribable_stocks = processor.filter_subscribable_stocks(valid_stocks)
-        future_stocks = processor.filter_future_unopened_stocks(valid_stocks, future_days=FUTURE_DAYS)
+        as_of = as_of or datetime.now().date()
 
-        # 补充详细信息（仅对筛选后的股票）
-        all_stocks = subscribable_stocks + future_stocks
-        if all_stocks:
-            all_stocks = fetcher.enrich_stocks_detail(all_stocks)
+        etag = _content_etag(snapshot, as_of, future_days)
+        last_modified = snapshot.updated_at.astimezone(timezone.utc)
+        headers = _cache_headers(snapshot, etag, stale, last_modified)
+        if _is_not_modified(request, etag, last_modified):
+            log_info(f"{SERVICE_NAME} 数据未变化，返回 304")
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
 
-        formatter = HKMarkdownFormatter()
-        markdown = formatter.format_new_stocks(subscribable_stocks, future_stocks)
-
-        log_info(f"成功返回 {SERVICE_NAME} 数据 - 可申购: {len(subscribable_stocks)}, 未来: {len(future_stocks)}")
+        # 缓存键包含快照版本和查询参数，缓存内容总是对应当前快照（补充详细信息后版本随之变化）
+        cache_key = f"{STOCKS_CACHE_KEY}@{snapshot.version}:{as_of.isoformat()}:{future_days}"
+        body = response_cache.get(cache_key)
+        if body is not None:
+            log_info(f"命中 {SERVICE_NAME} 响应缓存")
+        else:
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(
+                pipeline_executor, _render_snapshot, snapshot, as_of, future_days
+            )
+            response_cache.set(cache_key, body)
 
         return {
-            "success": True,
-            "market": SERVICE_NAME,
-            "data": markdown,
-            "subscribable_count": len(subscribable_stocks),
-            "future_count": len(future_stocks)
+            **body,
+            "as_of": as_of.isoformat(),
+            "future_days": future_days,
+            "stale": stale,
+            "age_seconds": int(snapshot.age_seconds()),
+            "snapshot_id": snapshot.snapshot_id
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         log_error(f"获取 {SERVICE_NAME} 数据失败: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.delete("/api/cache/detail/{stock_code}")
+async def invalidate_detail_cache(stock_code: str) -> dict:
+    """删除单只股票的详情缓存，下次刷新时重新请求详情页
+
+    Args:
+        stock_code: 股票代码
+
+    Returns:
+        dict: 包含股票代码和缓存条目是否存在
+    """
+    loop = asyncio.get_running_loop()
+    invalidated = await loop.run_in_executor(pipeline_executor, detail_cache.invalidate, stock_code)
+    log_info(f"删除股票 {stock_code} 的详情缓存: {'成功' if invalidated else '无缓存'}")
+
+    return {
+        "success": True,
+        "stock_code": stock_code,
+        "invalidated": invalidated
+    }
+
+
+@app.get("/api/stocks/changes")
+async def get_stock_changes(
+    since: str = Query(..., description="起始快照 ID，或起始时间（ISO 8601，如 2026-01-05T08:00:00）")
+) -> dict:
+    """获取起始快照（或时间）之后新增、删除和字段变化的新股
+
+    变化在快照写入时计算并保存，同一只股票的多次变化合并为一条净变化
+
+    Args:
+        since: 起始快照 ID（不含该快照写入时已有的变化），或起始时间（不含）。
+            补充详细信息后的快照另有新的 ID，补充前拿到的 ID 仍能查询到补充带来的变化
+
+    Returns:
+        包含变化的响应，字段包括:
+        - since: 起始时间
+        - snapshot_id: 当前快照的 ID，可作为下一次查询的 since
+        - added / removed: 新增 / 删除的股票记录
+        - modified: 字段有变化的股票，包含股票代码、名称和 {字段: {"old", "new"}}
+        - count: 变化的股票数
+        - complete: 是否包含全部变化；为 False 时起始之后的部分快照已被清理，应重新获取全量数据
+
+    Raises:
+        HTTPException: since 格式错误时返回 400，快照不存在或已被清理时返回 404
+    """
+    loop = asyncio.get_running_loop()
+
+    if since.isdigit():
+        since_time = await loop.run_in_executor(pipeline_executor, snapshot_store.snapshot_time, int(since))
+        if since_time is None:
+            raise HTTPException(status_code=404, detail=f"快照 {since} 不存在或已被清理")
+    else:
+        try:
+            since_time = datetime.fromisoformat(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="since 应为快照 ID 或 ISO 8601 格式的时间")
+        # 快照时间为本地时间，带时区的时间先转换为本地时间
+        if since_time.tzinfo is not None:
+            since_time = since_time.astimezone().replace(tzinfo=None)
+
+    changes = await loop.run_in_executor(pipeline_executor, snapshot_store.changes_since, since_time)
+    snapshot = latest_snapshot
+    log_info(f"返回 {SERVICE_NAME} {since_time.isoformat()} 之后的变化")
+
+    return {
+        "success": True,
+        "market": SERVICE_NAME,
+        "since": since_time.isoformat(),
+        "snapshot_id": snapshot.snapshot_id if snapshot else None,
+        "snapshot_time": snapshot.fetched_at.isoformat() if snapshot else None,
+        **changes,
+        "count": len(changes["added"]) + len(changes["removed"]) + len(changes["modified"])
+    }
+
+
+@app.get("/api/snapshots")
+async def list_snapshots(
+    limit: int = Query(50, ge=1, le=1000, description="最多返回的快照数")
+) -> dict:
+    """列出快照存储中最近的快照
+
+    Args:
+        limit: 最多返回的快照数
+
+    Returns:
+        dict: 快照列表（按时间倒序），包含快照 ID、获取时间和股票数
+    """
+    loop = asyncio.get_running_loop()
+    snapshots = await loop.run_in_executor(pipeline_executor, snapshot_store.list_snapshots, limit)
+
+    return {
+        "success": True,
+        "market": SERVICE_NAME,
+        "snapshots": snapshots
+    }
+
+
+@app.get("/api/stocks/{stock_code}/history")
+async def get_stock_history(
+    stock_code: str,
+    limit: int = Query(50, ge=1, le=1000, description="最多返回的快照数")
+) -> dict:
+    """查询单只股票在历史快照中的记录，无需重新请求上游
+
+    Args:
+        stock_code: 股票代码
+        limit: 最多返回的快照数
+
+    Returns:
+        dict: 该股票在各快照中的记录（按时间倒序）
+    """
+    loop = asyncio.get_running_loop()
+    history = await loop.run_in_executor(pipeline_executor, snapshot_store.stock_history, stock_code, limit)
+
+    return {
+        "success": True,
+        "market": SERVICE_NAME,
+        "stock_code": stock_code,
+        "history": history
+    }
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc) -> JSONResponse:
     """全局异常处理器"""
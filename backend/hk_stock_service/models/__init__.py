@@ -1,5 +1,7 @@
 """数据模型模块"""
 
 from .stock import HKNewStockInfo
+from .snapshot import StockSnapshot
+from .columnar import ColumnarStocks
 
-__all__ = ["HKNewStockInfo"]
+__all__ = ["HKNewStockInfo", "StockSnapshot", "ColumnarStocks"]
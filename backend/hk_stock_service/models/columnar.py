@@ -0,0 +1,139 @@
+"""
+列式港股新股记录容器
+
+按列紧凑保存大量港股新股记录，适合在内存中长期保留多份快照
+"""
+
+import math
+import sys
+from array import array
+from dataclasses import fields
+from datetime import date, datetime, timedelta
+from typing import Any, Iterator, List, Union, get_args, get_origin, get_type_hints
+
+from .stock import HKNewStockInfo
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MISSING_DATETIME = -2 ** 63
+_MISSING_DATE = 0
+
+
+def _column_kind(hint: Any) -> type:
+    """获取字段的基础类型（去掉 Optional 包装）"""
+    if get_origin(hint) is Union:
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+class ColumnarStocks:
+    """列式港股新股记录容器
+
+    按字段类型选择每一列的存储方式：
+
+    - float：array('d')，缺失值记为 NaN
+    - datetime：array('q')，保存距 1970-01-01 的微秒数
+    - date：array('i')，保存日期序数，缺失值记为 0
+    - market、industry 等取值有限的字符串：sys.intern 后所有记录共享同一对象
+    - 其他字段：普通列表
+
+    容器只读，按下标访问时还原为 HKNewStockInfo
+    """
+
+    __slots__ = ("_names", "_kinds", "_columns", "_length")
+
+    INTERNED_FIELDS = ("market", "industry")
+
+    def __init__(self, stocks: List[HKNewStockInfo]):
+        """按列保存新股记录
+
+        Args:
+            stocks: 港股新股信息列表
+        """
+        hints = get_type_hints(HKNewStockInfo)
+        self._names = [field.name for field in fields(HKNewStockInfo)]
+        self._kinds = {name: _column_kind(hints[name]) for name in self._names}
+        self._columns = {
+            name: self._encode(name, [getattr(stock, name) for stock in stocks])
+            for name in self._names
+        }
+        self._length = len(stocks)
+
+    def __len__(self) -> int:
+        """记录数量"""
+        return self._length
+
+    def __getitem__(self, index: int) -> HKNewStockInfo:
+        """还原指定下标的记录
+
+        Args:
+            index: 记录下标，支持负数
+
+        Returns:
+            HKNewStockInfo: 港股新股信息
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarStocks index out of range")
+
+        return HKNewStockInfo(**{
+            name: self._decode(name, self._columns[name][index])
+            for name in self._names
+        })
+
+    def __iter__(self) -> Iterator[HKNewStockInfo]:
+        """依次还原全部记录"""
+        for index in range(self._length):
+            yield self[index]
+
+    def column(self, name: str) -> List[Any]:
+        """读取单个字段的全部取值
+
+        Args:
+            name: 字段名
+
+        Returns:
+            List[Any]: 按记录顺序排列的字段值，缺失值为 None
+        """
+        return [self._decode(name, value) for value in self._columns[name]]
+
+    def to_records(self) -> List[HKNewStockInfo]:
+        """还原为记录列表
+
+        Returns:
+            List[HKNewStockInfo]: 港股新股信息列表
+        """
+        return list(self)
+
+    def _encode(self, name: str, values: List[Any]) -> Union[array, List[Any]]:
+        """按字段类型编码一列"""
+        kind = self._kinds[name]
+
+        if kind is float:
+            return array("d", (math.nan if value is None else value for value in values))
+        # datetime 是 date 的子类，需先判断
+        if kind is datetime:
+            return array("q", (
+                _MISSING_DATETIME if value is None else (value - _EPOCH) // _MICROSECOND
+                for value in values
+            ))
+        if kind is date:
+            return array("i", (_MISSING_DATE if value is None else value.toordinal() for value in values))
+        if name in self.INTERNED_FIELDS:
+            return [None if value is None else sys.intern(value) for value in values]
+        return list(values)
+
+    def _decode(self, name: str, value: Any) -> Any:
+        """将列中保存的值还原为字段值"""
+        kind = self._kinds[name]
+
+        if kind is float:
+            return None if math.isnan(value) else value
+        if kind is datetime:
+            return None if value == _MISSING_DATETIME else _EPOCH + value * _MICROSECOND
+        if kind is date:
+            return None if value == _MISSING_DATE else date.fromordinal(value)
+        return value
@@ -0,0 +1,54 @@
+"""
+港股新股数据快照模型
+
+保存一次完整刷新得到的港股新股数据
+"""
+
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from .stock import HKNewStockInfo
+
+# 快照版本号，进程内每个快照对象唯一
+_versions = itertools.count(1)
+
+
+@dataclass
+class StockSnapshot:
+    """港股新股数据快照
+
+    Attributes:
+        stocks: 验证通过的港股新股列表（申购窗口内的股票已补充详细信息）
+        fetched_at: 新股列表的获取时间，后台补充详细信息不会改变
+        unenriched: 尚未补充详细信息的股票代码（请求时限用完或快速模式下跳过补充，由后台补全）
+        snapshot_id: 快照在快照存储中的 ID，未保存时为 None
+        enriched_at: 后台补充详细信息完成的时间，未补充过时为 None
+        version: 快照内容的版本号，每个快照对象（包括补充后通过 dataclasses.replace 生成的快照）
+            各不相同，申购窗口索引和响应缓存以此判断是否对应同一份数据
+    """
+    stocks: List[HKNewStockInfo] = field(default_factory=list)
+    fetched_at: datetime = field(default_factory=datetime.now)
+    unenriched: List[str] = field(default_factory=list)
+    snapshot_id: Optional[int] = None
+    enriched_at: Optional[datetime] = None
+    version: int = field(init=False, default_factory=lambda: next(_versions))
+
+    @property
+    def updated_at(self) -> datetime:
+        """快照内容最后一次变化的时间（补充详细信息完成时间或列表获取时间）"""
+        return self.enriched_at or self.fetched_at
+
+    @property
+    def partial(self) -> bool:
+        """是否有股票未补充详细信息"""
+        return bool(self.unenriched)
+
+    def age_seconds(self) -> float:
+        """获取快照已存在的时长
+
+        Returns:
+            float: 距快照生成的秒数
+        """
+        return (datetime.now() - self.fetched_at).total_seconds()
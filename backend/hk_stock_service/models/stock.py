@@ -5,23 +5,28 @@
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HKNewStockInfo:
     """港股新股信息模型
 
     包含港股新股发行的所有关键信息
+    记录为只读对象（frozen，使用 __slots__ 节省内存），修改字段需通过 dataclasses.replace 生成新记录
 
     Attributes:
         stock_code: 股票代码（如 "00700"）
         stock_name: 股票名称（中文，如 "腾讯控股"）
         stock_name_en: 股票英文名称
-        offer_price_range: 招股价区间（如 "250.00-280.00"）
-        raised_amount: 集资额（港元，字符串格式）
+        offer_price_range: 招股价区间（原始字符串，如 "250.00-280.00"）
+        offer_price_low: 招股价下限（港元）
+        offer_price_high: 招股价上限（港元，单一价格时与下限相同）
+        raised_amount: 集资额（港元）
+        raised_amount_raw: 无法解析的集资额原始字符串（百万港元），仅用于显示
         offer_shares: 发售股数（股）
+        offer_shares_raw: 无法解析的发售股数原始字符串，仅用于显示
         subscription_ratio: 认购倍数
         subscription_date: 申购日期（datetime对象，用于筛选）
         subscription_date_range: 申购日期范围（原始字符串，如 "2025-12-31至2026-01-06"）
@@ -29,13 +34,19 @@ class HKNewStockInfo:
         market: 市场（默认"港股"）
         industry: 所属行业
         company_intro: 公司简介
+        start_date: 申购开始日期（由日期范围解析，用于筛选）
+        end_date: 申购结束日期（由日期范围解析，用于筛选）
     """
     stock_code: str
     stock_name: str
     stock_name_en: Optional[str] = None
     offer_price_range: Optional[str] = None
-    raised_amount: Optional[str] = None
-    offer_shares: Optional[str] = None
+    offer_price_low: Optional[float] = None
+    offer_price_high: Optional[float] = None
+    raised_amount: Optional[float] = None
+    raised_amount_raw: Optional[str] = None
+    offer_shares: Optional[float] = None
+    offer_shares_raw: Optional[str] = None
     subscription_ratio: Optional[str] = None
     subscription_date: Optional[datetime] = None
     subscription_date_range: Optional[str] = None  # 新增：保存原始日期范围
@@ -43,6 +54,8 @@ class HKNewStockInfo:
     market: str = "港股"
     industry: str = ""
     company_intro: str = ""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
 
     def is_price_determined(self) -> bool:
         """判断招股价是否已确定
@@ -70,43 +83,32 @@ class HKNewStockInfo:
         """获取格式化的发售股数
 
         Returns:
-            str: 格式化的股数（如 "1,000万股"）
+            str: 格式化的股数（如 "1,000万股"），无法解析时返回原始字符串，缺失或为 0 时返回 "待定"
         """
         if not self.offer_shares:
-            return "待定"
-
-        try:
-            # 尝试格式化数字
-            shares = float(self.offer_shares.replace(",", ""))
-            if shares >= 100000000:
-                return f"{shares/100000000:.2f}亿股"
-            elif shares >= 10000:
-                return f"{shares/10000:.0f}万股"
-            else:
-                return f"{shares:.0f}股"
-        except (ValueError, AttributeError):
-            return self.offer_shares
+            return self.offer_shares_raw or "待定"
+
+        shares = self.offer_shares
+        if shares >= 100000000:
+            return f"{shares/100000000:.2f}亿股"
+        elif shares >= 10000:
+            return f"{shares/10000:.0f}万股"
+        else:
+            return f"{shares:.0f}股"
 
     def get_formatted_raised_amount(self) -> str:
         """获取格式化的集资额
 
         Returns:
-            str: 格式化的集资额（如 "15.5亿港元"）
+            str: 格式化的集资额（如 "15.5亿港元"），无法解析时返回原始字符串，缺失或为 0 时返回 "待定"
         """
         if not self.raised_amount:
-            return "待定"
-
-        # 移除已有格式并重新格式化
-        try:
-            # 移除逗号和单位
-            amount_str = str(self.raised_amount).replace(",", "").replace("HK$", "").strip()
-            amount = float(amount_str)
-
-            if amount >= 100000000:
-                return f"{amount/100000000:.2f}亿港元"
-            elif amount >= 10000:
-                return f"{amount/10000:.0f}万港元"
-            else:
-                return f"{amount:.0f}港元"
-        except (ValueError, AttributeError):
-            return f"{self.raised_amount}港元"
+            return f"{self.raised_amount_raw}港元" if self.raised_amount_raw else "待定"
+
+        amount = self.raised_amount
+        if amount >= 100000000:
+            return f"{amount/100000000:.2f}亿港元"
+        elif amount >= 10000:
+            return f"{amount/10000:.0f}万港元"
+        else:
+            return f"{amount:.0f}港元"
@@ -3,5 +3,34 @@
 from .fetcher import HKDataFetcher
 from .processor import HKDataProcessor
 from .formatter import HKMarkdownFormatter
+from .cache import ResponseCache
+from .scheduler import RefreshScheduler
+from .single_flight import SingleFlight
+from .disk_cache import DiskCache
+from .window_index import SubscriptionWindowIndex
+from .http_pool import PooledSession
+from .rate_limiter import AdaptiveTokenBucket, HostRateLimiter
+from .deadline import Deadline, DeadlineExceeded
+from .retry import RetryBudget, RetryPolicy
+from .snapshot_store import SnapshotStore
+from .async_fetcher import AsyncHKDataFetcher
 
-__all__ = ["HKDataFetcher", "HKDataProcessor", "HKMarkdownFormatter"]
+__all__ = [
+    "HKDataFetcher",
+    "HKDataProcessor",
+    "HKMarkdownFormatter",
+    "ResponseCache",
+    "RefreshScheduler",
+    "SingleFlight",
+    "DiskCache",
+    "SubscriptionWindowIndex",
+    "PooledSession",
+    "AdaptiveTokenBucket",
+    "HostRateLimiter",
+    "Deadline",
+    "DeadlineExceeded",
+    "RetryBudget",
+    "RetryPolicy",
+    "SnapshotStore",
+    "AsyncHKDataFetcher",
+]
@@ -0,0 +1,273 @@
+"""
+港股数据异步获取服务
+
+基于 httpx 的异步版本，并发获取详情页
+"""
+
+import asyncio
+import sys
+import time
+from dataclasses import replace
+from typing import List, Optional
+
+import httpx
+
+from models import HKNewStockInfo
+from .deadline import Deadline, DeadlineExceeded
+from .disk_cache import DiskCache
+from .fetcher import DetailPageScanner, HKDataFetcher
+from .rate_limiter import HostRateLimiter
+from .retry import RetryBudget, RetryPolicy
+
+
+class AsyncHKDataFetcher(HKDataFetcher):
+    """港股新股数据异步获取器
+
+    页面解析和详情缓存与 HKDataFetcher 相同，网络请求改为基于 httpx.AsyncClient 的协程：
+    详情页在 concurrency 个并发内同时获取，请求速率由与同步获取器共享的 HostRateLimiter 控制
+    """
+
+    def __init__(self, client: httpx.AsyncClient, rate_limiter: HostRateLimiter, concurrency: int = 4,
+                 timeout: int = 10, detail_cache: Optional[DiskCache] = None,
+                 negative_ttl: int = 3600, stream_detail: bool = True,
+                 retry_policy: Optional[RetryPolicy] = None, retry_budget: Optional[RetryBudget] = None,
+                 deadline: Optional[Deadline] = None):
+        """初始化异步获取器
+
+        Args:
+            client: 进程内共享的 httpx 异步客户端
+            rate_limiter: 进程内共享的限流器
+            concurrency: 同时进行的详情页请求数上限
+            timeout: 请求超时时间（秒）
+            detail_cache: 详情页解析结果的持久化缓存，为 None 时每次都请求详情页
+            negative_ttl: 详情页无数据时的缓存有效期（秒）
+            stream_detail: 是否流式读取详情页，找到所需字段后立即断开连接
+            retry_policy: 进程内共享的重试策略，为 None 时使用默认策略
+            retry_budget: 本次刷新的重试预算，为 None 时只受单个调用的重试次数限制
+            deadline: 本次刷新的时限，为 None 时不限时
+        """
+        super().__init__(
+            timeout=timeout,
+            detail_cache=detail_cache,
+            negative_ttl=negative_ttl,
+            stream_detail=stream_detail,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            deadline=deadline
+        )
+        self.client = client
+        self.concurrency = max(concurrency, 1)
+
+    async def fetch_hk_new_stocks(self) -> List[HKNewStockInfo]:
+        """获取港股新股数据（主方法）
+
+        Returns:
+            List[HKNewStockInfo]: 港股新股信息列表，页面中没有新股表格时为空列表
+
+        Raises:
+            Exception: 当数据获取失败时，由刷新方决定保留旧快照或重试
+        """
+        print("INFO: 开始异步获取港股新股数据...", file=sys.stderr)
+
+        try:
+            response = await self.retry_policy.call_async(
+                self._fetch_list_page,
+                budget=self.retry_budget,
+                retryable=self._is_retryable,
+                description="获取港股新股列表",
+                deadline=self.deadline
+            )
+            print(f"INFO: 成功获取页面，状态码: {response.status_code}", file=sys.stderr)
+
+            # 解析在线程中执行，避免阻塞事件循环
+            rows = await asyncio.to_thread(self._extract_list_rows, response.text)
+            if rows is None:
+                return []
+
+            stocks = self._parse_table(rows)
+            print(f"INFO: 成功解析 {len(stocks)} 条港股新股数据", file=sys.stderr)
+
+            return stocks
+
+        except httpx.TimeoutException:
+            print(f"ERROR: 请求超时（{self.timeout}秒）", file=sys.stderr)
+            raise
+        except httpx.HTTPError as e:
+            print(f"ERROR: 网络请求失败: {e}", file=sys.stderr)
+            raise
+        except Exception as e:
+            print(f"ERROR: 获取数据时出错: {e}", file=sys.stderr)
+            raise
+
+    async def _fetch_list_page(self) -> httpx.Response:
+        """请求列表页
+
+        Returns:
+            httpx.Response: 已设置 GBK 编码的响应
+
+        Raises:
+            httpx.HTTPError: 当网络请求失败或返回错误状态码时
+        """
+        response = await self._send(self.base_url)
+        response.raise_for_status()
+
+        # 新浪财经使用 GBK 编码
+        response.encoding = 'gbk'
+        return response
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """判断请求失败是否值得重试：网络错误、被限流和服务端错误重试；被封禁时重试只会加重封禁，不重试"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return self._is_transient(error.response.status_code)
+        return isinstance(error, httpx.TransportError)
+
+    async def _send(self, url: str, stream: bool = False) -> httpx.Response:
+        """经过限流发送 GET 请求，并把响应情况反馈给限流器
+
+        Args:
+            url: 请求地址
+            stream: 是否只读取响应头，由调用方流式读取响应体并负责关闭响应
+
+        Returns:
+            httpx.Response: 响应对象
+
+        Raises:
+            httpx.HTTPError: 当网络请求失败时
+            DeadlineExceeded: 当请求时限已到时
+        """
+        bucket = self.rate_limiter.for_url(url)
+        self.deadline.check(f"请求 {url}")
+        # 限流需要等待到时限之后时不再发起请求
+        if not await bucket.acquire(self.deadline.remaining()):
+            raise DeadlineExceeded(f"请求时限（{self.deadline.seconds} 秒）内无法发起请求 {url}")
+
+        request = self.client.build_request(
+            "GET", url, headers=self._get_headers(), timeout=self.deadline.timeout(self.timeout)
+        )
+        start = time.monotonic()
+        try:
+            response = await self.client.send(request, stream=stream)
+        except httpx.HTTPError:
+            bucket.record(ok=False, elapsed=time.monotonic() - start)
+            raise
+
+        bucket.record(ok=self._is_healthy(response.status_code), elapsed=time.monotonic() - start)
+        return response
+
+    async def enrich_stocks_detail(self, stocks: List[HKNewStockInfo]) -> List[HKNewStockInfo]:
+        """并发补充股票的详情信息（板块和公司简介）
+
+        请求时限用完后不再请求详情页（缓存仍然可用），未补充的股票代码记录在 unenriched 中
+
+        Args:
+            stocks: 港股新股列表
+
+        Returns:
+            List[HKNewStockInfo]: 补充了详情信息的股票列表，与输入一一对应且顺序相同
+        """
+        self.unenriched = []
+
+        if not stocks:
+            return stocks
+
+        print(f"INFO: 开始并发补充 {len(stocks)} 只港股的详细信息（并发上限 {self.concurrency}）...", file=sys.stderr)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def enrich(stock: HKNewStockInfo) -> HKNewStockInfo:
+            async with semaphore:
+                try:
+                    industry, company_intro = await self._fetch_stock_detail(stock.stock_code)
+                except DeadlineExceeded:
+                    self.unenriched.append(stock.stock_code)
+                    return stock
+
+            print(f"DEBUG: 股票 {stock.stock_code} - 板块: {industry if industry else '无'}, 公司简介: {len(company_intro)} 字符", file=sys.stderr)
+            return replace(
+                stock,
+                industry=industry or stock.industry,
+                company_intro=company_intro or stock.company_intro
+            )
+
+        enriched_stocks = await asyncio.gather(*(enrich(stock) for stock in stocks))
+
+        if self.unenriched:
+            print(f"WARNING: 请求时限已到，{len(self.unenriched)} 只股票未补充详细信息", file=sys.stderr)
+
+        print(f"INFO: 详细信息补充完成", file=sys.stderr)
+        return list(enriched_stocks)
+
+    async def _fetch_stock_detail(self, stock_code: str) -> tuple:
+        """获取单个股票的详情页信息
+
+        优先读取详情缓存；详情页无数据时也会缓存（较短的有效期），避免重复请求
+
+        Args:
+            stock_code: 股票代码
+
+        Returns:
+            tuple: (板块, 公司简介)
+
+        Raises:
+            DeadlineExceeded: 未命中缓存且请求时限已到时
+        """
+        # 详情缓存读写 SQLite，放到线程中执行，避免阻塞事件循环
+        cached = await asyncio.to_thread(self._get_cached_detail, stock_code)
+        if cached is not None:
+            return cached
+
+        try:
+            industry, company_intro = await self.retry_policy.call_async(
+                lambda: self._download_stock_detail(stock_code),
+                budget=self.retry_budget,
+                retryable=self._is_retryable,
+                description=f"获取股票 {stock_code} 详情页",
+                deadline=self.deadline
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"ERROR: 获取股票 {stock_code} 详情页失败: {e}", file=sys.stderr)
+            return "", ""
+
+        await asyncio.to_thread(self._cache_detail, stock_code, industry, company_intro)
+        return industry, company_intro
+
+    async def _download_stock_detail(self, stock_code: str) -> tuple:
+        """下载并解析单个股票的详情页
+
+        Args:
+            stock_code: 股票代码
+
+        Returns:
+            tuple: (板块, 公司简介)
+
+        Raises:
+            httpx.HTTPError: 当网络请求失败时
+        """
+        url = self._detail_url(stock_code)
+
+        if not self.stream_detail:
+            response = await self._send(url)
+            # 错误页面（如反爬拦截）不能当作“无数据”缓存
+            response.raise_for_status()
+            response.encoding = 'gbk'
+            return await asyncio.to_thread(self._parse_detail_page, response.text)
+
+        # 流式读取：找到板块和公司简介后关闭响应，不再下载剩余页面
+        response = await self._send(url, stream=True)
+        try:
+            response.raise_for_status()
+            scanner = DetailPageScanner(min_rows=self.DETAIL_MIN_ROWS)
+
+            # 增量解析同样放到线程中执行；各块依次等待解析完成，同一解析器不会被并发使用
+            async for chunk in response.aiter_bytes(self.DETAIL_CHUNK_SIZE):
+                result = await asyncio.to_thread(scanner.feed, chunk)
+                if result is not None:
+                    print(f"DEBUG: 股票 {stock_code} 详情页读取 {scanner.received} 字节后提前结束", file=sys.stderr)
+                    return result
+
+            return await asyncio.to_thread(scanner.close)
+        finally:
+            await response.aclose()
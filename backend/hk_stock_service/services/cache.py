@@ -0,0 +1,101 @@
+"""
+响应缓存服务
+
+进程内 TTL 缓存，用于缓存已渲染的接口响应
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """进程内 TTL 响应缓存
+
+    以请求参数组合为键缓存完整的响应体，过期后自动失效，
+    并统计命中/未命中次数
+    """
+
+    def __init__(self, ttl: int = 300):
+        """初始化响应缓存
+
+        Args:
+            ttl: 缓存有效期（秒），小于等于 0 表示禁用缓存
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """缓存是否启用"""
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Any]: 未过期的缓存值，未命中返回 None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at < self.ttl:
+                    self.hits += 1
+                    return value
+                # 已过期，顺便清理
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """写入缓存
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """使缓存失效
+
+        Args:
+            key: 缓存键，为 None 时清空全部缓存
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        """获取缓存统计信息
+
+        Returns:
+            dict: 包含命中、未命中、命中率和条目数
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0
+            }
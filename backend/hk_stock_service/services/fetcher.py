@@ -4,32 +4,196 @@
 负责从新浪财经获取港股新股数据
 """
 
+import codecs
 import sys
 import time
 import random
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional
+from itertools import chain
+from typing import Iterable, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from models import HKNewStockInfo
+from .deadline import Deadline, DeadlineExceeded
+from .disk_cache import DiskCache
+from .http_pool import PooledSession
+from .rate_limiter import HostRateLimiter
+from .retry import RetryBudget, RetryPolicy
+
+# 单元格文本（不含注释和 script/style 内容，与 BeautifulSoup 的 .text 一致）
+_CELL_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+
+class DetailPageScanner:
+    """详情页增量扫描器
+
+    按块增量解码 GBK 并送入 lxml 的 HTMLPullParser，每读完一行就检查一次板块和公司简介。
+    判定规则与 HKDataFetcher._parse_detail_page 相同：表格累计满 min_rows 行后，
+    之前缓存的行和之后的行才会被检查
+    """
+
+    def __init__(self, min_rows: int = 10):
+        """初始化扫描器
+
+        Args:
+            min_rows: 包含所需字段的表格至少有多少行（用于跳过导航等小表格）
+        """
+        self.min_rows = min_rows
+        self.received = 0
+        self._decoder = codecs.getincrementaldecoder("gbk")(errors="replace")
+        self._parser = etree.HTMLPullParser(events=("start", "end"))
+        self._open_tables = []
+        self._states = {}
+
+    def feed(self, chunk: bytes) -> Optional[tuple]:
+        """送入一块响应体
+
+        Args:
+            chunk: 响应体字节块
+
+        Returns:
+            Optional[tuple]: 已找到时返回 (板块, 公司简介)，否则返回 None
+        """
+        self.received += len(chunk)
+        self._parser.feed(self._decoder.decode(chunk))
+        return self._process_events()
+
+    def close(self) -> tuple:
+        """响应体读取完毕，处理剩余内容
+
+        Returns:
+            tuple: (板块, 公司简介)，未找到时返回空字符串
+        """
+        self._parser.feed(self._decoder.decode(b"", final=True))
+        self._parser.close()
+        return self._process_events() or ("", "")
+
+    def _process_events(self) -> Optional[tuple]:
+        """处理解析器产生的事件"""
+        for event, element in self._parser.read_events():
+            if element.tag == "table":
+                if event == "start":
+                    self._open_tables.append(element)
+                    self._states[element] = {"rows": 0, "pending": [], "industry": "", "company_intro": ""}
+                    continue
+
+                state = self._states.pop(element, None)
+                if element in self._open_tables:
+                    self._open_tables.remove(element)
+                element.clear()
+                # 表格结束：满足行数要求且找到任一字段即返回
+                if state and state["rows"] >= self.min_rows and (state["industry"] or state["company_intro"]):
+                    return state["industry"], state["company_intro"]
+
+            elif element.tag == "tr" and event == "end":
+                cells = list(element.iter("td", "th"))
+                row = (self._cell_text(cells[0]), self._cell_text(cells[1])) if len(cells) >= 2 else None
+                element.clear()
+
+                for table in self._open_tables:
+                    state = self._states[table]
+                    state["rows"] += 1
+                    state["pending"].append(row)
+                    if state["rows"] < self.min_rows:
+                        continue
+
+                    rows, state["pending"] = state["pending"], []
+                    result = self._scan_rows(state, rows)
+                    if result is not None:
+                        return result
+
+        return None
+
+    def _scan_rows(self, state: dict, rows: list) -> Optional[tuple]:
+        """按行检查板块和公司简介
+
+        Args:
+            state: 当前表格的查找状态，会被更新
+            rows: (标签, 值) 元组列表，单元格不足两列的行为 None
+
+        Returns:
+            Optional[tuple]: 找到公司简介时返回 (板块, 公司简介)，否则返回 None
+        """
+        for row in rows:
+            if row is None:
+                continue
+
+            label, value = row
+            if label == '板块':
+                state["industry"] = value
+            elif label == '公司简介':
+                state["company_intro"] = value
+                # 找到公司简介后就可以返回了（通常在板块后面）
+                if state["industry"] or state["company_intro"]:
+                    return state["industry"], state["company_intro"]
+
+        return None
+
+    def _cell_text(self, cell) -> str:
+        """获取单元格文本（与 BeautifulSoup 的 get_text(strip=True) 一致）"""
+        return "".join(text.strip() for text in _CELL_TEXT(cell))
 
 
 class HKDataFetcher:
     """港股新股数据获取器（优化版）"""
 
-    def __init__(self, timeout: int = 10, min_interval: int = 5):
+    # 列表页中新股表格的位置（第一个表格是导航菜单）
+    LIST_TABLE_INDEX = 1
+    # 增量解析时每次读入的字符数
+    PARSE_CHUNK_SIZE = 64 * 1024
+    # 流式读取详情页时每次读取的字节数
+    DETAIL_CHUNK_SIZE = 8 * 1024
+    # 详情页中包含板块和公司简介的表格至少有多少行（用于跳过导航等小表格）
+    DETAIL_MIN_ROWS = 10
+
+    # 新浪财经反爬封禁时返回的状态码
+    BLOCKED_STATUS_CODES = frozenset({403, 418, 456})
+
+    def __init__(self, timeout: int = 10, min_interval: int = 5,
+                 detail_cache: Optional[DiskCache] = None, negative_ttl: int = 3600,
+                 stream_detail: bool = True, session: Optional[PooledSession] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 retry_budget: Optional[RetryBudget] = None, deadline: Optional[Deadline] = None):
         """初始化港股数据获取器
 
         Args:
             timeout: 请求超时时间（秒）
-            min_interval: 最小请求间隔（秒），防止被封禁
+            min_interval: 请求最小间隔（秒），仅在未传入 rate_limiter 时使用：限流速率不超过
+                1 / min_interval 次/秒，退避时最多减速到其 1/10；不大于 0 时使用限流器的默认速率
+            detail_cache: 详情页解析结果的持久化缓存，为 None 时每次都请求详情页
+            negative_ttl: 详情页无数据时的缓存有效期（秒）
+            stream_detail: 是否流式读取详情页，找到所需字段后立即断开连接
+            session: 进程内共享的连接池，为 None 时每次请求单独建立连接
+            rate_limiter: 进程内共享的限流器，为 None 时使用本实例独立的限流器
+            retry_policy: 进程内共享的重试策略，为 None 时使用默认策略
+            retry_budget: 本次刷新的重试预算，为 None 时只受单个调用的重试次数限制
+            deadline: 本次刷新的时限，为 None 时不限时
         """
         self.base_url = "http://vip.stock.finance.sina.com.cn/q/view/hk_IPOList.php"
         self.timeout = timeout
         self.min_interval = min_interval
-        self.last_request_time = 0
+        if rate_limiter is None:
+            if min_interval > 0:
+                rate = 1 / min_interval
+                rate_limiter = HostRateLimiter(rate=rate, max_rate=rate, min_rate=rate / 10, burst=1)
+            else:
+                rate_limiter = HostRateLimiter()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget
+        self.deadline = deadline or Deadline()
+        # 最近一次补充时因时限用完而未补充详细信息的股票代码
+        self.unenriched: List[str] = []
+        self.detail_cache = detail_cache
+        self.negative_ttl = negative_ttl
+        self.stream_detail = stream_detail
+        self.session = session
+        # 有共享连接池时通过连接池发送请求，否则直接使用 requests
+        self._http = session if session is not None else requests
 
         # 随机User-Agent池
         self.user_agents = [
@@ -43,64 +207,111 @@ class HKDataFetcher:
         """获取港股新股数据（主方法）
 
         Returns:
-            List[HKNewStockInfo]: 港股新股信息列表
+            List[HKNewStockInfo]: 港股新股信息列表，页面中没有新股表格时为空列表
+
+        Raises:
+            Exception: 当数据获取失败时，由刷新方决定保留旧快照或重试
         """
         print("INFO: 开始获取港股新股数据...", file=sys.stderr)
 
         try:
-            # 请求频率限制
-            self._rate_limit()
-
-            # 发送请求
-            headers = self._get_headers()
-            response = requests.get(
-                self.base_url,
-                headers=headers,
-                timeout=self.timeout
+            # 发送请求（经过限流），网络错误、被限流和服务端错误时重试
+            response = self.retry_policy.call(
+                self._fetch_list_page,
+                budget=self.retry_budget,
+                retryable=self._is_retryable,
+                description="获取港股新股列表",
+                deadline=self.deadline
             )
 
-            # 关键：设置正确的编码（新浪财经使用 GBK 编码）
-            response.encoding = 'gbk'
-
-            self.last_request_time = time.time()
             print(f"INFO: 成功获取页面，状态码: {response.status_code}", file=sys.stderr)
 
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # 查找所有表格
-            tables = soup.find_all('table')
-            if len(tables) < 2:
-                print(f"ERROR: 未找到足够的数据表格，只找到{len(tables)}个，页面结构可能已变化", file=sys.stderr)
+            # 只解析新股表格（第二个表格，第一个表格是导航菜单）
+            rows = self._extract_list_rows(response.text)
+            if rows is None:
                 return []
 
-            # 使用第二个表格（索引1），第一个表格是导航菜单
-            table = tables[1]
-            print(f"DEBUG: 找到{len(tables)}个表格，使用第2个表格进行解析", file=sys.stderr)
-
             # 解析表格数据
-            stocks = self._parse_table(table)
+            stocks = self._parse_table(rows)
             print(f"INFO: 成功解析 {len(stocks)} 条港股新股数据", file=sys.stderr)
 
             return stocks
 
         except requests.exceptions.Timeout:
             print(f"ERROR: 请求超时（{self.timeout}秒）", file=sys.stderr)
-            return []
+            raise
         except requests.exceptions.RequestException as e:
             print(f"ERROR: 网络请求失败: {e}", file=sys.stderr)
-            return []
+            raise
         except Exception as e:
             print(f"ERROR: 获取数据时出错: {e}", file=sys.stderr)
-            return []
+            raise
+
+    def _fetch_list_page(self) -> requests.Response:
+        """请求列表页
+
+        Returns:
+            requests.Response: 已设置 GBK 编码的响应
+
+        Raises:
+            requests.exceptions.RequestException: 当网络请求失败或返回错误状态码时
+        """
+        response = self._get(self.base_url, headers=self._get_headers(), timeout=self.timeout)
+        response.raise_for_status()
+
+        # 关键：设置正确的编码（新浪财经使用 GBK 编码）
+        response.encoding = 'gbk'
+        return response
 
-    def _rate_limit(self):
-        """请求频率限制，避免被封禁"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed + random.uniform(0.5, 1.5)
-            print(f"INFO: 等待 {sleep_time:.2f} 秒后继续...", file=sys.stderr)
-            time.sleep(sleep_time)
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """经过限流发送 GET 请求，并把响应情况反馈给限流器
+
+        请求超时不超过请求时限的剩余时间；时限用完后不再发起请求
+
+        Args:
+            url: 请求地址
+            **kwargs: 透传给 requests.get 的参数
+
+        Returns:
+            requests.Response: 响应对象（stream=True 时只读取了响应头）
+
+        Raises:
+            requests.exceptions.RequestException: 当网络请求失败时
+            DeadlineExceeded: 当请求时限已到时
+        """
+        bucket = self.rate_limiter.for_url(url)
+        self.deadline.check(f"请求 {url}")
+        # 限流需要等待到时限之后时不再发起请求
+        if not bucket.acquire_sync(self.deadline.remaining()):
+            raise DeadlineExceeded(f"请求时限（{self.deadline.seconds} 秒）内无法发起请求 {url}")
+        kwargs["timeout"] = self.deadline.timeout(kwargs.get("timeout"))
+
+        start = time.monotonic()
+        try:
+            response = self._http.get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            bucket.record(ok=False, elapsed=time.monotonic() - start)
+            raise
+
+        bucket.record(ok=self._is_healthy(response.status_code), elapsed=time.monotonic() - start)
+        return response
+
+    def _is_transient(self, status_code: int) -> bool:
+        """判断错误状态是否为暂时性的（被限流或服务端错误），值得退避后重试"""
+        return status_code == 429 or status_code >= 500
+
+    def _is_healthy(self, status_code: int) -> bool:
+        """判断响应状态是否说明上游正常
+
+        被限流、服务端错误以及反爬封禁（如 403、456）都需要退避，否则限流器会在被封禁时继续加速
+        """
+        return not self._is_transient(status_code) and status_code not in self.BLOCKED_STATUS_CODES
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """判断请求失败是否值得重试：网络错误、被限流和服务端错误重试；被封禁时重试只会加重封禁，不重试"""
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return self._is_transient(error.response.status_code)
+        return isinstance(error, requests.exceptions.RequestException)
 
     def _get_headers(self) -> dict:
         """获取随机请求头
@@ -120,101 +331,290 @@ class HKDataFetcher:
     def _fetch_stock_detail(self, stock_code: str) -> tuple:
         """获取单个股票的详情页信息
 
+        优先读取详情缓存；详情页无数据时也会缓存（较短的有效期），避免重复请求
+
         Args:
             stock_code: 股票代码
 
         Returns:
             tuple: (板块, 公司简介)
+
+        Raises:
+            DeadlineExceeded: 未命中缓存且请求时限已到时
         """
-        url = f"http://vip.stock.finance.sina.com.cn/q/view/hk_IPOProfile.php?symbol={stock_code}"
+        cached = self._get_cached_detail(stock_code)
+        if cached is not None:
+            return cached
 
         try:
-            # 请求频率限制
-            self._rate_limit()
+            industry, company_intro = self.retry_policy.call(
+                lambda: self._download_stock_detail(stock_code),
+                budget=self.retry_budget,
+                retryable=self._is_retryable,
+                description=f"获取股票 {stock_code} 详情页",
+                deadline=self.deadline
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"ERROR: 获取股票 {stock_code} 详情页失败: {e}", file=sys.stderr)
+            return "", ""
+
+        self._cache_detail(stock_code, industry, company_intro)
+        return industry, company_intro
 
-            # 发送请求
-            headers = self._get_headers()
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+    def _get_cached_detail(self, stock_code: str) -> Optional[tuple]:
+        """读取详情缓存
+
+        Args:
+            stock_code: 股票代码
+
+        Returns:
+            Optional[tuple]: 命中时返回 (板块, 公司简介)，未命中返回 None
+        """
+        if not self.detail_cache:
+            return None
+
+        cached = self.detail_cache.get(stock_code)
+        if cached is None:
+            return None
+
+        print(f"DEBUG: 命中股票 {stock_code} 的详情缓存", file=sys.stderr)
+        return cached["industry"], cached["company_intro"]
+
+    def _cache_detail(self, stock_code: str, industry: str, company_intro: str) -> None:
+        """写入详情缓存，详情页无数据时使用较短的有效期
+
+        Args:
+            stock_code: 股票代码
+            industry: 板块
+            company_intro: 公司简介
+        """
+        if not self.detail_cache:
+            return
+
+        ttl = None if (industry or company_intro) else self.negative_ttl
+        self.detail_cache.set(
+            stock_code,
+            {"industry": industry, "company_intro": company_intro},
+            ttl=ttl
+        )
+
+    def _detail_url(self, stock_code: str) -> str:
+        """获取详情页地址"""
+        return f"http://vip.stock.finance.sina.com.cn/q/view/hk_IPOProfile.php?symbol={stock_code}"
+
+    def _download_stock_detail(self, stock_code: str) -> tuple:
+        """下载并解析单个股票的详情页
+
+        Args:
+            stock_code: 股票代码
+
+        Returns:
+            tuple: (板块, 公司简介)
+
+        Raises:
+            requests.exceptions.RequestException: 当网络请求失败时
+        """
+        url = self._detail_url(stock_code)
+
+        # 发送请求（经过限流）
+        headers = self._get_headers()
+
+        if not self.stream_detail:
+            response = self._get(url, headers=headers, timeout=self.timeout)
+            # 错误页面（如反爬拦截）不能当作“无数据”缓存
+            response.raise_for_status()
             response.encoding = 'gbk'
+            return self._parse_detail_page(response.text)
+
+        # 流式读取：找到板块和公司简介后退出 with 块，连接随之关闭，不再下载剩余页面
+        with self._get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            return self._stream_detail_page(
+                response.iter_content(chunk_size=self.DETAIL_CHUNK_SIZE),
+                stock_code
+            )
 
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'lxml')
+    def _parse_detail_page(self, html: str) -> tuple:
+        """解析完整的详情页
 
-            # 查找所有表格
-            tables = soup.find_all('table')
+        Args:
+            html: 详情页 HTML
 
-            for table in tables:
-                rows = table.find_all('tr')
+        Returns:
+            tuple: (板块, 公司简介)
+        """
+        soup = BeautifulSoup(html, 'lxml')
 
-                # 跳过太小的表格
-                if len(rows) < 10:
-                    continue
+        # 查找所有表格
+        tables = soup.find_all('table')
 
-                industry = ""
-                company_intro = ""
+        for table in tables:
+            rows = table.find_all('tr')
 
-                # 遍历行，查找板块和公司简介
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
+            # 跳过太小的表格
+            if len(rows) < self.DETAIL_MIN_ROWS:
+                continue
 
-                    if len(cells) >= 2:
-                        label = cells[0].get_text(strip=True)
-                        value = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+            industry = ""
+            company_intro = ""
 
-                        if label == '板块':
-                            industry = value
-                        elif label == '公司简介':
-                            company_intro = value
-                            # 找到公司简介后就可以返回了（通常在板块后面）
-                            if industry or company_intro:
-                                return industry, company_intro
+            # 遍历行，查找板块和公司简介
+            for row in rows:
+                cells = row.find_all(['td', 'th'])
 
-                # 如果在这个表格中找到了数据，返回
-                if industry or company_intro:
-                    return industry, company_intro
+                if len(cells) >= 2:
+                    label = cells[0].get_text(strip=True)
+                    value = cells[1].get_text(strip=True) if len(cells) > 1 else ""
 
-            return "", ""
+                    if label == '板块':
+                        industry = value
+                    elif label == '公司简介':
+                        company_intro = value
+                        # 找到公司简介后就可以返回了（通常在板块后面）
+                        if industry or company_intro:
+                            return industry, company_intro
 
-        except Exception as e:
-            print(f"ERROR: 获取股票 {stock_code} 详情页失败: {e}", file=sys.stderr)
-            return "", ""
+            # 如果在这个表格中找到了数据，返回
+            if industry or company_intro:
+                return industry, company_intro
+
+        return "", ""
+
+    def _stream_detail_page(self, chunks: Iterable[bytes], stock_code: str = "") -> tuple:
+        """边下载边解析详情页，找到所需字段后立即停止
+
+        Args:
+            chunks: 响应体字节块
+            stock_code: 股票代码（仅用于日志）
+
+        Returns:
+            tuple: (板块, 公司简介)
+        """
+        scanner = DetailPageScanner(min_rows=self.DETAIL_MIN_ROWS)
+
+        for chunk in chunks:
+            result = scanner.feed(chunk)
+            if result is not None:
+                print(f"DEBUG: 股票 {stock_code} 详情页读取 {scanner.received} 字节后提前结束", file=sys.stderr)
+                return result
+
+        return scanner.close()
 
     def enrich_stocks_detail(self, stocks: List[HKNewStockInfo]) -> List[HKNewStockInfo]:
         """批量补充股票的详情信息（板块和公司简介）
 
+        请求时限用完后不再请求详情页（缓存仍然可用），未补充的股票代码记录在 unenriched 中
+
         Args:
             stocks: 港股新股列表
 
         Returns:
-            List[HKNewStockInfo]: 补充了详情信息的股票列表
+            List[HKNewStockInfo]: 补充了详情信息的股票列表，与输入一一对应且顺序相同
         """
+        self.unenriched = []
+
         if not stocks:
             return stocks
 
         print(f"INFO: 开始补充 {len(stocks)} 只港股的详细信息（板块、公司简介）...", file=sys.stderr)
 
+        enriched_stocks = []
+
         for i, stock in enumerate(stocks, 1):
             print(f"DEBUG: 正在获取第 {i}/{len(stocks)} 只股票的详情: {stock.stock_code}", file=sys.stderr)
 
             # 获取详情
-            industry, company_intro = self._fetch_stock_detail(stock.stock_code)
+            try:
+                industry, company_intro = self._fetch_stock_detail(stock.stock_code)
+            except DeadlineExceeded:
+                self.unenriched.append(stock.stock_code)
+                enriched_stocks.append(stock)
+                continue
 
-            # 更新股票信息
-            if industry:
-                stock.industry = industry
-            if company_intro:
-                stock.company_intro = company_intro
+            # 生成补充了详情的新记录
+            enriched_stocks.append(replace(
+                stock,
+                industry=industry or stock.industry,
+                company_intro=company_intro or stock.company_intro
+            ))
 
             print(f"DEBUG: 股票 {stock.stock_code} - 板块: {industry if industry else '无'}, 公司简介: {len(company_intro)} 字符", file=sys.stderr)
 
+        if self.unenriched:
+            print(f"WARNING: 请求时限已到，{len(self.unenriched)} 只股票未补充详细信息", file=sys.stderr)
+
         print(f"INFO: 详细信息补充完成", file=sys.stderr)
-        return stocks
+        return enriched_stocks
+
+    def _extract_list_rows(self, html: str) -> Optional[List[List[str]]]:
+        """增量解析列表页，只提取新股表格 tbody 中各行的单元格文本
+
+        使用 lxml 的 HTMLPullParser 分块读入页面，新股表格结束后立即停止解析，
+        之前的表格（导航菜单）读完即释放，不为整页构建文档树
+
+        Args:
+            html: 列表页 HTML
+
+        Returns:
+            Optional[List[List[str]]]: 每行的单元格文本列表，页面中表格不足时返回 None
+        """
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        table_count = 0
+        target = None
+
+        chunks = (html[i:i + self.PARSE_CHUNK_SIZE] for i in range(0, len(html), self.PARSE_CHUNK_SIZE))
+        for chunk in chain(chunks, [None]):
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+
+            for event, element in parser.read_events():
+                if element.tag != "table":
+                    continue
+
+                if event == "start":
+                    table_count += 1
+                    if table_count == self.LIST_TABLE_INDEX + 1:
+                        target = element
+                elif element is target:
+                    print(f"DEBUG: 已解析到第{table_count}个表格，停止解析剩余页面", file=sys.stderr)
+                    return self._table_rows(target)
+                elif target is None:
+                    element.clear()
+
+        if target is not None:
+            # 页面被截断，目标表格没有闭合
+            return self._table_rows(target)
+
+        print(f"ERROR: 未找到足够的数据表格，只找到{table_count}个，页面结构可能已变化", file=sys.stderr)
+        return None
+
+    def _table_rows(self, table) -> List[List[str]]:
+        """提取表格中位于 tbody 内的行（跳过 thead 和 tfoot）
+
+        Args:
+            table: lxml 表格元素
 
-    def _parse_table(self, table) -> List[HKNewStockInfo]:
+        Returns:
+            List[List[str]]: 每行的单元格（td 或 th）文本列表
+        """
+        rows = []
+
+        for row in table.iter("tr"):
+            if not any(ancestor.tag == "tbody" for ancestor in row.iterancestors()):
+                continue
+            rows.append(["".join(_CELL_TEXT(cell)) for cell in row.iter("td", "th")])
+
+        return rows
+
+    def _parse_table(self, rows: List[List[str]]) -> List[HKNewStockInfo]:
         """解析表格数据
 
         Args:
-            table: BeautifulSoup表格对象
+            rows: tbody 中每行的单元格文本列表
 
         Returns:
             List[HKNewStockInfo]: 港股新股信息列表
@@ -230,31 +630,21 @@ class HKDataFetcher:
         7-9: 现价/升跌/升跌幅 (不需要)
         """
         stocks = []
-        rows = table.find_all('tr')
-
-        # 跳过表头（第一行，在thead中）
-        for row in rows:
-            # 检查是否在tbody中（跳过thead和tfoot）
-            parent_tbody = row.find_parent('tbody')
-            if not parent_tbody:
-                continue
-
-            # 获取所有列（可能是td或th）
-            cols = row.find_all(['td', 'th'])
 
+        for cols in rows:
             if len(cols) < 7:
                 print(f"DEBUG: 列数不足，跳过该行: {len(cols)}列", file=sys.stderr)
                 continue
 
             try:
                 # 提取数据
-                stock_code = cols[0].text.strip()
-                stock_name = cols[1].text.strip()
-                offer_price_range = cols[2].text.strip() if len(cols) > 2 else ""
-                offer_shares = cols[3].text.strip() if len(cols) > 3 else ""
-                raised_amount_raw = cols[4].text.strip() if len(cols) > 4 else ""
-                subscription_date_raw = cols[5].text.strip() if len(cols) > 5 else ""
-                listing_date_raw = cols[6].text.strip() if len(cols) > 6 else ""
+                stock_code = cols[0].strip()
+                stock_name = cols[1].strip()
+                offer_price_range = cols[2].strip() if len(cols) > 2 else ""
+                offer_shares_raw = cols[3].strip() if len(cols) > 3 else ""
+                raised_amount_raw = cols[4].strip() if len(cols) > 4 else ""
+                subscription_date_raw = cols[5].strip() if len(cols) > 5 else ""
+                listing_date_raw = cols[6].strip() if len(cols) > 6 else ""
 
                 # 验证基本字段
                 if not stock_code or not stock_name:
@@ -264,20 +654,20 @@ class HKDataFetcher:
                 if stock_code == "注" or "注" in stock_code:
                     continue
 
-                # 处理募资额（原始单位：百万港元，转换为实际金额）
+                # 数值字段在导入时解析一次，渲染时只做格式化
+                offer_price_low, offer_price_high = self._parse_price_range(offer_price_range)
+                offer_shares = self._parse_number(offer_shares_raw)
+
+                # 处理募资额（原始单位：百万港元，转换为港元）
                 raised_amount = None
-                if raised_amount_raw and raised_amount_raw != "0.00":
-                    try:
-                        # 将百万港元转换为港元（乘以1,000,000）
-                        amount_million = float(raised_amount_raw.strip())
-                        amount_hkd = amount_million * 1000000
-                        raised_amount = str(int(amount_hkd))
-                    except ValueError:
-                        raised_amount = raised_amount_raw
+                amount_million = self._parse_number(raised_amount_raw)
+                if amount_million:
+                    raised_amount = float(round(amount_million * 1000000))
 
                 # 解析申购日期（可能是区间，如"2025-12-31至2026-01-06"）
                 subscription_date = None
                 subscription_date_range = None  # 新增：保存原始日期范围
+                start_date, end_date = None, None
                 if subscription_date_raw and subscription_date_raw != "--":
                     # 保存原始日期范围字符串
                     subscription_date_range = subscription_date_raw.strip()
@@ -288,6 +678,9 @@ class HKDataFetcher:
                         date_for_parsing = subscription_date_raw.split("至")[0]
                     subscription_date = self._parse_date(date_for_parsing.strip())
 
+                    # 导入时解析一次申购起止日期，筛选时直接使用
+                    start_date, end_date = self._parse_date_range(subscription_date_range)
+
                 # 解析上市日期
                 listing_date = None
                 if listing_date_raw and listing_date_raw != "--":
@@ -298,12 +691,18 @@ class HKDataFetcher:
                     stock_code=stock_code,
                     stock_name=stock_name,
                     offer_price_range=offer_price_range if offer_price_range else None,
+                    offer_price_low=offer_price_low,
+                    offer_price_high=offer_price_high,
                     raised_amount=raised_amount,
-                    offer_shares=offer_shares if offer_shares else None,
+                    raised_amount_raw=self._unparsed(raised_amount_raw, amount_million),
+                    offer_shares=offer_shares,
+                    offer_shares_raw=self._unparsed(offer_shares_raw, offer_shares),
                     subscription_ratio=None,  # 当前表格中没有认购倍数
                     subscription_date=subscription_date,
                     subscription_date_range=subscription_date_range,  # 新增：保存日期范围
                     listing_date=listing_date,
+                    start_date=start_date,
+                    end_date=end_date,
                 )
 
                 stocks.append(stock)
@@ -314,6 +713,52 @@ class HKDataFetcher:
 
         return stocks
 
+    def _unparsed(self, raw: str, value: Optional[float]) -> Optional[str]:
+        """返回无法解析的非空原始字符串，保留用于显示；已解析或无数据时返回 None"""
+        return raw if value is None and raw and raw != "--" else None
+
+    def _parse_number(self, value: str) -> Optional[float]:
+        """解析数值字符串（去掉千分位逗号和货币符号）
+
+        Args:
+            value: 数值字符串（如 "1,000,000" 或 "HK$12.50"）
+
+        Returns:
+            Optional[float]: 解析后的数值，为空或无法解析时返回 None
+        """
+        text = value.replace(",", "").replace("HK$", "").strip() if value else ""
+        if not text or text == "--":
+            return None
+
+        try:
+            return float(text)
+        except ValueError:
+            print(f"DEBUG: 数值解析失败: {value}", file=sys.stderr)
+            return None
+
+    def _parse_price_range(self, price_range: str) -> tuple:
+        """解析招股价区间
+
+        Args:
+            price_range: 招股价字符串（如 "250.00-280.00" 或单一价格 "12.50"）
+
+        Returns:
+            tuple: (下限, 上限)，单一价格时上下限相同，无法解析时返回 (None, None)
+        """
+        if not price_range:
+            return None, None
+
+        parts = price_range.split("-")
+        if len(parts) > 2:
+            return None, None
+
+        low = self._parse_number(parts[0])
+        high = self._parse_number(parts[-1])
+        if low is None or high is None:
+            return None, None
+
+        return low, high
+
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """解析日期字符串
 
@@ -349,3 +794,32 @@ class HKDataFetcher:
             print(f"DEBUG: 日期解析失败: {date_str}, 错误: {e}", file=sys.stderr)
 
         return None
+
+    def _parse_date_range(self, date_range_str: str) -> tuple:
+        """解析日期范围字符串
+
+        Args:
+            date_range_str: 日期范围字符串，格式如 "2025-12-23至2025-12-24"
+
+        Returns:
+            tuple: (开始日期, 结束日期) 的 date 对象元组，解析失败返回 (None, None)
+        """
+        if not date_range_str or "至" not in date_range_str:
+            return None, None
+
+        try:
+            parts = date_range_str.split("至")
+            if len(parts) != 2:
+                return None, None
+
+            start_str = parts[0].strip()[:10]
+            end_str = parts[1].strip()[:10]
+
+            start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
+            end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
+
+            return start_date, end_date
+
+        except Exception as e:
+            print(f"DEBUG: 日期范围解析失败: {date_range_str}, 错误: {e}", file=sys.stderr)
+            return None, None
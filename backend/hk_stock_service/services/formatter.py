@@ -6,7 +6,7 @@
 
 import sys
 from datetime import datetime
-from typing import List
+from typing import Collection, List, Optional
 from models import HKNewStockInfo
 from .processor import HKDataProcessor
 
@@ -17,12 +17,17 @@ class HKMarkdownFormatter:
     def __init__(self):
         pass
 
-    def format_new_stocks(self, subscribable_stocks: List[HKNewStockInfo], future_stocks: List[HKNewStockInfo] = None) -> str:
+    def format_new_stocks(self, subscribable_stocks: List[HKNewStockInfo], future_stocks: List[HKNewStockInfo] = None,
+                          future_days: int = 14, unenriched: Optional[Collection[str]] = None,
+                          out_of_scope: Optional[Collection[str]] = None) -> str:
         """格式化港股新股信息为 Markdown，分类展示
 
         Args:
             subscribable_stocks: 当前可申购的港股新股列表
             future_stocks: 未来未开放申购的港股新股列表
+            future_days: 未来新股的查询天数
+            unenriched: 未补充详细信息的股票代码，其中在本次输出内的股票会在开头注明
+            out_of_scope: 不在补充范围内、没有详细信息的股票代码，其中在本次输出内的股票会在开头注明
 
         Returns:
             str: Markdown 格式的文本
@@ -31,7 +36,7 @@ class HKMarkdownFormatter:
 
         # 如果两类股票都为空，返回空数据格式
         if not subscribable_stocks and not future_stocks:
-            return self._format_empty()
+            return self._format_empty(future_days)
 
         # 构建 Markdown
         lines = []
@@ -42,6 +47,20 @@ class HKMarkdownFormatter:
         lines.append(f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append("")
 
+        if unenriched:
+            pending = [stock.stock_code for stock in subscribable_stocks + (future_stocks or [])
+                       if stock.stock_code in unenriched]
+            if pending:
+                lines.append(f"> 注：{len(pending)} 只新股的行业和公司简介尚未获取（{'、'.join(pending)}），正在后台补充，稍后刷新可查看完整信息")
+                lines.append("")
+
+        if out_of_scope:
+            missing = [stock.stock_code for stock in subscribable_stocks + (future_stocks or [])
+                       if stock.stock_code in out_of_scope]
+            if missing:
+                lines.append(f"> 注：{len(missing)} 只新股不在数据获取当天的申购窗口内（{'、'.join(missing)}），未获取详细信息")
+                lines.append("")
+
         # 第一部分：当前可申购的新股
         if subscribable_stocks:
             lines.append("---")
@@ -68,7 +87,7 @@ class HKMarkdownFormatter:
         if future_stocks:
             lines.append("---")
             lines.append("")
-            lines.append("## 二、未来14天即将开放申购的新股")
+            lines.append(f"## 二、未来{future_days}天即将开放申购的新股")
             lines.append("")
             lines.append(f"**数量**: {len(future_stocks)} 只")
             lines.append("")
@@ -122,10 +141,10 @@ class HKMarkdownFormatter:
 
         lines.append(f"| **招股价** | {stock.get_formatted_price()} |")
 
-        if stock.offer_shares:
+        if stock.offer_shares is not None or stock.offer_shares_raw:
             lines.append(f"| **发售股数** | {stock.get_formatted_shares()} |")
 
-        if stock.raised_amount:
+        if stock.raised_amount is not None or stock.raised_amount_raw:
             lines.append(f"| **集资额** | {stock.get_formatted_raised_amount()} |")
 
         if stock.subscription_ratio:
@@ -145,9 +164,12 @@ class HKMarkdownFormatter:
 
         return lines
 
-    def _format_empty(self) -> str:
+    def _format_empty(self, future_days: int = 14) -> str:
         """格式化空数据情况
 
+        Args:
+            future_days: 未来新股的查询天数
+
         Returns:
             str: 空数据的 Markdown
         """
@@ -160,6 +182,6 @@ class HKMarkdownFormatter:
         lines.append("")
         lines.append("## 暂无新股信息")
         lines.append("")
-        lines.append("当前暂无可申购的港股新股，未来14天也无即将开放申购的港股新股。")
+        lines.append(f"当前暂无可申购的港股新股，未来{future_days}天也无即将开放申购的港股新股。")
 
         return "\n".join(lines)
@@ -0,0 +1,97 @@
+"""
+HTTP 连接池服务
+
+进程内共享的 requests 会话，在多次刷新之间复用到新浪财经的连接
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PooledSession:
+    """进程内共享的 HTTP 连接池
+
+    所有 HKDataFetcher 共用同一个 requests.Session，按主机维护 keep-alive 连接池，
+    避免每个页面都重新建立 TCP 连接。统计信息直接读取底层 urllib3 连接池
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10):
+        """初始化连接池
+
+        Args:
+            pool_connections: 保留连接池的主机数量
+            pool_maxsize: 每个主机保留的最大空闲连接数
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """通过连接池发送 GET 请求
+
+        Args:
+            url: 请求地址
+            **kwargs: 透传给 requests.Session.get 的参数
+
+        Returns:
+            requests.Response: 响应对象
+        """
+        with self._lock:
+            self.requests += 1
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        """关闭会话及其全部连接"""
+        self.session.close()
+
+    def stats(self) -> dict:
+        """获取连接池使用情况
+
+        Returns:
+            dict: 每个主机连接池的容量、已建立连接数、空闲和使用中的连接数，以及连接复用次数
+        """
+        # 直连请求使用 poolmanager，经代理的请求使用对应代理的 ProxyManager
+        managers = [self._adapter.poolmanager, *list(self._adapter.proxy_manager.values())]
+        pools = []
+
+        for manager, key in ((manager, key) for manager in managers for key in manager.pools.keys()):
+            try:
+                pool = manager.pools[key]
+            except KeyError:
+                # 统计期间连接池被淘汰
+                continue
+
+            # 连接池关闭后 pool.pool 为 None；队列中的 None 是尚未建立连接的空位
+            queue = pool.pool
+            maxsize = queue.maxsize if queue is not None else 0
+            idle = sum(1 for conn in list(queue.queue) if conn is not None) if queue is not None else 0
+            in_use = maxsize - queue.qsize() if queue is not None else 0
+
+            pools.append({
+                "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                "maxsize": maxsize,
+                "connections_created": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle": idle,
+                "in_use": in_use
+            })
+
+        connections = sum(pool["connections_created"] for pool in pools)
+        pool_requests = sum(pool["requests"] for pool in pools)
+
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "requests": self.requests,
+            "connections_created": connections,
+            "connections_reused": max(pool_requests - connections, 0),
+            "pools": pools
+        }
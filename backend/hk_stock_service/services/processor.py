@@ -5,8 +5,8 @@
 """
 
 import sys
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
 from models import HKNewStockInfo
 
 
@@ -17,116 +17,83 @@ class HKDataProcessor:
         """初始化数据处理服务"""
         pass
 
-    def filter_subscribable_stocks(self, stocks: List[HKNewStockInfo]) -> List[HKNewStockInfo]:
-        """筛选当前可申购的港股新股
+    def classify(self, stocks: List[HKNewStockInfo], today: Optional[date] = None,
+                 future_days: int = 14) -> Tuple[List[HKNewStockInfo], List[HKNewStockInfo], List[HKNewStockInfo]]:
+        """一次遍历将港股新股分为当前可申购、未来可申购和其他三类
 
-        筛选条件：申购日期范围内包含今天的新股
+        使用导入时解析好的申购起止日期（start_date / end_date），不再重复解析日期范围字符串
+
+        - 当前可申购：今天在申购日期范围内
+        - 未来可申购：申购开始日期在今天之后，且在未来 future_days 天内
+        - 其他：不满足以上条件或缺少申购日期
 
         Args:
             stocks: 港股新股信息列表
+            today: 基准日期，默认为今天
+            future_days: 查询未来天数，默认14天
 
         Returns:
-            List[HKNewStockInfo]: 筛选后的港股新股列表
+            Tuple[List[HKNewStockInfo], List[HKNewStockInfo], List[HKNewStockInfo]]:
+                (当前可申购, 未来可申购, 其他)，每类均按申购日期排序
         """
-        print("INFO: 开始筛选当前可申购的港股新股...", file=sys.stderr)
+        today = today or datetime.now().date()
+        future_date = today + timedelta(days=future_days)
 
-        today = datetime.now().date()
-        filtered_stocks = []
+        subscribable_stocks = []
+        future_stocks = []
+        other_stocks = []
 
         for stock in stocks:
-            if not stock.subscription_date_range:
-                continue
-
-            # 解析日期范围字符串
-            start_date, end_date = self._parse_date_range(stock.subscription_date_range)
+            start_date, end_date = stock.start_date, stock.end_date
 
             if start_date is None or end_date is None:
-                continue
-
-            # 筛选条件：今天在申购日期范围内
-            if start_date <= today <= end_date:
-                filtered_stocks.append(stock)
-                print(f"DEBUG: 符合条件: {stock.stock_code} - {stock.stock_name} ({start_date} 至 {end_date})", file=sys.stderr)
+                other_stocks.append(stock)
+            elif start_date <= today <= end_date:
+                subscribable_stocks.append(stock)
+            elif today < start_date <= future_date:
+                future_stocks.append(stock)
+            else:
+                other_stocks.append(stock)
 
-        print(f"INFO: 筛选完成，找到 {len(filtered_stocks)} 只当前可申购的港股新股", file=sys.stderr)
+        print(f"INFO: 分类完成 - 当前可申购 {len(subscribable_stocks)} 只，"
+              f"未来 {future_days} 天内 {len(future_stocks)} 只，其他 {len(other_stocks)} 只", file=sys.stderr)
 
         # 按申购日期排序
-        filtered_stocks.sort(
-            key=lambda x: x.subscription_date or datetime.min
-        )
+        sort_key = lambda x: x.subscription_date or datetime.min
+        subscribable_stocks.sort(key=sort_key)
+        future_stocks.sort(key=sort_key)
+        other_stocks.sort(key=sort_key)
 
-        return filtered_stocks
+        return subscribable_stocks, future_stocks, other_stocks
 
-    def filter_future_unopened_stocks(self, stocks: List[HKNewStockInfo], future_days: int = 14) -> List[HKNewStockInfo]:
-        """筛选未来指定天数内还未开放申购的港股新股
+    def filter_subscribable_stocks(self, stocks: List[HKNewStockInfo]) -> List[HKNewStockInfo]:
+        """筛选当前可申购的港股新股
 
-        筛选条件：申购开始日期在今天之后，且在未来指定天数内
+        筛选条件：申购日期范围内包含今天的新股
 
         Args:
             stocks: 港股新股信息列表
-            future_days: 查询未来天数，默认14天
 
         Returns:
             List[HKNewStockInfo]: 筛选后的港股新股列表
         """
-        print(f"INFO: 开始筛选未来 {future_days} 天内未开放申购的港股新股...", file=sys.stderr)
-
-        today = datetime.now().date()
-        future_date = today + timedelta(days=future_days)
-        filtered_stocks = []
-
-        for stock in stocks:
-            if not stock.subscription_date_range:
-                continue
-
-            # 解析日期范围字符串
-            start_date, end_date = self._parse_date_range(stock.subscription_date_range)
-
-            if start_date is None or end_date is None:
-                continue
+        subscribable_stocks, _, _ = self.classify(stocks)
+        return subscribable_stocks
 
-            # 筛选条件：申购开始日期在今天之后，且在未来指定天数内
-            if today < start_date <= future_date:
-                filtered_stocks.append(stock)
-                print(f"DEBUG: 符合条件: {stock.stock_code} - {stock.stock_name} ({start_date} 至 {end_date})", file=sys.stderr)
-
-        print(f"INFO: 筛选完成，找到 {len(filtered_stocks)} 只未来 {future_days} 天内未开放申购的港股新股", file=sys.stderr)
-
-        # 按申购日期排序
-        filtered_stocks.sort(
-            key=lambda x: x.subscription_date or datetime.min
-        )
-
-        return filtered_stocks
+    def filter_future_unopened_stocks(self, stocks: List[HKNewStockInfo], future_days: int = 14) -> List[HKNewStockInfo]:
+        """筛选未来指定天数内还未开放申购的港股新股
 
-    def _parse_date_range(self, date_range_str: str):
-        """解析日期范围字符串
+        筛选条件：申购开始日期在今天之后，且在未来指定天数内
 
         Args:
-            date_range_str: 日期范围字符串，格式如 "2025-12-23至2025-12-24"
+            stocks: 港股新股信息列表
+            future_days: 查询未来天数，默认14天
 
         Returns:
-            tuple: (开始日期, 结束日期) 的 date 对象元组，解析失败返回 (None, None)
+            List[HKNewStockInfo]: 筛选后的港股新股列表
         """
-        if not date_range_str or "至" not in date_range_str:
-            return None, None
-
-        try:
-            parts = date_range_str.split("至")
-            if len(parts) != 2:
-                return None, None
-
-            start_str = parts[0].strip()[:10]
-            end_str = parts[1].strip()[:10]
-
-            start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
-
-            return start_date, end_date
-
-        except Exception as e:
-            print(f"DEBUG: 日期范围解析失败: {date_range_str}, 错误: {e}", file=sys.stderr)
-            return None, None
+        _, future_stocks, _ = self.classify(stocks, future_days=future_days)
+        return future_stocks
 
     def group_by_date(self, stocks: List[HKNewStockInfo]) -> dict:
         """按上市日期分组
@@ -0,0 +1,188 @@
+"""
+自适应限流服务
+
+按上游主机维护进程内共享的令牌桶，根据响应情况调整请求速率（AIMD）
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class AdaptiveTokenBucket:
+    """自适应令牌桶
+
+    每个请求发起前取一个令牌，令牌按 rate（次/秒）补充，最多积累 burst 个。
+    令牌不足时预约后续令牌并等待，因此同步线程和协程可以共用同一个桶。
+    速率按 AIMD 调整：请求成功且响应及时时加性增加，出错、被限流或响应过慢时乘性减少
+    """
+
+    def __init__(self, rate: float = 2.0, min_rate: float = 0.2, max_rate: float = 4.0, burst: int = 2,
+                 increase: float = 0.1, decrease: float = 0.5, slow_threshold: float = 2.0):
+        """初始化令牌桶
+
+        Args:
+            rate: 初始速率（次/秒）
+            min_rate: 退避后的最低速率（次/秒）
+            max_rate: 恢复后的最高速率（次/秒）
+            burst: 最多积累的令牌数
+            increase: 每次成功后增加的速率（次/秒）
+            decrease: 每次出错或响应过慢后速率乘以的系数
+            slow_threshold: 响应时间超过该值（秒）视为上游过载
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(burst, 1)
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_threshold = slow_threshold
+
+        self.requests = 0
+        self.backoffs = 0
+        self.waiting = 0
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """按当前速率补充令牌（调用方持有锁）"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """取一个令牌，返回需要等待的秒数
+
+        令牌不足时令牌数记为负数，表示已被预约，后来的请求依次顺延。
+        需要等待的时间超过 max_wait 时不取令牌，返回 None
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if max_wait is not None and delay > max_wait:
+                self._tokens += 1
+                return None
+            self.requests += 1
+            self.waited += delay
+            if delay > 0:
+                self.waiting += 1
+            return delay
+
+    def _release(self) -> None:
+        """等待结束，从排队数中移除"""
+        with self._lock:
+            self.waiting -= 1
+
+    def acquire_sync(self, max_wait: Optional[float] = None) -> bool:
+        """阻塞等待到可以发起请求（供同步获取器在线程中调用）
+
+        Args:
+            max_wait: 最长等待时间（秒），为 None 时不限
+
+        Returns:
+            bool: 是否取得令牌；需要等待的时间超过 max_wait 时立即返回 False
+        """
+        delay = self._reserve(max_wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release()
+        return True
+
+    async def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """等待到可以发起请求（供异步获取器调用），参数和返回值与 acquire_sync 相同"""
+        delay = self._reserve(max_wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._release()
+        return True
+
+    def record(self, ok: bool, elapsed: float) -> None:
+        """根据一次请求的结果调整速率
+
+        Args:
+            ok: 请求是否成功（网络错误、429 和 5xx 视为失败）
+            elapsed: 从发起请求到收到响应头的耗时（秒）
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if ok and elapsed <= self.slow_threshold:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+            else:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.backoffs += 1
+
+    def stats(self) -> dict:
+        """获取令牌桶状态
+
+        Returns:
+            dict: 当前速率、可用令牌数、排队请求数及累计统计
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "tokens": round(max(self._tokens, 0.0), 3),
+                "queue_depth": self.waiting,
+                "requests": self.requests,
+                "backoffs": self.backoffs,
+                "waited_seconds": round(self.waited, 3)
+            }
+
+
+class HostRateLimiter:
+    """按主机划分的限流器
+
+    每个上游主机一个 AdaptiveTokenBucket，首次请求该主机时创建。
+    进程内所有获取器共享同一个实例，并发刷新之间也会互相限流
+    """
+
+    def __init__(self, **bucket_options):
+        """初始化限流器
+
+        Args:
+            **bucket_options: 创建 AdaptiveTokenBucket 时使用的参数
+        """
+        self.bucket_options = bucket_options
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> AdaptiveTokenBucket:
+        """获取请求地址所属主机的令牌桶
+
+        Args:
+            url: 请求地址
+
+        Returns:
+            AdaptiveTokenBucket: 该主机的令牌桶
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = AdaptiveTokenBucket(**self.bucket_options)
+                self._buckets[host] = bucket
+            return bucket
+
+    def stats(self) -> dict:
+        """获取各主机令牌桶的状态
+
+        Returns:
+            dict: 主机到令牌桶状态的映射
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in buckets.items()}
@@ -0,0 +1,198 @@
+"""
+重试服务
+
+带上限的指数退避重试（全抖动），以及限制单次刷新总重试量的重试预算
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .deadline import Deadline, DeadlineExceeded
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """单次刷新的重试预算
+
+    同一次刷新中的所有调用共享预算：重试次数或累计退避时间用完后不再重试，
+    避免上游持续异常时每个调用各自重试、延迟层层叠加
+    """
+
+    def __init__(self, max_retries: int = 10, max_delay: float = 15.0):
+        """初始化重试预算
+
+        Args:
+            max_retries: 允许的总重试次数
+            max_delay: 允许的累计退避时间（秒）
+        """
+        self.max_retries = max_retries
+        self.max_delay = max_delay
+        self.retries = 0
+        self.delay = 0.0
+        self._lock = threading.Lock()
+
+    def try_spend(self, delay: float) -> bool:
+        """为一次重试扣除预算
+
+        Args:
+            delay: 本次重试前的退避时间（秒）
+
+        Returns:
+            bool: 预算充足时扣除并返回 True，否则返回 False
+        """
+        with self._lock:
+            if self.retries >= self.max_retries or self.delay + delay > self.max_delay:
+                return False
+            self.retries += 1
+            self.delay += delay
+            return True
+
+    def stats(self) -> dict:
+        """获取预算使用情况
+
+        Returns:
+            dict: 已用和允许的重试次数、退避时间
+        """
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "max_retries": self.max_retries,
+                "delay_seconds": round(self.delay, 3),
+                "max_delay_seconds": self.max_delay
+            }
+
+
+class RetryPolicy:
+    """重试策略
+
+    第 n 次重试前等待 [0, min(max_delay, base_delay × 2^n)] 内的随机时间（全抖动），
+    多个调用同时失败时不会在同一时刻集中重试
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """初始化重试策略
+
+        Args:
+            max_retries: 单个调用的最大重试次数（不含首次调用）
+            base_delay: 退避基准时间（秒）
+            max_delay: 单次退避的最长时间（秒）
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """计算第 attempt 次重试前的退避时间
+
+        Args:
+            attempt: 重试序号（从 0 开始）
+
+        Returns:
+            float: 退避时间（秒）
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func: Callable[[], T], budget: Optional[RetryBudget] = None,
+             retryable: Callable[[Exception], bool] = lambda e: True, description: str = "",
+             deadline: Optional[Deadline] = None) -> T:
+        """调用 func，失败时按策略重试
+
+        Args:
+            func: 无参调用
+            budget: 本次刷新共享的重试预算，为 None 时只受 max_retries 限制
+            retryable: 判断异常是否值得重试
+            description: 日志中的调用说明
+            deadline: 请求时限，剩余时间不足以完成退避时不再重试
+
+        Returns:
+            T: func 的返回值
+
+        Raises:
+            Exception: 重试次数或预算用完后，抛出最后一次调用的异常
+        """
+        with self._lock:
+            self.calls += 1
+
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, budget, retryable, description, deadline)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, func: Callable[[], Awaitable[T]], budget: Optional[RetryBudget] = None,
+                         retryable: Callable[[Exception], bool] = lambda e: True, description: str = "",
+                         deadline: Optional[Deadline] = None) -> T:
+        """异步调用 func，失败时按策略重试，参数与 call 相同
+
+        Returns:
+            T: func 返回的可等待对象的结果
+
+        Raises:
+            Exception: 重试次数或预算用完后，抛出最后一次调用的异常
+        """
+        with self._lock:
+            self.calls += 1
+
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, budget, retryable, description, deadline)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _next_delay(self, error: Exception, attempt: int, budget: Optional[RetryBudget],
+                    retryable: Callable[[Exception], bool], description: str,
+                    deadline: Optional[Deadline]) -> Optional[float]:
+        """判断是否重试，返回退避时间；不再重试时返回 None"""
+        delay = self.backoff(attempt)
+        remaining = deadline.remaining() if deadline is not None else None
+
+        if (attempt >= self.max_retries
+                or isinstance(error, DeadlineExceeded)
+                or (remaining is not None and delay >= remaining)
+                or not retryable(error)
+                or (budget is not None and not budget.try_spend(delay))):
+            with self._lock:
+                self.failures += 1
+            return None
+
+        with self._lock:
+            self.retries += 1
+        print(f"WARNING: {description}失败（{error}），{delay:.2f} 秒后第 {attempt + 1} 次重试", file=sys.stderr)
+        return delay
+
+    def stats(self) -> dict:
+        """获取重试统计信息
+
+        Returns:
+            dict: 策略参数、调用次数、重试次数和最终失败次数
+        """
+        with self._lock:
+            return {
+                "max_retries": self.max_retries,
+                "base_delay": self.base_delay,
+                "max_delay": self.max_delay,
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures
+            }
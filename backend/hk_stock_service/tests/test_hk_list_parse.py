@@ -0,0 +1,59 @@
+"""港股新股列表数值字段解析的测试"""
+
+import pytest
+import requests
+
+from services import HKDataFetcher, RetryPolicy
+
+
+def parse_row(offer_shares: str, raised_amount: str):
+    row = ["02333", "测试控股", "10.00-12.00", offer_shares, raised_amount, "2026-03-10至2026-03-13", "2026-03-18"]
+    return HKDataFetcher()._parse_table([row])[0]
+
+
+def test_numeric_fields_are_parsed_once():
+    stock = parse_row("1,000,000", "1,550.00")
+
+    assert stock.offer_shares == 1000000.0
+    assert stock.raised_amount == 1550000000.0
+    assert stock.offer_shares_raw is None and stock.raised_amount_raw is None
+    assert stock.get_formatted_shares() == "100万股"
+    assert stock.get_formatted_raised_amount() == "15.50亿港元"
+
+
+def test_unparseable_values_fall_back_to_the_raw_text():
+    stock = parse_row("待公布", "约1,500")
+
+    assert stock.offer_shares is None and stock.raised_amount is None
+    assert stock.get_formatted_shares() == "待公布"
+    assert stock.get_formatted_raised_amount() == "约1,500港元"
+
+
+def test_missing_values_render_as_pending():
+    stock = parse_row("--", "")
+
+    assert stock.offer_shares_raw is None and stock.raised_amount_raw is None
+    assert stock.get_formatted_shares() == "待定"
+    assert stock.get_formatted_raised_amount() == "待定"
+
+
+def test_zero_values_render_as_pending():
+    stock = parse_row("0", "0.00")
+
+    assert stock.get_formatted_shares() == "待定"
+    assert stock.get_formatted_raised_amount() == "待定"
+
+
+class FailingSession:
+    """模拟上游连接失败的假连接池"""
+
+    def get(self, url, **kwargs):
+        raise requests.exceptions.ConnectionError("连接被重置")
+
+
+def test_list_fetch_errors_propagate_to_the_refresh():
+    fetcher = HKDataFetcher(min_interval=0, retry_policy=RetryPolicy(max_retries=0))
+    fetcher._http = FailingSession()
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fetcher.fetch_hk_new_stocks()
@@ -0,0 +1,70 @@
+"""自适应限流与上游状态反馈的测试"""
+
+from types import SimpleNamespace
+
+import requests
+
+from services import HKDataFetcher, HostRateLimiter
+
+URL = "http://vip.stock.finance.sina.com.cn/q/view/hk_IPOProfile.php?symbol=00700"
+
+
+class StubSession:
+    """按顺序返回给定状态码的假连接池"""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(status_code=self.status_code)
+
+
+def make_fetcher(status_code: int) -> HKDataFetcher:
+    limiter = HostRateLimiter(rate=100, min_rate=1, max_rate=100, burst=10)
+    fetcher = HKDataFetcher(rate_limiter=limiter)
+    fetcher._http = StubSession(status_code)
+    return fetcher
+
+
+def test_blocked_responses_slow_the_bucket_down():
+    fetcher = make_fetcher(403)
+    bucket = fetcher.rate_limiter.for_url(URL)
+
+    for _ in range(3):
+        fetcher._get(URL)
+
+    assert bucket.backoffs == 3
+    assert bucket.rate < 100 * 0.5 ** 2
+
+
+def test_successful_responses_do_not_back_off():
+    fetcher = make_fetcher(200)
+    bucket = fetcher.rate_limiter.for_url(URL)
+
+    for _ in range(3):
+        fetcher._get(URL)
+
+    assert bucket.backoffs == 0
+    assert bucket.rate == 100
+
+
+def test_blocked_responses_are_not_retried():
+    fetcher = HKDataFetcher()
+
+    def http_error(status_code: int) -> requests.exceptions.HTTPError:
+        return requests.exceptions.HTTPError(response=SimpleNamespace(status_code=status_code))
+
+    assert not fetcher._is_retryable(http_error(403))
+    assert not fetcher._is_retryable(http_error(456))
+    assert fetcher._is_retryable(http_error(429))
+    assert fetcher._is_retryable(http_error(503))
+    assert not fetcher._is_healthy(403)
+    assert fetcher._is_healthy(200)
+
+
+def test_default_limiter_never_exceeds_min_interval():
+    bucket = HKDataFetcher(min_interval=5).rate_limiter.for_url(URL)
+
+    assert bucket.rate == bucket.max_rate == 0.2
@@ -0,0 +1,107 @@
+"""
+Benchmark - HK IPO detail page streaming
+
+Compares the full download + BeautifulSoup parse of an hk_IPOProfile.php
+page (HKDataFetcher._parse_detail_page) against the streaming path
+(HKDataFetcher._stream_detail_page), which decodes GBK incrementally and
+stops reading once 板块 and 公司简介 are found. Reports parse time and the
+number of bytes consumed, and checks both paths return the same fields on
+a set of page layouts.
+
+The pages are synthetic fixtures shaped like the Sina detail page: a
+navigation table, the profile table and a long tail of other content.
+
+Usage:
+    python scripts/bench_hk_detail_parse.py [tail_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "backend" / "hk_stock_service"))
+
+from services import HKDataFetcher  # noqa: E402
+
+
+def build_page(tail_rows: int, layout: str = "normal") -> bytes:
+    """Build a GBK-encoded hk_IPOProfile.php-like page"""
+    nav = "<table><tr>" + "".join(f"<td><a href='/n/{i}'>导航{i}</a></td>" for i in range(40)) + "</tr></table>"
+    fields = [f"<tr><td>字段{i}</td><td>内容{i}</td></tr>" for i in range(12)]
+
+    if layout == "normal":
+        fields[4] = "<tr><td>板块</td><td> 医疗保健<!-- x --> </td></tr>"
+        fields[9] = "<tr><td><b>公司简介</b></td><td>公司主要从事" + "创新药研发、" * 40 + "</td></tr>"
+    elif layout == "early":
+        # 字段出现在表格的前几行，需要等表格满 10 行才能确认
+        fields[0] = "<tr><td>板块</td><td>资讯科技</td></tr>"
+        fields[1] = "<tr><td>公司简介</td><td>软件服务</td></tr>"
+    elif layout == "small_table":
+        # 小表格中的同名字段应被忽略
+        nav = "<table><tr><td>板块</td><td>错误</td></tr></table>" + nav
+        fields[5] = "<tr><td>板块</td><td>地产</td></tr>"
+        fields[7] = "<tr><td>公司简介</td><td>物业开发</td></tr>"
+    elif layout == "industry_only":
+        fields[3] = "<tr><td>板块</td><td>金融</td></tr>"
+    elif layout == "missing":
+        pass
+
+    tail = "".join(f"<tr><td>尾注{i}</td><td>{'说明' * 20}</td></tr>" for i in range(tail_rows))
+    html = ("<html><head><meta charset='gb2312'><title>新股详情</title></head><body>"
+            + nav + "<table>" + "".join(fields) + tail + "</table>"
+            + "<div>" + "页脚" * 2000 + "</div></body></html>")
+    return html.encode("gbk")
+
+
+def chunked(data: bytes, counter: list, size: int = HKDataFetcher.DETAIL_CHUNK_SIZE):
+    """Yield data in response-sized chunks, counting the bytes handed out"""
+    for offset in range(0, len(data), size):
+        chunk = data[offset:offset + size]
+        counter[0] += len(chunk)
+        yield chunk
+
+
+def best_of(func, repeat: int) -> tuple:
+    """Run func several times and return (best seconds, last result)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    tail_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    fetcher = HKDataFetcher()
+
+    identical = True
+    for layout in ("normal", "early", "small_table", "industry_only", "missing"):
+        page = build_page(tail_rows, layout)
+        full = fetcher._parse_detail_page(page.decode("gbk"))
+        streamed = fetcher._stream_detail_page(chunked(page, [0]))
+        if full != streamed:
+            print(f"MISMATCH {layout}: {full!r} != {streamed!r}")
+            identical = False
+
+    page = build_page(tail_rows)
+    full_time, _ = best_of(lambda: fetcher._parse_detail_page(page.decode("gbk")), repeat=5)
+    consumed = [0]
+    stream_time, _ = best_of(lambda: fetcher._stream_detail_page(chunked(page, consumed)), repeat=5)
+
+    print("=" * 60)
+    print(f"  HK detail page benchmark ({len(page) / 1024:.0f} KiB page)")
+    print("=" * 60)
+    print(f"full parse : {full_time * 1000:8.2f} ms  {len(page) / 1024:8.1f} KiB read")
+    print(f"streaming  : {stream_time * 1000:8.2f} ms  {consumed[0] / 5 / 1024:8.1f} KiB read")
+    print(f"speedup    : {full_time / stream_time:8.1f} x")
+    print(f"identical  : {identical}")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
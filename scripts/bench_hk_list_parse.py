@@ -0,0 +1,137 @@
+"""
+Benchmark - HK IPO list page parsing
+
+Compares the targeted lxml pull parser (HKDataFetcher._extract_list_rows)
+against the previous BeautifulSoup implementation, which built a tree for
+the whole page, ran find_all('table') and called find_parent('tbody') for
+every row. Reports best-of parse time and tracemalloc peak memory, and
+checks that both paths yield identical rows and HKNewStockInfo records.
+tracemalloc only sees the Python heap: memory libxml2 allocates for the
+partial tree on the pull parser path is not included.
+
+The page is a synthetic fixture shaped like hk_IPOList.php: a navigation
+table, the IPO table (thead / tbody / tfoot) and a long page footer with
+more tables and scripts after it.
+
+Usage:
+    python scripts/bench_hk_list_parse.py [rows]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "backend" / "hk_stock_service"))
+
+from services import HKDataFetcher  # noqa: E402
+
+
+def build_page(rows: int, seed: int = 42) -> str:
+    """Build an hk_IPOList.php-like page with the IPO table as the second table"""
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 1)
+    parts = [
+        "<html><head><meta http-equiv='Content-Type' content='text/html; charset=gb2312'>",
+        "<title>新股上市_港股_新浪财经</title>",
+        "<script type='text/javascript'>var hq_str = '" + "x" * 4000 + "';</script>",
+        "</head><body>",
+        "<table class='nav'><tr>",
+    ]
+    parts.extend(f"<td><a href='/q/view/hk_{i}.php'>导航{i}</a></td>" for i in range(120))
+    parts.append("</tr></table>")
+
+    parts.append("<table class='list_table'><thead><tr>")
+    parts.extend(f"<th>{title}</th>" for title in
+                 ("代码", "名称", "招股价(HK$)", "招股数(股)", "募资额(百万)", "招股日期", "上市日期", "现价", "升跌", "升跌幅"))
+    parts.append("</tr></thead><tbody>")
+
+    for i in range(rows):
+        start = first_day + timedelta(days=rng.randint(0, 600))
+        end = start + timedelta(days=rng.randint(0, 5))
+        listing = end + timedelta(days=rng.randint(3, 10))
+        price = rng.choice(["", "--", f"{rng.uniform(1, 50):.2f}",
+                            f"{rng.uniform(1, 20):.2f}-{rng.uniform(20, 60):.2f}"])
+        shares = f"{rng.randint(1, 900) * 100000:,}"
+        amount = rng.choice(["0.00", f"{rng.uniform(10, 9000):.2f}"])
+        parts.append(
+            f"<tr><td><a href='/q/view/hk_IPOProfile.php?symbol={i:05d}'>{i:05d}</a></td>"
+            f"<td>港股新股{i}<!-- name --></td><td>{price}</td><td> {shares} </td><td>{amount}</td>"
+            f"<td>{start}至{end}</td><td>{listing}</td>"
+            f"<td>{rng.uniform(1, 60):.2f}</td><td>--</td><td><span class='up'>{rng.uniform(-50, 200):.2f}%</span></td></tr>"
+        )
+
+    parts.append("</tbody><tfoot><tr><td colspan='10'>注：募资额单位为百万港元</td></tr></tfoot></table>")
+
+    for block in range(40):
+        parts.append(f"<div class='footer'><table><tr><td>相关链接{block}</td><td>"
+                     + "".join(f"<a href='/link/{block}/{j}'>链接{j}</a>" for j in range(30))
+                     + "</td></tr></table></div>")
+        parts.append("<script>document.write('" + "y" * 2000 + "');</script>")
+
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def legacy_extract_rows(html: str) -> list:
+    """Previous implementation: full BeautifulSoup tree, every row walks up to find tbody"""
+    soup = BeautifulSoup(html, "lxml")
+    tables = soup.find_all("table")
+    if len(tables) < 2:
+        return None
+
+    rows = []
+    for row in tables[1].find_all("tr"):
+        if not row.find_parent("tbody"):
+            continue
+        rows.append([cell.text for cell in row.find_all(["td", "th"])])
+    return rows
+
+
+def measure(func, repeat: int) -> tuple:
+    """Return (best seconds, peak bytes, result) for func()"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    fetcher = HKDataFetcher()
+    html = build_page(rows)
+
+    legacy_time, legacy_peak, legacy_rows = measure(lambda: legacy_extract_rows(html), repeat=5)
+    pull_time, pull_peak, pull_rows = measure(lambda: fetcher._extract_list_rows(html), repeat=5)
+
+    legacy_stocks = fetcher._parse_table(legacy_rows)
+    pull_stocks = fetcher._parse_table(pull_rows)
+    identical = legacy_rows == pull_rows and legacy_stocks == pull_stocks
+
+    print("=" * 60)
+    print(f"  HK list page parsing benchmark ({rows} rows, {len(html) / 1024:.0f} KiB page)")
+    print("=" * 60)
+    print(f"beautifulsoup : {legacy_time * 1000:8.1f} ms  peak {legacy_peak / 1024 / 1024:6.2f} MiB")
+    print(f"lxml pull     : {pull_time * 1000:8.1f} ms  peak {pull_peak / 1024 / 1024:6.2f} MiB")
+    print(f"speedup       : {legacy_time / pull_time:8.1f} x  memory {pull_peak / legacy_peak:.1%} of previous")
+    print(f"identical     : {identical} ({len(pull_stocks)} records)")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark - A-Stock DataFrame ingestion
+
+Compares the column-wise DataFetcher._parse_dataframe against the previous
+row-by-row (iterrows) implementation on a large synthetic cninfo history,
+and checks that both produce identical NewStockInfo records. Also reports
+the cost when the subscription window is pushed down to the frame before
+records are materialized (as fetch_new_stocks does in the service).
+
+Usage:
+    python scripts/bench_parse_dataframe.py [rows]
+"""
+
+import random
+import sys
+import time
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "backend" / "a_stock_service"))
+
+from models import NewStockInfo  # noqa: E402
+from services import DataFetcher  # noqa: E402
+
+
+def build_history(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Build a frame shaped like ak.stock_new_ipo_cninfo() output"""
+    rng = random.Random(seed)
+    first_day = date(2010, 1, 1)
+    prefixes = ["600", "601", "688", "000", "001", "300", "301", "830", "430", "920"]
+    records = []
+
+    for i in range(rows):
+        start = first_day + timedelta(days=rng.randint(0, 6000))
+        records.append({
+            "证劵代码": f"{rng.choice(prefixes)}{i % 1000:03d}",
+            "证券简称": f"新股{i}",
+            "上市日期": start + timedelta(days=rng.randint(7, 20)) if rng.random() > 0.1 else None,
+            "申购日期": start if rng.random() > 0.05 else None,
+            "发行价": rng.choice([None, round(rng.uniform(3, 80), 2)]),
+            "总发行数量": rng.choice([None, float(rng.randint(1000, 50000))]),
+            "发行市盈率": round(rng.uniform(10, 60), 2),
+            "上网发行中签率": rng.choice([None, round(rng.uniform(0.0001, 0.1), 6), round(rng.uniform(1, 5), 4)]),
+            "摇号结果公告日": start + timedelta(days=2),
+            "中签公告日": start if rng.random() > 0.2 else None,
+            "中签缴款日": start + timedelta(days=rng.randint(0, 2)) if rng.random() > 0.2 else None,
+            "网上申购上限": rng.choice([None, round(rng.uniform(0.5, 3), 2)]),
+            "上网发行数量": float(rng.randint(500, 5000)),
+        })
+
+    df = pd.DataFrame(records)
+    for column in ("上市日期", "申购日期", "摇号结果公告日", "中签公告日", "中签缴款日"):
+        df[column] = pd.to_datetime(df[column], errors="coerce").dt.date
+    return df
+
+
+def legacy_window_bounds(issue_date_range):
+    """Previous per-request parsing of the "起始至结束" range string"""
+    try:
+        parts = issue_date_range.split("至")
+        if len(parts) != 2:
+            return None, None
+        start = datetime.strptime(parts[0].strip()[:10], "%Y-%m-%d").date()
+        end = datetime.strptime(parts[1].strip()[:10], "%Y-%m-%d").date()
+        return start, end
+    except Exception:
+        return None, None
+
+
+def legacy_parse_dataframe(fetcher: DataFetcher, df: pd.DataFrame) -> list:
+    """Previous row-by-row implementation, kept as the reference"""
+    new_stocks = []
+
+    for _, row in df.iterrows():
+        try:
+            issue_date_raw = row.get("申购日期")
+            online_start = row.iloc[9]
+            online_end = row.iloc[10]
+
+            issue_date_range = None
+            if pd.notna(online_start) and pd.notna(online_end):
+                issue_date_range = f"{str(online_start)[:10]}至{str(online_end)[:10]}"
+            elif pd.notna(online_end):
+                end_str = str(online_end)[:10]
+                issue_date_range = f"{end_str}至{end_str}"
+            elif pd.notna(issue_date_raw):
+                date_str = str(issue_date_raw)[:10] if len(str(issue_date_raw)) >= 10 else str(issue_date_raw)
+                issue_date_range = f"{date_str}至{date_str}"
+
+            start_date, end_date = legacy_window_bounds(issue_date_range)
+
+            new_stocks.append(NewStockInfo(
+                stock_code=str(row.get("证劵代码", "")),
+                stock_name=str(row.get("证券简称", "")),
+                issue_date=fetcher._parse_date(issue_date_raw),
+                issue_date_range=issue_date_range,
+                subscription_code=str(row.get("证劵代码", "")),
+                issue_price=fetcher._parse_float(row.get("发行价")),
+                issue_quantity=fetcher._parse_float(row.get("总发行数量")),
+                subscription_limit=fetcher._parse_float(row.get("网上申购上限")),
+                lottery_rate=fetcher._format_lottery_rate(row.get("上网发行中签率")),
+                listing_date=fetcher._parse_date(row.get("上市日期")),
+                market=fetcher._determine_market(str(row.get("证劵代码", ""))),
+                start_date=start_date,
+                end_date=end_date,
+            ))
+        except Exception:
+            continue
+
+    return new_stocks
+
+
+def best_of(func, repeat: int) -> tuple:
+    """Run func several times and return (best seconds, last result)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    fetcher = DataFetcher()
+    df = build_history(rows)
+
+    print("=" * 60)
+    print(f"  DataFrame ingestion benchmark ({rows} rows)")
+    print("=" * 60)
+
+    legacy_time, legacy = best_of(lambda: legacy_parse_dataframe(fetcher, df), repeat=1)
+    columnar_time, columnar = best_of(lambda: fetcher._parse_dataframe(df), repeat=3)
+    window_time, window = best_of(
+        lambda: fetcher._parse_dataframe(fetcher._filter_window(df, date(2020, 6, 15), 14)),
+        repeat=3
+    )
+
+    identical = (
+        len(legacy) == len(columnar)
+        and all(asdict(a) == asdict(b) and type(a.issue_date) is type(b.issue_date)
+                for a, b in zip(legacy, columnar))
+    )
+
+    print(f"iterrows  : {legacy_time * 1000:10.1f} ms  ({len(legacy)} records)")
+    print(f"columnar  : {columnar_time * 1000:10.1f} ms  ({len(columnar)} records)")
+    print(f"pushdown  : {window_time * 1000:10.1f} ms  ({len(window)} records in window)")
+    print(f"speedup   : {legacy_time / columnar_time:10.1f} x (columnar), "
+          f"{legacy_time / window_time:.1f} x (pushdown)")
+    print(f"identical : {identical}")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
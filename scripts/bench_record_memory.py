@@ -0,0 +1,100 @@
+"""
+Benchmark - A-Stock record memory footprint
+
+Measures bytes per record for the same synthetic snapshot held as:
+
+- plain @dataclass records (the previous NewStockInfo layout)
+- slotted, frozen NewStockInfo records
+- a ColumnarStocks container
+
+Every variant is built from a fresh copy of the source rows so strings are
+not shared between variants, and the ColumnarStocks round trip is checked
+against the records it was built from.
+
+Usage:
+    python scripts/bench_record_memory.py [rows]
+"""
+
+import gc
+import pickle
+import random
+import sys
+import tracemalloc
+from dataclasses import asdict, field, fields, make_dataclass
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "backend" / "a_stock_service"))
+
+from bench_parse_dataframe import build_history  # noqa: E402
+from models import ColumnarStocks, NewStockInfo  # noqa: E402
+from services import DataFetcher  # noqa: E402
+
+INDUSTRIES = ["计算机、通信和其他电子设备制造业", "专用设备制造业", "化学原料和化学制品制造业",
+              "医药制造业", "软件和信息技术服务业", "电气机械和器材制造业"]
+
+# Previous layout: same fields, plain mutable dataclass with a per-instance __dict__
+LegacyNewStockInfo = make_dataclass(
+    "LegacyNewStockInfo",
+    [(f.name, f.type, field(default=f.default)) for f in fields(NewStockInfo)]
+)
+
+
+def build_rows(rows: int, seed: int = 7) -> bytes:
+    """Build enriched record rows and serialize them so each variant gets fresh objects"""
+    rng = random.Random(seed)
+    records = []
+
+    for stock in DataFetcher()._parse_dataframe(build_history(rows)):
+        row = asdict(stock)
+        # Strings rebuilt per row, as they arrive from the profile cache (JSON)
+        row["industry"] = "".join(rng.choice(INDUSTRIES))
+        row["market"] = "".join(row["market"])
+        row["company_intro"] = f"公司主营业务为{row['stock_name']}相关产品的研发、生产和销售。" * rng.randint(2, 6)
+        records.append(row)
+
+    return pickle.dumps(records)
+
+
+def measure(build) -> tuple:
+    """Return (bytes retained, result) for objects created by build()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, result
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    blob = build_rows(rows)
+
+    legacy_bytes, legacy = measure(lambda: [LegacyNewStockInfo(**row) for row in pickle.loads(blob)])
+    slotted_bytes, slotted = measure(lambda: [NewStockInfo(**row) for row in pickle.loads(blob)])
+    columnar_bytes, columnar = measure(
+        lambda: ColumnarStocks([NewStockInfo(**row) for row in pickle.loads(blob)])
+    )
+
+    count = len(slotted)
+    identical = len(columnar) == count and columnar.to_records() == slotted
+
+    print("=" * 60)
+    print(f"  Record memory benchmark ({count} records)")
+    print("=" * 60)
+    print(f"dataclass : {legacy_bytes / count:10.1f} bytes/record  ({legacy_bytes / 1024 / 1024:.2f} MiB)")
+    print(f"slotted   : {slotted_bytes / count:10.1f} bytes/record  ({slotted_bytes / 1024 / 1024:.2f} MiB)")
+    print(f"columnar  : {columnar_bytes / count:10.1f} bytes/record  ({columnar_bytes / 1024 / 1024:.2f} MiB)")
+    print(f"saving    : {1 - slotted_bytes / legacy_bytes:10.1%} (slotted), "
+          f"{1 - columnar_bytes / legacy_bytes:.1%} (columnar)")
+    print(f"identical : {identical}")
+
+    del legacy
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()